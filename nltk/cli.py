@@ -5,11 +5,15 @@
 # For license information, see LICENSE.TXT
 
 
+from functools import partial
+from itertools import islice
+
 import click
 from tqdm import tqdm
 
-from nltk import word_tokenize
-from nltk.util import parallelize_preprocess
+from nltk import pos_tag_sents, sent_tokenize, word_tokenize
+from nltk.tag.util import tuple2str
+from nltk.util import parallel_imap
 
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
@@ -20,36 +24,154 @@ def cli():
     pass
 
 
+def stream_options(command):
+    """Add the options shared by all the commands that process stdin."""
+    command = click.option(
+        "--batch-size",
+        "-b",
+        default=1000,
+        help="No. of lines sent to a process at once.",
+    )(command)
+    command = click.option(
+        "--encoding", "-e", default="utf8", help="Specify encoding of file."
+    )(command)
+    command = click.option("--processes", "-j", default=1, help="No. of processes.")(
+        command
+    )
+    return command
+
+
+def process_stream(func, processes, encoding, batch_size):
+    """
+    Apply ``func`` to batches of ``batch_size`` lines read from stdin,
+    spread over ``processes`` worker processes, and write the lines it
+    returns to stdout in the order of the input. Only a bounded number of
+    batches are in memory at any time, so the input can be arbitrarily large.
+    """
+    fin = click.get_text_stream("stdin", encoding=encoding)
+    fout = click.get_text_stream("stdout", encoding=encoding)
+    lines = (line.rstrip("\n") for line in tqdm(fin))
+    batches = iter(lambda: list(islice(lines, batch_size)), [])
+    for outlines in parallel_imap(func, batches, processes, chunksize=1):
+        for outline in outlines:
+            print(outline, end="\n", file=fout)
+    fout.flush()
+
+
+def _tokenize_lines(lines, language, preserve_line, delimiter):
+    return [
+        delimiter.join(word_tokenize(line, language, preserve_line)) for line in lines
+    ]
+
+
+def _sent_tokenize_lines(lines, language, delimiter):
+    return [delimiter.join(sent_tokenize(line, language)) for line in lines]
+
+
+def _split_lines(lines, delimiter):
+    return [line.split(delimiter) if line else [] for line in lines]
+
+
+def _pos_tag_lines(lines, tagset, lang, delimiter, sep):
+    tagged_sents = pos_tag_sents(_split_lines(lines, delimiter), tagset, lang)
+    return [
+        delimiter.join(tuple2str(tagged, sep) for tagged in sent)
+        for sent in tagged_sents
+    ]
+
+
+def _lemmatize_lines(lines, pos, delimiter):
+    from nltk.stem import WordNetLemmatizer
+
+    lemmatizer = WordNetLemmatizer()
+    return [
+        delimiter.join(lemmatizer.lemmatize(token, pos) for token in tokens)
+        for tokens in _split_lines(lines, delimiter)
+    ]
+
+
 @cli.command("tokenize")
 @click.option(
     "--language",
     "-l",
-    default="en",
+    default="english",
     help="The language for the Punkt sentence tokenization.",
 )
 @click.option(
     "--preserve-line",
-    "-l",
-    default=True,
+    "-p",
+    default=False,
     is_flag=True,
     help="An option to keep the preserve the sentence and not sentence tokenize it.",
 )
-@click.option("--processes", "-j", default=1, help="No. of processes.")
-@click.option("--encoding", "-e", default="utf8", help="Specify encoding of file.")
+@stream_options
 @click.option(
     "--delimiter", "-d", default=" ", help="Specify delimiter to join the tokens."
 )
-def tokenize_file(language, preserve_line, processes, encoding, delimiter):
+def tokenize_file(language, preserve_line, processes, encoding, batch_size, delimiter):
     """This command tokenizes text stream using nltk.word_tokenize"""
-    with click.get_text_stream("stdin", encoding=encoding) as fin:
-        with click.get_text_stream("stdout", encoding=encoding) as fout:
-            # If it's single process, joblib parallelization is slower,
-            # so just process line by line normally.
-            if processes == 1:
-                for line in tqdm(fin.readlines()):
-                    print(delimiter.join(word_tokenize(line)), end="\n", file=fout)
-            else:
-                for outline in parallelize_preprocess(
-                    word_tokenize, fin.readlines(), processes, progress_bar=True
-                ):
-                    print(delimiter.join(outline), end="\n", file=fout)
+    func = partial(
+        _tokenize_lines,
+        language=language,
+        preserve_line=preserve_line,
+        delimiter=delimiter,
+    )
+    process_stream(func, processes, encoding, batch_size)
+
+
+@cli.command("sent_tokenize")
+@click.option(
+    "--language",
+    "-l",
+    default="english",
+    help="The language for the Punkt sentence tokenization.",
+)
+@stream_options
+@click.option(
+    "--delimiter",
+    "-d",
+    default="\n",
+    help="Specify delimiter to join the sentences of a line.",
+)
+def sent_tokenize_file(language, processes, encoding, batch_size, delimiter):
+    """This command splits each line of a text stream into sentences using nltk.sent_tokenize"""
+    func = partial(_sent_tokenize_lines, language=language, delimiter=delimiter)
+    process_stream(func, processes, encoding, batch_size)
+
+
+@cli.command("pos_tag")
+@click.option(
+    "--tagset",
+    "-t",
+    default=None,
+    help="The tagset to map the tags to, e.g. universal.",
+)
+@click.option("--lang", default="eng", help="The language of the tagger: eng or rus.")
+@stream_options
+@click.option(
+    "--delimiter", "-d", default=" ", help="Specify delimiter between the tokens."
+)
+@click.option("--sep", "-s", default="/", help="Specify separator of token and tag.")
+def pos_tag_file(tagset, lang, processes, encoding, batch_size, delimiter, sep):
+    """This command tags tokenized lines of a text stream using nltk.pos_tag"""
+    func = partial(
+        _pos_tag_lines, tagset=tagset, lang=lang, delimiter=delimiter, sep=sep
+    )
+    process_stream(func, processes, encoding, batch_size)
+
+
+@cli.command("lemmatize")
+@click.option(
+    "--pos",
+    "-p",
+    default="n",
+    help="The WordNet part of speech of the tokens: n, v, a, r or s.",
+)
+@stream_options
+@click.option(
+    "--delimiter", "-d", default=" ", help="Specify delimiter between the tokens."
+)
+def lemmatize_file(pos, processes, encoding, batch_size, delimiter):
+    """This command lemmatizes tokenized lines of a text stream using the WordNetLemmatizer"""
+    func = partial(_lemmatize_lines, pos=pos, delimiter=delimiter)
+    process_stream(func, processes, encoding, batch_size)
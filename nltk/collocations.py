@@ -22,6 +22,13 @@ The ``BigramCollocationFinder`` and ``TrigramCollocationFinder`` classes provide
 these functionalities, dependent on being provided a function which scores a
 ngram given appropriate frequency counts. A number of standard association
 measures are provided in bigram_measures and trigram_measures.
+
+For corpora too large for exact counts to fit in memory, ``approximate``
+finders count the ngrams of the documents they are fed one at a time in a
+bounded amount of memory: the candidate ngrams are the heavy hitters kept by
+a ``SpaceSavingCounter``, and the other frequencies are estimated by
+``CountMinSketch``es. Finders built separately, e.g. in different processes,
+can be merged.
 """
 
 # Possible TODOs:
@@ -39,10 +46,21 @@ from nltk.metrics import (
     QuadgramAssocMeasures,
     TrigramAssocMeasures,
 )
+from nltk.metrics import association as _association
 from nltk.metrics.spearman import ranks_from_scores, spearman_correlation
-from nltk.probability import FreqDist
+from nltk.probability import CountMinSketch, FreqDist, SpaceSavingCounter
 from nltk.util import ngrams
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _counts(fd, keys):
+    """Return the counts of ``keys`` in ``fd`` as an array of floats."""
+    return np.fromiter((fd[key] for key in keys), dtype=float, count=len(keys))
+
 
 class AbstractCollocationFinder:
     """
@@ -55,6 +73,10 @@ class AbstractCollocationFinder:
     identical interface.
     """
 
+    # The names of the frequency distributions of the finder, in the
+    # order of the arguments of its constructor
+    _fd_names = ("word_fd", "ngram_fd")
+
     def __init__(self, word_fd, ngram_fd):
         self.word_fd = word_fd
         self.N = word_fd.N()
@@ -87,6 +109,60 @@ class AbstractCollocationFinder:
             cls._build_new_documents(documents, cls.default_ws, pad_right=True)
         )
 
+    @classmethod
+    def approximate(cls, window_size=None, capacity=100000, epsilon=1e-5, delta=0.01):
+        """Constructs an empty collocation finder whose frequencies are
+        counted in a bounded amount of memory, to be fed documents with
+        ``update``.
+
+        The candidate ngrams are the at most ``capacity`` most frequent ones,
+        kept by a ``SpaceSavingCounter``: any ngram occurring more than
+        ``N / capacity`` times is a candidate, and its frequency is never
+        overestimated, by at most ``N / capacity``. The other frequencies are
+        estimated by ``CountMinSketch``es, which never underestimate them,
+        and overestimate them by at most ``epsilon * N`` with probability
+        ``1 - delta``.
+
+        >>> from nltk.collocations import BigramCollocationFinder
+        >>> from nltk.metrics import BigramAssocMeasures
+        >>> finder = BigramCollocationFinder.approximate(capacity=1000)
+        >>> for sent in ["the new york times".split(), "in new york".split()]:
+        ...     finder.update(sent)
+        >>> finder.nbest(BigramAssocMeasures.raw_freq, 1)
+        [('new', 'york')]
+        """
+        if window_size is None:
+            window_size = cls.default_ws
+        elif window_size < cls.default_ws:
+            raise ValueError(f"Specify window_size at least {cls.default_ws}")
+        fds = [
+            SpaceSavingCounter(capacity)
+            if name == "ngram_fd"
+            else CountMinSketch(epsilon, delta)
+            for name in cls._fd_names
+        ]
+        finder = cls(*fds)
+        finder.window_size = window_size
+        return finder
+
+    def update(self, words):
+        """Adds the counts of the ngrams in ``words`` to those of this
+        finder. Each sequence of words is counted as a separate document,
+        so that no ngram spans two calls to ``update``.
+        """
+        window_size = getattr(self, "window_size", self.default_ws)
+        self.merge(self.from_words(words, window_size))
+
+    def merge(self, other):
+        """Adds the counts of another finder of the same type, e.g. one
+        built from another part of a corpus in another process. The counts of
+        approximate finders can only be merged with those of approximate
+        finders built with the same parameters.
+        """
+        for name in self._fd_names:
+            getattr(self, name).update(getattr(other, name))
+        self.N = self.word_fd.N()
+
     @staticmethod
     def _ngram_freqdist(words, n):
         return FreqDist(tuple(words[i : i + n]) for i in range(len(words) - 1))
@@ -95,10 +171,10 @@ class AbstractCollocationFinder:
         """Generic filter removes ngrams from the frequency distribution
         if the function returns True when passed an ngram tuple.
         """
-        tmp_ngram = FreqDist()
+        tmp_ngram = self.ngram_fd.copy()
         for ngram, freq in self.ngram_fd.items():
-            if not fn(ngram, freq):
-                tmp_ngram[ngram] = freq
+            if fn(ngram, freq):
+                del tmp_ngram[ngram]
         self.ngram_fd = tmp_ngram
 
     def apply_freq_filter(self, min_freq):
@@ -120,7 +196,37 @@ class AbstractCollocationFinder:
     def _score_ngrams(self, score_fn):
         """Generates of (ngram, score) pairs as determined by the scoring
         function provided.
+
+        The association measures of ``nltk.metrics.association`` are
+        evaluated on the marginals of all the ngrams at once, with ``numpy``
+        arrays, if it is installed.
+        """
+        module = getattr(score_fn, "__module__", None)
+        if np is not None and module == _association.__name__:
+            scored = self._score_ngrams_vectorized(score_fn)
+            if scored is not None:
+                return scored
+        return self._score_ngrams_iter(score_fn)
+
+    def _score_ngrams_vectorized(self, score_fn):
+        """Returns a list of (ngram, score) pairs, scoring all the ngrams in
+        a single call of the scoring function on arrays of their marginals,
+        or None if it cannot be applied to arrays or does not give a finite
+        score to every ngram. The per-ngram path then scores them again, and
+        raises the errors the scoring function raises, if any.
         """
+        ngrams = [ngram for ngram, freq in self.ngram_fd.items() if freq]
+        try:
+            with np.errstate(all="ignore"):
+                scores = score_fn(*self._marginal_arrays(ngrams))
+        except (TypeError, ValueError, NotImplementedError):
+            return None
+        scores = np.asarray(scores, dtype=float)
+        if scores.shape != (len(ngrams),) or not np.isfinite(scores).all():
+            return None
+        return list(zip(ngrams, scores.tolist()))
+
+    def _score_ngrams_iter(self, score_fn):
         for tup in self.ngram_fd:
             score = self.score_ngram(score_fn, *tup)
             if score is not None:
@@ -197,6 +303,14 @@ class BigramCollocationFinder(AbstractCollocationFinder):
         n_xi = self.word_fd[w2]
         return score_fn(n_ii, (n_ix, n_xi), n_all)
 
+    def _marginal_arrays(self, bigrams):
+        """Returns the arguments of ``score_ngram`` for all the given bigrams
+        at once, as arrays."""
+        n_ii = _counts(self.ngram_fd, bigrams) / (self.window_size - 1.0)
+        n_ix = _counts(self.word_fd, [w1 for w1, _ in bigrams])
+        n_xi = _counts(self.word_fd, [w2 for _, w2 in bigrams])
+        return n_ii, (n_ix, n_xi), self.N
+
 
 class TrigramCollocationFinder(AbstractCollocationFinder):
     """A tool for the finding and ranking of trigram collocations or other
@@ -205,6 +319,7 @@ class TrigramCollocationFinder(AbstractCollocationFinder):
     """
 
     default_ws = 3
+    _fd_names = ("word_fd", "bigram_fd", "wildcard_fd", "ngram_fd")
 
     def __init__(self, word_fd, bigram_fd, wildcard_fd, trigram_fd):
         """Construct a TrigramCollocationFinder, given FreqDists for
@@ -240,13 +355,23 @@ class TrigramCollocationFinder(AbstractCollocationFinder):
                     continue
                 wildfd[(w1, w3)] += 1
                 tfd[(w1, w2, w3)] += 1
-        return cls(wfd, bfd, wildfd, tfd)
+        finder = cls(wfd, bfd, wildfd, tfd)
+        finder.window_size = window_size
+        return finder
 
     def bigram_finder(self):
         """Constructs a bigram collocation finder with the bigram and unigram
         data from this finder. Note that this does not include any filtering
         applied to this finder.
+
+        :raise TypeError: if this finder is ``approximate``, as it only
+            estimates the frequencies of the bigrams without keeping them.
         """
+        if isinstance(self.bigram_fd, CountMinSketch):
+            raise TypeError(
+                "Cannot construct a bigram finder from an approximate finder, "
+                "which does not keep its bigrams"
+            )
         return BigramCollocationFinder(self.word_fd, self.bigram_fd)
 
     def score_ngram(self, score_fn, w1, w2, w3):
@@ -265,6 +390,18 @@ class TrigramCollocationFinder(AbstractCollocationFinder):
         n_xxi = self.word_fd[w3]
         return score_fn(n_iii, (n_iix, n_ixi, n_xii), (n_ixx, n_xix, n_xxi), n_all)
 
+    def _marginal_arrays(self, trigrams):
+        """Returns the arguments of ``score_ngram`` for all the given
+        trigrams at once, as arrays."""
+        n_iii = _counts(self.ngram_fd, trigrams)
+        n_iix = _counts(self.bigram_fd, [(w1, w2) for w1, w2, _ in trigrams])
+        n_ixi = _counts(self.wildcard_fd, [(w1, w3) for w1, _, w3 in trigrams])
+        n_xii = _counts(self.bigram_fd, [(w2, w3) for _, w2, w3 in trigrams])
+        n_ixx = _counts(self.word_fd, [w1 for w1, _, _ in trigrams])
+        n_xix = _counts(self.word_fd, [w2 for _, w2, _ in trigrams])
+        n_xxi = _counts(self.word_fd, [w3 for _, _, w3 in trigrams])
+        return n_iii, (n_iix, n_ixi, n_xii), (n_ixx, n_xix, n_xxi), self.N
+
 
 class QuadgramCollocationFinder(AbstractCollocationFinder):
     """A tool for the finding and ranking of quadgram collocations or other association measures.
@@ -272,6 +409,7 @@ class QuadgramCollocationFinder(AbstractCollocationFinder):
     """
 
     default_ws = 4
+    _fd_names = ("word_fd", "ngram_fd", "ii", "iii", "ixi", "ixxi", "iixi", "ixii")
 
     def __init__(self, word_fd, quadgram_fd, ii, iii, ixi, ixxi, iixi, ixii):
         """Construct a QuadgramCollocationFinder, given FreqDists for appearances of words,
@@ -319,7 +457,9 @@ class QuadgramCollocationFinder(AbstractCollocationFinder):
                 ixii[(w1, w3, w4)] += 1
                 iixi[(w1, w2, w4)] += 1
 
-        return cls(ixxx, iiii, ii, iii, ixi, ixxi, iixi, ixii)
+        finder = cls(ixxx, iiii, ii, iii, ixi, ixxi, iixi, ixii)
+        finder.window_size = window_size
+        return finder
 
     def score_ngram(self, score_fn, w1, w2, w3, w4):
         n_all = self.N
@@ -350,6 +490,36 @@ class QuadgramCollocationFinder(AbstractCollocationFinder):
             n_all,
         )
 
+    def _marginal_arrays(self, quadgrams):
+        """Returns the arguments of ``score_ngram`` for all the given
+        quadgrams at once, as arrays."""
+
+        def counts(fd, *positions):
+            if len(positions) == 1:
+                return _counts(fd, [ngram[positions[0]] for ngram in quadgrams])
+            keys = [tuple(ngram[i] for i in positions) for ngram in quadgrams]
+            return _counts(fd, keys)
+
+        return (
+            _counts(self.ngram_fd, quadgrams),
+            (
+                counts(self.iii, 0, 1, 2),
+                counts(self.iixi, 0, 1, 3),
+                counts(self.ixii, 0, 2, 3),
+                counts(self.iii, 1, 2, 3),
+            ),
+            (
+                counts(self.ii, 0, 1),
+                counts(self.ixi, 0, 2),
+                counts(self.ixxi, 0, 3),
+                counts(self.ixi, 1, 3),
+                counts(self.ii, 2, 3),
+                counts(self.ii, 1, 2),
+            ),
+            tuple(counts(self.word_fd, i) for i in range(4)),
+            self.N,
+        )
+
 
 def demo(scorer=None, compare_scorer=None):
     """Finds bigram collocations in the files of the WebText corpus."""
@@ -13,10 +13,13 @@ API for corpus readers.
 import os
 import re
 from collections import defaultdict
-from itertools import chain
+from functools import partial
+from itertools import chain, islice
 
 from nltk.corpus.reader.util import *
+from nltk.corpus.reader.util import _settings
 from nltk.data import FileSystemPathPointer, PathPointer, ZipFilePathPointer
+from nltk.util import parallel_imap
 
 
 class CorpusReader:
@@ -36,8 +39,17 @@ class CorpusReader:
     corpus.  For most corpora, these methods define one or more
     selection arguments, such as ``fileids`` or ``categories``, which can
     be used to select which portion of the corpus should be returned.
+
+    Readers which support it, such as ``ConllCorpusReader`` and
+    ``BracketParseCorpusReader``, cache the items they parse from each
+    file in the directory ``CACHE_DIR``, if it is set, and read them
+    from there when the file is next used; see ``cached_corpus_view()``.
     """
 
+    CACHE_DIR = None
+    """The default directory in which the items parsed from the corpus
+       files are cached, if any."""
+
     def __init__(self, root, fileids, encoding="utf8", tagset=None):
         """
         :type root: PathPointer or str
@@ -242,6 +254,95 @@ class CorpusReader:
         else:
             return self._encoding
 
+    def imap(
+        self, fn, method="words", fileids=None, processes=1, block_size=None, **kwargs
+    ):
+        """
+        Lazily apply ``fn`` to every item of ``method(fileids, **kwargs)``,
+        e.g. to every tagged sentence of the corpus, in ``processes``
+        worker processes, and yield the results in the order of the items.
+
+        The work is split by file, and the files whose complete block
+        index is known, e.g. because it was saved to the ``INDEX_DIR`` of
+        their corpus views, are further split into ranges of about
+        ``block_size`` items, which workers read from the block offset at
+        which they start.  Only a bounded number of ranges are processed
+        or buffered at a time.  With ``processes > 1``, ``fn`` and this
+        corpus reader must be picklable.
+
+            >>> from nltk.corpus.reader import PlaintextCorpusReader
+            >>> import os, tempfile
+            >>> root = tempfile.mkdtemp()
+            >>> for name, text in [("a.txt", "one two"), ("b.txt", "three")]:
+            ...     with open(os.path.join(root, name), "w") as fout:
+            ...         _ = fout.write(text)
+            >>> reader = PlaintextCorpusReader(root, r".*\\.txt")
+            >>> list(reader.imap(len, "words", processes=2))
+            [3, 3, 5]
+
+        :param fn: The function to apply to each item
+        :param method: The name of the method of this reader which
+            returns the items, called for one file at a time
+        :type method: str
+        :param fileids: The files to read, all of them by default
+        :type fileids: None or str or list
+        :param processes: The number of worker processes
+        :type processes: int
+        :param block_size: The number of items in a range of a file, if
+            the files are to be split
+        :type block_size: int or None
+        :param kwargs: Other arguments of ``method``
+        :rtype: iter
+        """
+        if fileids is None:
+            fileids = self.fileids()
+        elif isinstance(fileids, str):
+            fileids = [fileids]
+        units = (
+            unit
+            for fileid in fileids
+            for unit in self._imap_units(method, fileid, block_size, kwargs)
+        )
+        func = partial(_imap_unit, self, fn, method, kwargs)
+        for results in parallel_imap(func, units, processes, chunksize=1):
+            yield from results
+
+    def _imap_units(self, method, fileid, block_size, kwargs):
+        """
+        Split the items of ``method`` for a file into ranges of about
+        ``block_size`` items, each given as (fileid, start_toknum,
+        start_filepos, end_toknum), if the complete block index of its
+        corpus view is known; or return a single unit (fileid, None,
+        None, None) for the whole file.
+        """
+        if block_size:
+            view = getattr(self, method)(fileids=fileid, **kwargs)
+            if isinstance(view, StreamBackedCorpusView):
+                if not view._index_loaded:
+                    view._load_index()
+                if view._len is not None:
+                    units = []
+                    for toknum, filepos in zip(view._toknum, view._filepos):
+                        if toknum >= view._len:
+                            break
+                        if not units or toknum - units[-1][1] >= block_size:
+                            units.append([fileid, toknum, filepos, None])
+                    for unit, next_unit in zip(units, units[1:] + [None]):
+                        unit[3] = view._len if next_unit is None else next_unit[1]
+                    return [tuple(unit) for unit in units]
+        return [(fileid, None, None, None)]
+
+    def _cached_view(self, fileid, block_reader, encoding, *key):
+        """
+        Return a corpus view of the items read from ``fileid`` by
+        ``block_reader``, which are cached in ``CACHE_DIR`` if it is set.
+        ``key`` should identify the items, in addition to the settings
+        of this reader: e.g. the name of the method returning the view,
+        and its arguments.
+        """
+        key = (type(self).__module__, type(self).__qualname__, _settings(self)) + key
+        return cached_corpus_view(fileid, block_reader, encoding, self.CACHE_DIR, key)
+
     def _get_root(self):
         return self._root
 
@@ -254,6 +355,24 @@ class CorpusReader:
     )
 
 
+def _imap_unit(reader, fn, method, kwargs, unit):
+    """Apply ``fn`` to the items of a unit of work of ``CorpusReader.imap``."""
+    fileid, start, filepos, stop = unit
+    view = getattr(reader, method)(fileids=fileid, **kwargs)
+    if start is None:
+        items = iter(view)
+    else:
+        # Start reading at the block the range starts with
+        view._toknum, view._filepos, view._len = [start], [filepos], None
+        view._index_loaded = view._index_saved = True
+        items = islice(view.iterate_from(start), stop - start)
+    try:
+        return [fn(item) for item in items]
+    finally:
+        if isinstance(view, (StreamBackedCorpusView, BinaryCorpusView)):
+            view.close()
+
+
 ######################################################################
 # { Corpora containing categorized items
 ######################################################################
@@ -449,7 +568,7 @@ class SyntaxCorpusReader(CorpusReader):
         reader = self._read_parsed_sent_block
         return concat(
             [
-                StreamBackedCorpusView(fileid, reader, encoding=enc)
+                self._cached_view(fileid, reader, enc, "parsed_sents")
                 for fileid, enc in self.abspaths(fileids, True)
             ]
         )
@@ -460,7 +579,7 @@ class SyntaxCorpusReader(CorpusReader):
 
         return concat(
             [
-                StreamBackedCorpusView(fileid, reader, encoding=enc)
+                self._cached_view(fileid, reader, enc, "tagged_sents", tagset)
                 for fileid, enc in self.abspaths(fileids, True)
             ]
         )
@@ -469,7 +588,7 @@ class SyntaxCorpusReader(CorpusReader):
         reader = self._read_sent_block
         return concat(
             [
-                StreamBackedCorpusView(fileid, reader, encoding=enc)
+                self._cached_view(fileid, reader, enc, "sents")
                 for fileid, enc in self.abspaths(fileids, True)
             ]
         )
@@ -480,7 +599,7 @@ class SyntaxCorpusReader(CorpusReader):
 
         return concat(
             [
-                StreamBackedCorpusView(fileid, reader, encoding=enc)
+                self._cached_view(fileid, reader, enc, "tagged_words", tagset)
                 for fileid, enc in self.abspaths(fileids, True)
             ]
         )
@@ -488,7 +607,7 @@ class SyntaxCorpusReader(CorpusReader):
     def words(self, fileids=None):
         return concat(
             [
-                StreamBackedCorpusView(fileid, self._read_word_block, encoding=enc)
+                self._cached_view(fileid, self._read_word_block, enc, "words")
                 for fileid, enc in self.abspaths(fileids, True)
             ]
         )
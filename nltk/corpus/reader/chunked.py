@@ -19,6 +19,7 @@ from nltk.chunk import tagstr2tree
 from nltk.corpus.reader.api import *
 from nltk.corpus.reader.bracket_parse import BracketParseCorpusReader
 from nltk.corpus.reader.util import *
+from nltk.corpus.reader.util import _bulk_readable
 from nltk.tokenize import *
 from nltk.tree import Tree
 
@@ -198,6 +199,7 @@ class ChunkedCorpusReader(CorpusReader):
             ]
         )
 
+    @_bulk_readable()
     def _read_block(self, stream):
         return [tagstr2tree(t) for t in read_blankline_block(stream)]
 
@@ -228,6 +230,7 @@ class ChunkedCorpusView(StreamBackedCorpusView):
         self._source_tagset = source_tagset
         self._target_tagset = target_tagset
 
+    @_bulk_readable("_para_block_reader")
     def read_block(self, stream):
         block = []
         for para_str in self._para_block_reader(stream):
@@ -14,6 +14,7 @@ import textwrap
 
 from nltk.corpus.reader.api import *
 from nltk.corpus.reader.util import *
+from nltk.corpus.reader.util import _bulk_readable
 from nltk.tag import map_tag
 from nltk.tree import Tree
 from nltk.util import LazyConcatenation, LazyMap
@@ -206,11 +207,12 @@ class ConllCorpusReader(CorpusReader):
         # different things (eg srl and parse trees).
         return concat(
             [
-                StreamBackedCorpusView(fileid, self._read_grid_block, encoding=enc)
+                self._cached_view(fileid, self._read_grid_block, enc, "grids")
                 for (fileid, enc) in self.abspaths(fileids, True)
             ]
         )
 
+    @_bulk_readable()
     def _read_grid_block(self, stream):
         grids = []
         for block in read_blankline_block(stream):
@@ -14,6 +14,7 @@ A reader for corpora that consist of plaintext documents.
 import nltk.data
 from nltk.corpus.reader.api import *
 from nltk.corpus.reader.util import *
+from nltk.corpus.reader.util import _bulk_readable
 from nltk.tokenize import *
 
 
@@ -111,12 +112,14 @@ class PlaintextCorpusReader(CorpusReader):
             ]
         )
 
+    @_bulk_readable()
     def _read_word_block(self, stream):
         words = []
         for i in range(20):  # Read 20 lines at a time.
             words.extend(self._word_tokenizer.tokenize(stream.readline()))
         return words
 
+    @_bulk_readable("_para_block_reader")
     def _read_sent_block(self, stream):
         sents = []
         for para in self._para_block_reader(stream):
@@ -128,6 +131,7 @@ class PlaintextCorpusReader(CorpusReader):
             )
         return sents
 
+    @_bulk_readable("_para_block_reader")
     def _read_para_block(self, stream):
         paras = []
         for para in self._para_block_reader(stream):
@@ -189,18 +193,21 @@ class EuroparlCorpusReader(PlaintextCorpusReader):
       and paragraphs for Europarl.
     """
 
+    @_bulk_readable()
     def _read_word_block(self, stream):
         words = []
         for i in range(20):  # Read 20 lines at a time.
             words.extend(stream.readline().split())
         return words
 
+    @_bulk_readable("_para_block_reader")
     def _read_sent_block(self, stream):
         sents = []
         for para in self._para_block_reader(stream):
             sents.extend([sent.split() for sent in para.splitlines()])
         return sents
 
+    @_bulk_readable("_para_block_reader")
     def _read_para_block(self, stream):
         paras = []
         for para in self._para_block_reader(stream):
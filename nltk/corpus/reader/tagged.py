@@ -16,6 +16,7 @@ import os
 from nltk.corpus.reader.api import *
 from nltk.corpus.reader.timit import read_timit_block
 from nltk.corpus.reader.util import *
+from nltk.corpus.reader.util import _bulk_readable
 from nltk.tag import map_tag, str2tuple
 from nltk.tokenize import *
 
@@ -284,6 +285,7 @@ class TaggedCorpusView(StreamBackedCorpusView):
         self._tag_mapping_function = tag_mapping_function
         StreamBackedCorpusView.__init__(self, corpus_file, encoding=encoding)
 
+    @_bulk_readable("_para_block_reader")
     def read_block(self, stream):
         """Reads one paragraph at a time."""
         block = []
@@ -7,10 +7,17 @@
 # For license information, see LICENSE.TXT
 
 import bisect
+import codecs
+import hashlib
+import json
+import mmap
 import os
 import pickle
 import re
+import sys
 import tempfile
+from array import array
+from collections import OrderedDict
 from functools import reduce
 from xml.etree import ElementTree
 
@@ -22,6 +29,16 @@ from nltk.data import (
 )
 from nltk.internals import slice_bounds
 from nltk.tokenize import wordpunct_tokenize
+from nltk.tree import (
+    ImmutableMultiParentedTree,
+    ImmutableParentedTree,
+    ImmutableProbabilisticTree,
+    ImmutableTree,
+    MultiParentedTree,
+    ParentedTree,
+    ProbabilisticTree,
+    Tree,
+)
 from nltk.util import AbstractLazySequence, LazyConcatenation, LazySubsequence
 
 ######################################################################
@@ -76,8 +93,21 @@ class StreamBackedCorpusView(AbstractLazySequence):
     map has one entry per block.)
 
     In order to increase efficiency for random access patterns that
-    have high degrees of locality, the corpus view may cache one or
-    more blocks.
+    have high degrees of locality, the corpus view keeps the
+    ``cache_size`` most recently used blocks in a least recently used
+    cache.  Its default size, ``CACHE_SIZE``, can be changed for all the
+    views of a class, including those created by corpus readers.
+
+    The toknum/filepos mapping is complete once the view has been read
+    to the end.  If ``index_dir`` (or the class attribute ``INDEX_DIR``) is
+    set, it is then saved to a file in that directory, which is keyed by
+    the path, modification time and size of the corpus file, and by the
+    settings of the view.  Later views of the same file, e.g. in other
+    processes, load it on first access, and so can seek straight to any
+    token, and know their length without reading the file.  The settings
+    are given by ``_index_key()``, which should be extended by views whose
+    tokens depend on anything more than the plain (string, number, ...)
+    attributes of the view and of the reader its block reader belongs to.
 
     :note: Each ``CorpusView`` object internally maintains an open file
         object for its underlying corpus file.  This file should be
@@ -120,9 +150,36 @@ class StreamBackedCorpusView(AbstractLazySequence):
        start_toknum is the token index of the first token in the block;
        end_toknum is the token index of the first token not in the
        block; and tokens is a list of the tokens in the block.
+    :ivar _block_cache: A least recently used cache of blocks, mapping
+       the file position of each block to a tuple (start_toknum,
+       end_toknum, tokens, end_filepos), where end_filepos is the file
+       position that follows the block.
     """
 
-    def __init__(self, fileid, block_reader=None, startpos=0, encoding="utf8"):
+    CACHE_SIZE = 1
+    """The default number of blocks cached by each view."""
+
+    INDEX_DIR = None
+    """The default directory in which the toknum/filepos mappings of the
+       views are saved, if any."""
+
+    BULK_READ = True
+    """Whether views of local UTF-8 files read with ``read_whitespace_block``,
+       ``read_line_block`` or ``read_blankline_block``, or with a block
+       reader method marked by ``_bulk_readable``, read them in bulk:
+       their blocks are split from large buffers of text, which are
+       decoded at once, rather than read line by line.  Other block
+       readers always read the file through the usual streams."""
+
+    def __init__(
+        self,
+        fileid,
+        block_reader=None,
+        startpos=0,
+        encoding="utf8",
+        cache_size=None,
+        index_dir=None,
+    ):
         """
         Create a new corpus view, based on the file ``fileid``, and
         read with ``block_reader``.  See the class documentation
@@ -140,6 +197,12 @@ class StreamBackedCorpusView(AbstractLazySequence):
             read the file's contents.  If no encoding is specified,
             then the file's contents will be read as a non-unicode
             string (i.e., a str).
+
+        :param cache_size: The number of blocks to cache, which defaults
+            to ``CACHE_SIZE``.
+
+        :param index_dir: The directory in which to save the
+            toknum/filepos mapping, which defaults to ``INDEX_DIR``.
         """
         if block_reader:
             self.read_block = block_reader
@@ -176,9 +239,18 @@ class StreamBackedCorpusView(AbstractLazySequence):
         except Exception as exc:
             raise ValueError(f"Unable to open or access {fileid!r} -- {exc}") from exc
 
-        # Maintain a cache of the most recently read block, to
+        # Maintain a cache of the most recently read blocks, to
         # increase efficiency of random access.
         self._cache = (-1, -1, None)
+        self._cache_size = self.CACHE_SIZE if cache_size is None else cache_size
+        self._block_cache = OrderedDict()
+
+        # The toknum/filepos mapping is loaded from index_dir on first
+        # access, and saved there once complete.
+        self._index_dir = self.INDEX_DIR if index_dir is None else index_dir
+        self._index_file = None
+        self._index_loaded = False
+        self._index_saved = False
 
     fileid = property(
         lambda self: self._fileid,
@@ -205,7 +277,10 @@ class StreamBackedCorpusView(AbstractLazySequence):
         will be called performed if any value is read from the view
         while its file stream is closed.
         """
-        if isinstance(self._fileid, PathPointer):
+        if self._reads_in_bulk():
+            path = getattr(self._fileid, "path", self._fileid)
+            self._stream = _BulkLineReader(open(path, "rb"))
+        elif isinstance(self._fileid, PathPointer):
             self._stream = self._fileid.open(self._encoding)
         elif self._encoding:
             self._stream = SeekableUnicodeStreamReader(
@@ -214,6 +289,21 @@ class StreamBackedCorpusView(AbstractLazySequence):
         else:
             self._stream = open(self._fileid, "rb")
 
+    def _reads_in_bulk(self):
+        """
+        Return whether this view reads its blocks in bulk from a
+        ``_BulkLineReader``.
+        """
+        if not self.BULK_READ or not (
+            isinstance(self._fileid, str) or type(self._fileid) is FileSystemPathPointer
+        ):
+            return False
+        # As in SeekableUnicodeStreamReader, which only skips the byte
+        # order marks of the encodings named like these
+        if re.sub("[ -]", "", (self._encoding or "").lower()) != "utf8":
+            return False
+        return _is_bulk_readable(self.read_block)
+
     def close(self):
         """
         Close the file stream associated with this corpus view.  This
@@ -233,7 +323,136 @@ class StreamBackedCorpusView(AbstractLazySequence):
     def __exit__(self, type, value, traceback):
         self.close()
 
+    def _index_key(self):
+        """
+        Return the settings of this view which determine its tokens,
+        as a sorted list of (name, value) pairs: the attributes of the
+        view, and of the object its block reader is a method of, whose
+        values are strings, numbers, booleans or None.
+        """
+        owners = [self]
+        reader = getattr(self.read_block, "__self__", None)
+        if reader is not None and reader is not self:
+            owners.append(reader)
+        key = []
+        for owner in owners:
+            for name, value in _settings(owner):
+                if name not in _VIEW_STATE and not name.startswith("_index"):
+                    key.append((type(owner).__name__, name, value))
+        return key
+
+    def _index_path(self):
+        """
+        Return the path of the file in which the toknum/filepos mapping
+        of this view is saved, or None if it is not saved.
+        """
+        if self._index_dir is None:
+            return None
+        if self._index_file is None:
+            file_key = _file_key(self._fileid)
+            if file_key is None:
+                return None
+            key = file_key + (
+                self._filepos[0],
+                self._encoding,
+                type(self).__module__,
+                type(self).__qualname__,
+                getattr(self.read_block, "__qualname__", None),
+                # Blocks read in bulk may start at other file positions,
+                # e.g. after a byte order mark
+                self._reads_in_bulk(),
+                self._index_key(),
+            )
+            digest = hashlib.sha1(repr(key).encode("utf8")).hexdigest()
+            self._index_file = os.path.join(self._index_dir, digest + ".idx")
+        return self._index_file
+
+    def _load_index(self):
+        """
+        Load the toknum/filepos mapping of this view, if it was saved
+        and this view has not read any block yet.
+        """
+        self._index_loaded = True
+        if len(self._toknum) > 1 or self._len is not None:
+            return
+        path = self._index_path()
+        if path is None or not os.path.exists(path):
+            return
+        try:
+            with open(path, "rb") as fin:
+                if fin.read(len(_INDEX_MAGIC)) != _INDEX_MAGIC:
+                    return
+                count = int.from_bytes(fin.read(8), "little")
+                length = int.from_bytes(fin.read(8), "little")
+                toknum, filepos = array("q"), array("q")
+                toknum.fromfile(fin, count)
+                filepos.fromfile(fin, count)
+                if fin.read(1):
+                    return
+        except (OSError, EOFError, ValueError):
+            return
+        if sys.byteorder == "big":
+            toknum.byteswap()
+            filepos.byteswap()
+        if not count or toknum[0] != 0 or filepos[0] != self._filepos[0]:
+            return
+        self._toknum, self._filepos, self._len = list(toknum), list(filepos), length
+        self._index_saved = True
+
+    def _save_index(self):
+        """
+        Save the complete toknum/filepos mapping of this view, if it is
+        to be saved.  Failures to write it are ignored.
+        """
+        self._index_saved = True
+        path = self._index_path()
+        if path is None:
+            return
+        toknum, filepos = array("q", self._toknum), array("q", self._filepos)
+        if sys.byteorder == "big":
+            toknum.byteswap()
+            filepos.byteswap()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self._index_dir, exist_ok=True)
+            with open(tmp_path, "wb") as fout:
+                fout.write(_INDEX_MAGIC)
+                fout.write(len(toknum).to_bytes(8, "little"))
+                fout.write(self._len.to_bytes(8, "little"))
+                toknum.tofile(fout)
+                filepos.tofile(fout)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _cached_block(self, i):
+        """
+        Return the cached block which contains the token with index
+        ``i``, as a tuple (start_toknum, end_toknum, tokens), or None.
+        """
+        if self._cache[0] <= i < self._cache[1]:
+            return self._cache
+        if self._block_cache and i < self._toknum[-1]:
+            filepos = self._filepos[bisect.bisect_right(self._toknum, i) - 1]
+            block = self._block_cache.get(filepos)
+            if block is not None and block[0] <= i < block[1]:
+                self._block_cache.move_to_end(filepos)
+                self._cache = block[:3]
+                return self._cache
+        return None
+
+    def _cache_block(self, filepos, toknum, tokens, new_filepos):
+        """Add a block that was just read to the caches."""
+        self._cache = (toknum, toknum + len(tokens), tokens)
+        if self._cache_size > 0:
+            self._block_cache[filepos] = self._cache + (new_filepos,)
+            self._block_cache.move_to_end(filepos)
+            while len(self._block_cache) > self._cache_size:
+                self._block_cache.popitem(last=False)
+
     def __len__(self):
+        if not self._index_loaded:
+            self._load_index()
         if self._len is None:
             # iterate_from() sets self._len when it reaches the end
             # of the file:
@@ -242,12 +461,14 @@ class StreamBackedCorpusView(AbstractLazySequence):
         return self._len
 
     def __getitem__(self, i):
+        if not self._index_loaded:
+            self._load_index()
         if isinstance(i, slice):
             start, stop = slice_bounds(self, i)
             # Check if it's in the cache.
-            offset = self._cache[0]
-            if offset <= start and stop <= self._cache[1]:
-                return self._cache[2][start - offset : stop - offset]
+            block = self._cached_block(start)
+            if block is not None and stop <= block[1]:
+                return block[2][start - block[0] : stop - block[0]]
             # Construct & return the result.
             return LazySubsequence(self, start, stop)
         else:
@@ -257,9 +478,9 @@ class StreamBackedCorpusView(AbstractLazySequence):
             if i < 0:
                 raise IndexError("index out of range")
             # Check if it's in the cache.
-            offset = self._cache[0]
-            if offset <= i < self._cache[1]:
-                return self._cache[2][i - offset]
+            block = self._cached_block(i)
+            if block is not None:
+                return block[2][i - block[0]]
             # Use iterate_from to extract it.
             try:
                 return next(self.iterate_from(i))
@@ -269,9 +490,13 @@ class StreamBackedCorpusView(AbstractLazySequence):
     # If we wanted to be thread-safe, then this method would need to
     # do some locking.
     def iterate_from(self, start_tok):
+        if not self._index_loaded:
+            self._load_index()
+
         # Start by feeding from the cache, if possible.
-        if self._cache[0] <= start_tok < self._cache[1]:
-            for tok in self._cache[2][start_tok - self._cache[0] :]:
+        block = self._cached_block(start_tok)
+        if block is not None:
+            for tok in block[2][start_tok - block[0] :]:
                 yield tok
                 start_tok += 1
 
@@ -287,10 +512,6 @@ class StreamBackedCorpusView(AbstractLazySequence):
             toknum = self._toknum[-1]
             filepos = self._filepos[-1]
 
-        # Open the stream, if it's not open already.
-        if self._stream is None:
-            self._open()
-
         # If the file is empty, the while loop will never run.
         # This *seems* to be all the state we need to set:
         if self._eofpos == 0:
@@ -299,26 +520,37 @@ class StreamBackedCorpusView(AbstractLazySequence):
         # Each iteration through this loop, we read a single block
         # from the stream.
         while filepos < self._eofpos:
-            # Read the next block.
-            self._stream.seek(filepos)
-            self._current_toknum = toknum
-            self._current_blocknum = block_index
-            tokens = self.read_block(self._stream)
-            assert isinstance(tokens, (tuple, list, AbstractLazySequence)), (
-                "block reader %s() should return list or tuple."
-                % self.read_block.__name__
-            )
-            num_toks = len(tokens)
-            new_filepos = self._stream.tell()
-            assert (
-                new_filepos > filepos
-            ), "block reader %s() should consume at least 1 byte (filepos=%d)" % (
-                self.read_block.__name__,
-                filepos,
-            )
-
-            # Update our cache.
-            self._cache = (toknum, toknum + num_toks, list(tokens))
+            block = self._block_cache.get(filepos)
+            if block is not None and block[0] == toknum:
+                # Take the next block from the cache.
+                self._block_cache.move_to_end(filepos)
+                self._cache = block[:3]
+                tokens, new_filepos = block[2], block[3]
+                num_toks = len(tokens)
+            else:
+                # Open the stream, if it's not open already.
+                if self._stream is None:
+                    self._open()
+                # Read the next block.
+                self._stream.seek(filepos)
+                self._current_toknum = toknum
+                self._current_blocknum = block_index
+                tokens = self.read_block(self._stream)
+                assert isinstance(tokens, (tuple, list, AbstractLazySequence)), (
+                    "block reader %s() should return list or tuple."
+                    % self.read_block.__name__
+                )
+                num_toks = len(tokens)
+                new_filepos = self._stream.tell()
+                assert (
+                    new_filepos > filepos
+                ), "block reader %s() should consume at least 1 byte (filepos=%d)" % (
+                    self.read_block.__name__,
+                    filepos,
+                )
+
+                # Update our cache.
+                self._cache_block(filepos, toknum, list(tokens), new_filepos)
 
             # Update our mapping.
             assert toknum <= self._toknum[-1]
@@ -337,9 +569,12 @@ class StreamBackedCorpusView(AbstractLazySequence):
                         toknum + num_toks == self._toknum[block_index]
                     ), "inconsistent block reader (num tokens returned)"
 
-            # If we reached the end of the file, then update self._len
+            # If we reached the end of the file, then update self._len,
+            # and save the now complete toknum/filepos mapping
             if new_filepos == self._eofpos:
                 self._len = toknum + num_toks
+                if not self._index_saved:
+                    self._save_index()
             # Generate the tokens in this block (but skip any tokens
             # before start_tok).  Note that between yields, our state
             # may be modified.
@@ -374,6 +609,76 @@ class StreamBackedCorpusView(AbstractLazySequence):
         return concat([self] * count)
 
 
+# The magic bytes of the files in which the toknum/filepos mappings of
+# StreamBackedCorpusViews are saved, followed by the number of blocks and
+# the number of tokens, and the toknum and filepos arrays, little-endian.
+_INDEX_MAGIC = b"NLTKIX\x00\x01"
+
+# The attributes of StreamBackedCorpusView which hold its state rather
+# than its settings
+_VIEW_STATE = {
+    "_toknum",
+    "_filepos",
+    "_len",
+    "_eofpos",
+    "_stream",
+    "_cache",
+    "_cache_size",
+    "_block_cache",
+    "_current_toknum",
+    "_current_blocknum",
+}
+
+# The attributes of CorpusReader and CategorizedCorpusReader which do
+# not change how each file is read
+_READER_STATE = {"_fileids", "_f2c", "_c2f"}
+
+
+def _file_key(fileid):
+    """
+    Return the absolute path, zip entry, modification time and size of
+    the file ``fileid``, or None if it is not a local file or zip entry.
+    """
+    if isinstance(fileid, ZipFilePathPointer):
+        path, entry = fileid.zipfile.filename, fileid.entry
+    elif isinstance(fileid, (str, FileSystemPathPointer)):
+        path, entry = str(fileid), ""
+    else:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (os.path.abspath(path), entry, stat.st_mtime_ns, stat.st_size)
+
+
+def _settings(obj):
+    """
+    Return the sorted (name, value) pairs of the attributes of ``obj``
+    whose values are strings, numbers, booleans or None, or lists,
+    tuples or dicts of them.
+    """
+
+    def plain(value):
+        return value is None or isinstance(value, (str, int, float))
+
+    settings = []
+    for name, value in sorted(vars(obj).items()):
+        if name in _READER_STATE:
+            continue
+        if isinstance(value, dict):
+            value = sorted(value.items(), key=repr)
+            if not all(plain(k) and plain(v) for k, v in value):
+                continue
+        elif isinstance(value, (list, tuple)):
+            if not all(map(plain, value)):
+                continue
+        elif not plain(value):
+            continue
+        settings.append((name, value))
+    return settings
+
+
 class ConcatenatedCorpusView(AbstractLazySequence):
     """
     A 'view' of a corpus file that joins together one or more
@@ -451,7 +756,9 @@ def concat(docs):
 
     # If they're all corpus views, then use ConcatenatedCorpusView.
     for typ in types:
-        if not issubclass(typ, (StreamBackedCorpusView, ConcatenatedCorpusView)):
+        if not issubclass(
+            typ, (StreamBackedCorpusView, ConcatenatedCorpusView, BinaryCorpusView)
+        ):
             break
     else:
         return ConcatenatedCorpusView(docs)
@@ -503,6 +810,9 @@ class PickleCorpusView(StreamBackedCorpusView):
         >>> feature_corpus = LazyMap(detect_features, corpus) # doctest: +SKIP
         >>> PickleCorpusView.write(feature_corpus, some_fileid)  # doctest: +SKIP
         >>> pcv = PickleCorpusView(some_fileid) # doctest: +SKIP
+
+    Sequences of strings, and of lists, tuples and trees of them, are
+    stored more compactly, and read faster, by ``BinaryCorpusView``.
     """
 
     BLOCK_SIZE = 100
@@ -570,12 +880,408 @@ class PickleCorpusView(StreamBackedCorpusView):
             raise ValueError("Error while creating temp file: %s" % e) from e
 
 
+######################################################################
+# { Binary Corpus View
+######################################################################
+
+BINARY_VIEW_MAGIC = b"NLTKBV\x00\x01"
+
+# The codes which start the encoding of lists, tuples and trees in a
+# binary corpus file, followed by their length and their items.  The
+# trees of the n-th tree class of a file have the code _TREE - n, and
+# strings are encoded as their ids, which are non-negative.
+_LIST, _TUPLE, _TREE = -1, -2, -3
+
+
+def _align(offset, alignment):
+    return (offset + alignment - 1) // alignment * alignment
+
+
+# The tree classes which binary corpus files may hold, by module and
+# qualified name.  Other classes are not imported from the names read
+# from a file, since importing a module may run any code.
+_TREE_CLASSES = {
+    (cls.__module__, cls.__qualname__): cls
+    for cls in [
+        Tree,
+        ImmutableTree,
+        ParentedTree,
+        MultiParentedTree,
+        ImmutableParentedTree,
+        ImmutableMultiParentedTree,
+        ProbabilisticTree,
+        ImmutableProbabilisticTree,
+    ]
+}
+
+
+def _tree_class(module, qualname):
+    """Return the tree class with the given module and qualified name."""
+    try:
+        return _TREE_CLASSES[module, qualname]
+    except KeyError:
+        raise ValueError(f"{module}.{qualname} is not a tree class of nltk.tree")
+
+
+class _BinaryViewWriter:
+    """
+    Encode a sequence of items into the arrays of a binary corpus file:
+    each distinct string is given an id, and the items are encoded as
+    the ids of their strings, and the codes and lengths of their lists,
+    tuples and trees.
+    """
+
+    def __init__(self):
+        self.strings = {}
+        self.tree_classes = {}
+        self.codes = array("i")
+        self.item_offsets = array("q", [0])
+
+    def add(self, items):
+        """
+        Encode ``items``.
+
+        :raise TypeError: If an item is not a string, or a list, tuple
+            or ``nltk.tree`` tree of such items.
+        """
+        for item in items:
+            self._encode(item)
+            self.item_offsets.append(len(self.codes))
+
+    def _encode(self, item):
+        if isinstance(item, str):
+            code = self.strings.get(item)
+            if code is None:
+                code = self.strings[item] = len(self.strings)
+            self.codes.append(code)
+        elif (type(item).__module__, type(item).__qualname__) in _TREE_CLASSES:
+            n = self.tree_classes.setdefault(type(item), len(self.tree_classes))
+            self.codes.extend((_TREE - n, len(item)))
+            self._encode(item.label())
+            for child in item:
+                self._encode(child)
+        elif type(item) in (list, tuple):
+            self.codes.extend((_LIST if type(item) is list else _TUPLE, len(item)))
+            for child in item:
+                self._encode(child)
+        else:
+            raise TypeError(
+                f"Cannot write {type(item).__name__} items to a binary corpus file"
+            )
+
+    def write(self, fout):
+        """
+        Write the encoded items to ``fout``, as: the magic bytes, the
+        length of a JSON header followed by the header itself, and the
+        sections it lists, aligned to 8 bytes.
+        """
+        encoded = [string.encode("utf8") for string in self.strings]
+        string_offsets = array("q", [0])
+        for string in encoded:
+            string_offsets.append(string_offsets[-1] + len(string))
+        sections = [
+            ("string_offsets", string_offsets),
+            ("string_data", array("B", b"".join(encoded))),
+            ("item_offsets", self.item_offsets),
+            ("codes", self.codes),
+        ]
+        layout, offset = {}, 0
+        for name, values in sections:
+            layout[name] = [offset, values.typecode, len(values)]
+            offset = _align(offset + len(values) * values.itemsize, 8)
+        header = json.dumps(
+            {
+                "byteorder": sys.byteorder,
+                "tree_classes": [
+                    [cls.__module__, cls.__qualname__] for cls in self.tree_classes
+                ],
+                "sections": layout,
+            }
+        ).encode("utf8")
+
+        fout.write(BINARY_VIEW_MAGIC)
+        fout.write(len(header).to_bytes(8, "little"))
+        fout.write(header)
+        position = len(BINARY_VIEW_MAGIC) + 8 + len(header)
+        start = _align(position, 8)
+        for name, values in sections:
+            fout.write(b"\0" * (start + layout[name][0] - position))
+            fout.write(values.tobytes())
+            position = start + layout[name][0] + len(values) * values.itemsize
+
+
+class BinaryCorpusView(AbstractLazySequence):
+    """
+    A read-only corpus view for binary corpus files, which store a
+    sequence of strings, and of lists, tuples and ``nltk.tree`` trees of
+    them, such as words, tagged or IOB tagged words, sentences, grids of
+    CoNLL columns and parse trees.  Each distinct string is stored once, and
+    the items are stored as arrays of integers: the ids of their
+    strings, and the codes and lengths of their lists, tuples and
+    trees.  The file is memory-mapped, so any item or slice can be read
+    without decoding the items before it.  Binary corpus files are much
+    smaller and faster to read than those of ``PickleCorpusView``, but
+    only hold items of these types:
+
+        >>> from nltk.corpus.reader.util import BinaryCorpusView
+        >>> from nltk.tree import Tree
+        >>> items = [[("The", "DT"), ("dog", "NN")], Tree("S", ["It", "barked"])]
+        >>> view = BinaryCorpusView.cache_to_tempfile(items)
+        >>> len(view), view[-1]
+        (2, Tree('S', ['It', 'barked']))
+        >>> list(view) == items
+        True
+        >>> view.close()
+
+    The items which corpus readers parse from a file are written to a
+    binary corpus file, and read from it afterwards, if the reader's
+    ``CACHE_DIR`` is set; see ``cached_corpus_view()``.
+    """
+
+    def __init__(self, fileid, delete_on_gc=False):
+        """
+        Create a new corpus view that reads the binary corpus file
+        ``fileid``.
+
+        :param delete_on_gc: If true, then ``fileid`` will be deleted
+            whenever this object gets garbage-collected.
+        :raise ValueError: If ``fileid`` is not a complete binary corpus
+            file written on a machine with the same byte order.
+        """
+        self._fileid = fileid
+        self._delete_on_gc = delete_on_gc
+        self._mmap = None
+        with open(fileid, "rb") as fin:
+            if fin.read(len(BINARY_VIEW_MAGIC)) != BINARY_VIEW_MAGIC:
+                raise ValueError(f"{fileid!r} is not a binary corpus file")
+            header = json.loads(fin.read(int.from_bytes(fin.read(8), "little")))
+            self._start = _align(fin.tell(), 8)
+            size = os.fstat(fin.fileno()).st_size
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{fileid!r} was written with another byte order")
+        self._layout = header["sections"]
+        for offset, typecode, length in self._layout.values():
+            if self._start + offset + length * array(typecode).itemsize > size:
+                raise ValueError(f"{fileid!r} is truncated")
+        self._tree_classes = [_tree_class(*name) for name in header["tree_classes"]]
+        self._len = self._layout["item_offsets"][2] - 1
+        # The strings which were decoded so far, by id
+        self._strings = [None] * (self._layout["string_offsets"][2] - 1)
+
+    fileid = property(
+        lambda self: self._fileid,
+        doc="""
+        The fileid of the file that is accessed by this view.
+
+        :type: str""",
+    )
+
+    def _open(self):
+        """Map the file, and the arrays it contains, into memory."""
+        with open(self._fileid, "rb") as fin:
+            self._mmap = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffers = [memoryview(self._mmap)]
+        for name, (offset, typecode, length) in self._layout.items():
+            start = self._start + offset
+            section = self._buffers[0][
+                start : start + length * array(typecode).itemsize
+            ]
+            self._buffers.append(section)
+            if typecode != "B":
+                section = section.cast(typecode)
+                self._buffers.append(section)
+            setattr(self, "_" + name, section)
+
+    def close(self):
+        """
+        Unmap the file.  If the view is accessed after it is closed,
+        the file will be automatically mapped again.
+        """
+        if self._mmap is not None:
+            for buffer in reversed(self._buffers):
+                buffer.release()
+            self._buffers = []
+            self._mmap.close()
+            self._mmap = None
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return AbstractLazySequence.__getitem__(self, i)
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("index out of range")
+        return self._item(i)
+
+    def iterate_from(self, start_tok):
+        for i in range(max(0, start_tok), self._len):
+            yield self._item(i)
+
+    def _item(self, i):
+        if self._mmap is None:
+            self._open()
+        codes = self._codes[self._item_offsets[i] : self._item_offsets[i + 1]]
+        return self._decode(codes.tolist(), 0)[0]
+
+    def _decode(self, codes, pos):
+        """Decode the item encoded at ``codes[pos]``, and return it and the
+        position of the next item."""
+        code = codes[pos]
+        if code >= 0:
+            return self._string(code), pos + 1
+        length = codes[pos + 1]
+        pos += 2
+        if code <= _TREE:
+            label, pos = self._decode(codes, pos)
+        children = []
+        for _ in range(length):
+            if codes[pos] >= 0:
+                children.append(self._string(codes[pos]))
+                pos += 1
+            else:
+                child, pos = self._decode(codes, pos)
+                children.append(child)
+        if code == _LIST:
+            return children, pos
+        if code == _TUPLE:
+            return tuple(children), pos
+        return self._tree_classes[_TREE - code](label, children), pos
+
+    def _string(self, i):
+        string = self._strings[i]
+        if string is None:
+            start, end = self._string_offsets[i], self._string_offsets[i + 1]
+            string = self._strings[i] = str(self._string_data[start:end], "utf8")
+        return string
+
+    def __del__(self):
+        """
+        If ``delete_on_gc`` was set to true when this
+        ``BinaryCorpusView`` was created, then delete the corpus view's
+        fileid.
+        """
+        if getattr(self, "_mmap", None) is not None:
+            self.close()
+        if getattr(self, "_delete_on_gc", False):
+            try:
+                os.remove(self._fileid)
+            except OSError:
+                pass
+
+    @classmethod
+    def write(cls, sequence, output_file):
+        """
+        Write the items of ``sequence`` to ``output_file``, which can be
+        a path or a new file opened for writing in binary mode.
+
+        :raise TypeError: If an item is not a string, or a list, tuple
+            or ``nltk.tree`` tree of such items.
+        """
+        writer = _BinaryViewWriter()
+        writer.add(sequence)
+        if isinstance(output_file, str):
+            with open(output_file, "wb") as fout:
+                writer.write(fout)
+        else:
+            writer.write(output_file)
+
+    @classmethod
+    def cache_to_tempfile(cls, sequence, delete_on_gc=True):
+        """
+        Write the given sequence to a temporary file as a binary
+        corpus file; and then return a ``BinaryCorpusView`` view for
+        that temporary corpus file.
+
+        :param delete_on_gc: If true, then the temporary file will be
+            deleted whenever this object gets garbage-collected.
+        """
+        try:
+            fd, output_file_name = tempfile.mkstemp(".bcv", "nltk-")
+            with os.fdopen(fd, "wb") as output_file:
+                cls.write(sequence, output_file)
+            return BinaryCorpusView(output_file_name, delete_on_gc)
+        except OSError as e:
+            raise ValueError("Error while creating temp file: %s" % e) from e
+
+
+class _CachingCorpusView(StreamBackedCorpusView):
+    """
+    A stream backed corpus view which, once its blocks have been read
+    in order from the first to the last, writes its tokens to the
+    binary corpus file ``cache_file``.
+    """
+
+    def __init__(self, fileid, block_reader, encoding, cache_file):
+        StreamBackedCorpusView.__init__(self, fileid, block_reader, encoding=encoding)
+        self._cache_file = cache_file
+        self._cache_writer = _BinaryViewWriter()
+
+    def _cache_block(self, filepos, toknum, tokens, new_filepos):
+        StreamBackedCorpusView._cache_block(self, filepos, toknum, tokens, new_filepos)
+        writer = self._cache_writer
+        if writer is None or toknum != len(writer.item_offsets) - 1:
+            return
+        try:
+            writer.add(tokens)
+        except TypeError:
+            # The tokens cannot be cached
+            self._cache_writer = None
+            return
+        if new_filepos == self._eofpos:
+            self._cache_writer = None
+            tmp_path = f"{self._cache_file}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self._cache_file), exist_ok=True)
+                with open(tmp_path, "wb") as fout:
+                    writer.write(fout)
+                os.replace(tmp_path, self._cache_file)
+            except OSError:
+                pass
+
+
+def cached_corpus_view(fileid, block_reader, encoding="utf8", cache_dir=None, key=()):
+    """
+    Return a corpus view of the tokens read from ``fileid`` by
+    ``block_reader``.  If ``cache_dir`` is set, the tokens are written to
+    a binary corpus file in that directory once the view has been read
+    to the end, and later calls, in this or other processes, return a
+    ``BinaryCorpusView`` of that file; otherwise a
+    ``StreamBackedCorpusView`` is returned.  The binary corpus file is
+    keyed by the path, modification time and size of ``fileid``, by
+    ``encoding``, and by ``key``, which should identify how the tokens
+    are read.  Tokens which are not strings, or lists, tuples or trees
+    of them, are not cached.
+
+    :param cache_dir: The directory of the binary corpus files, if any
+    :type cache_dir: str or None
+    :param key: The settings which determine the tokens, made of
+        strings, numbers, tuples and lists
+    :type key: tuple
+    """
+    file_key = _file_key(fileid) if cache_dir else None
+    if file_key is None:
+        return StreamBackedCorpusView(fileid, block_reader, encoding=encoding)
+    digest = hashlib.sha1(repr(file_key + (encoding, key)).encode("utf8"))
+    cache_file = os.path.join(cache_dir, digest.hexdigest() + ".bcv")
+    if os.path.exists(cache_file):
+        try:
+            return BinaryCorpusView(cache_file)
+        except (OSError, ValueError, KeyError):
+            pass
+    return _CachingCorpusView(fileid, block_reader, encoding, cache_file)
+
+
 ######################################################################
 # { Block Readers
 ######################################################################
 
 
 def read_whitespace_block(stream):
+    if isinstance(stream, _BulkLineReader):
+        return _bulk_whitespace_block(stream)
     toks = []
     for i in range(20):  # Read 20 lines at a time.
         toks.extend(stream.readline().split())
@@ -590,6 +1296,8 @@ def read_wordpunct_block(stream):
 
 
 def read_line_block(stream):
+    if isinstance(stream, _BulkLineReader):
+        return _bulk_line_block(stream)
     toks = []
     for i in range(20):
         line = stream.readline()
@@ -600,6 +1308,8 @@ def read_line_block(stream):
 
 
 def read_blankline_block(stream):
+    if isinstance(stream, _BulkLineReader):
+        return _bulk_blankline_block(stream)
     s = ""
     while True:
         line = stream.readline()
@@ -618,6 +1328,115 @@ def read_blankline_block(stream):
             s += line
 
 
+class _BulkLineReader:
+    """
+    A stream which reads the lines of a UTF-8 file as
+    ``SeekableUnicodeStreamReader.readline()`` does, and keeps track of
+    their exact file positions, but reads and decodes the file in large
+    buffers, and splits them into lines with ``str.splitlines()``.  The
+    ``_bulk_*_block()`` functions read whole blocks of lines from it at
+    once.
+    """
+
+    BUFFER_SIZE = 1 << 20
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._filepos = None
+        self.seek(0)
+
+    def seek(self, filepos):
+        """Move to the file position ``filepos``, which starts a line."""
+        if filepos == self._filepos:
+            return
+        self.stream.seek(filepos)
+        if filepos == 0 and self.stream.read(3) != codecs.BOM_UTF8:
+            self.stream.seek(0)
+        self._filepos = self.stream.tell()
+        self._decoder = codecs.getincrementaldecoder("utf8")()
+        self._text, self._pos, self._eof = "", 0, False
+
+    def tell(self):
+        return self._filepos
+
+    def close(self):
+        self.stream.close()
+
+    def _fill(self):
+        """Append the next buffer of the file to the text to be read."""
+        data = self.stream.read(self.BUFFER_SIZE)
+        self._eof = not data
+        self._text = self._text[self._pos :] + self._decoder.decode(data, self._eof)
+        self._pos = 0
+
+    def peeklines(self, count):
+        """
+        Return the next ``count`` lines, or all the lines up to the end
+        of the file if there are fewer, without moving past them.
+        """
+        size = 128 * count
+        while True:
+            end = self._pos + size
+            lines = self._text[self._pos : end].splitlines(True)
+            # Unless the text ends there, the last line may be incomplete
+            if len(lines) > count:
+                return lines[:count]
+            if end >= len(self._text):
+                if self._eof:
+                    return lines
+                self._fill()
+            else:
+                size *= 2
+
+    def consume(self, lines):
+        """Move past ``lines``, which were returned by ``peeklines()``."""
+        size = sum(map(len, lines))
+        text = self._text[self._pos : self._pos + size]
+        self._pos += size
+        self._filepos += size if text.isascii() else len(text.encode("utf8"))
+
+    def readlines(self, count):
+        """Return the next ``count`` lines, and move past them."""
+        lines = self.peeklines(count)
+        self.consume(lines)
+        return lines
+
+    def readline(self):
+        return "".join(self.readlines(1))
+
+
+def _bulk_whitespace_block(stream):
+    """Read the block ``read_whitespace_block()`` reads, in bulk."""
+    # Line boundaries are whitespace as well
+    return "".join(stream.readlines(20)).split()
+
+
+def _bulk_line_block(stream):
+    """Read the block ``read_line_block()`` reads, in bulk."""
+    return [line.rstrip("\n") for line in stream.readlines(20)]
+
+
+def _bulk_blankline_block(stream):
+    """Read the block ``read_blankline_block()`` reads, in bulk."""
+    count = 20
+    while True:
+        lines = stream.peeklines(count)
+        start = None
+        for i, line in enumerate(lines):
+            # Blank line:
+            if not line.strip():
+                if start is not None:
+                    stream.consume(lines[: i + 1])
+                    return ["".join(lines[start:i])]
+            elif start is None:
+                start = i
+        # End of file:
+        if len(lines) < count:
+            stream.consume(lines)
+            return [] if start is None else ["".join(lines[start:])]
+        count *= 2
+
+
 def read_alignedsent_block(stream):
     s = ""
     while True:
@@ -637,6 +1456,42 @@ def read_alignedsent_block(stream):
                 return [s]
 
 
+_BULK_BLOCK_READERS = {read_whitespace_block, read_line_block, read_blankline_block}
+
+
+def _bulk_readable(block_reader=None):
+    """
+    Return a decorator which marks a block reader method as only
+    reading from its stream with ``readline()``, ``read_whitespace_block``,
+    ``read_line_block`` and ``read_blankline_block``, so that views of
+    local UTF-8 files read its blocks in bulk.  If ``block_reader`` is
+    given, it names the attribute of the method's object holding a
+    block reader the method also reads with; the blocks are then read
+    in bulk only if that block reader can be as well.
+    """
+
+    def decorator(method):
+        method._bulk_readable = block_reader or True
+        return method
+
+    return decorator
+
+
+def _is_bulk_readable(block_reader):
+    """
+    Return whether ``block_reader`` can read its blocks from a
+    ``_BulkLineReader``.
+    """
+    if block_reader in _BULK_BLOCK_READERS:
+        return True
+    mark = getattr(block_reader, "_bulk_readable", None)
+    if mark is None:
+        return False
+    if mark is True:
+        return True
+    return _is_bulk_readable(getattr(block_reader.__self__, mark, None))
+
+
 def read_regexp_block(stream, start_re, end_re=None):
     """
     Read a sequence of tokens from a stream, where tokens begin with
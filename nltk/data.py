@@ -33,13 +33,19 @@ to a local file.
 
 import codecs
 import functools
+import io
+import mmap
 import os
 import pickle
 import re
+import struct
 import sys
 import textwrap
+import threading
 import zipfile
+import zlib
 from abc import ABCMeta, abstractmethod
+from bisect import bisect_right
 from gzip import WRITE as GZ_WRITE
 from gzip import GzipFile
 from io import BytesIO, TextIOWrapper
@@ -391,7 +397,7 @@ class ZipFilePathPointer(PathPointer):
         does not contain the specified entry.
         """
         if isinstance(zipfile, str):
-            zipfile = OpenOnDemandZipFile(os.path.abspath(zipfile))
+            zipfile = _open_zipfile(os.path.abspath(zipfile))
 
         # Check that the entry exists:
         if entry:
@@ -434,8 +440,10 @@ class ZipFilePathPointer(PathPointer):
         return self._entry
 
     def open(self, encoding=None):
-        data = self._zipfile.read(self._entry)
-        stream = BytesIO(data)
+        if isinstance(self._zipfile, OpenOnDemandZipFile):
+            stream = self._zipfile.open(self._entry)
+        else:
+            stream = BytesIO(self._zipfile.read(self._entry))
         if self._entry.endswith(".gz"):
             stream = GzipFile(self._entry, fileobj=stream)
         elif encoding is not None:
@@ -904,6 +912,11 @@ class LazyLoader:
         # __class__ to something new:
         return getattr(self, attr)
 
+    def __setstate__(self, state):
+        # Defined so that unpickling does not go through __getattr__,
+        # which would load the resource before _path is set.
+        self.__dict__.update(state)
+
     def __repr__(self):
         self.__load()
         # This looks circular, but its not, since __load() changes our
@@ -925,8 +938,22 @@ class OpenOnDemandZipFile(zipfile.ZipFile):
     ``OpenOnDemandZipFile`` must be constructed from a filename, not a
     file-like object (to allow re-opening).  ``OpenOnDemandZipFile`` is
     read-only (i.e. ``write()`` and ``writestr()`` are disabled.
+
+    Members are opened as streams reading from a memory map of the zip
+    file, which is shared by all the open streams of the zip file, and
+    closed with the last of them.  Stored members are read directly from
+    the map, and deflated members are decompressed as they are read, so
+    that opening a member costs neither a decompression nor a copy of
+    the whole member.  As with any open file, the zip file should not be
+    overwritten while streams of its members are open.
     """
 
+    _mapped = {}
+    """The memory map of each zip file which has open member streams,
+       and the number of those streams."""
+
+    _mapped_lock = threading.Lock()
+
     @py3_data
     def __init__(self, filename):
         if not isinstance(filename, str):
@@ -937,6 +964,7 @@ class OpenOnDemandZipFile(zipfile.ZipFile):
         # After closing a ZipFile object, the _fileRefCnt needs to be cleared
         # for Python2and3 compatible code.
         self._fileRefCnt = 0
+        self._map_key = _zipfile_key(filename)
 
     def read(self, name):
         assert self.fp is None
@@ -948,6 +976,67 @@ class OpenOnDemandZipFile(zipfile.ZipFile):
         self.close()
         return value
 
+    def open(self, name, mode="r", pwd=None, **kwargs):
+        """
+        Return a read-only, seekable binary stream of the contents of the
+        member ``name``.  Stored and deflated members are read lazily
+        from a memory map of the zip file; other members are read into
+        memory, encrypted ones with the password given to
+        ``setpassword()``.  Unlike ``read()``, the CRC of stored and
+        deflated members is not checked.
+
+        :param name: The name of the member, or its ``ZipInfo``
+        :type name: str or zipfile.ZipInfo
+        :rtype: io.RawIOBase
+        """
+        if self.fp is not None:
+            # Called by ``read()``, which opened the zip file
+            return zipfile.ZipFile.open(self, name, mode, pwd, **kwargs)
+        if mode != "r":
+            raise NotImplementedError("OpenOnDemandZipfile is read-only")
+        info = name if isinstance(name, zipfile.ZipInfo) else self.getinfo(name)
+        if not info.flag_bits & 0x1 and info.compress_type in (
+            zipfile.ZIP_STORED,
+            zipfile.ZIP_DEFLATED,
+        ):
+            mapped, release = self._map()
+            offset = _zip_data_offset(mapped, info)
+            if offset is None:
+                release()
+            elif info.compress_type == zipfile.ZIP_STORED:
+                return _StoredZipMember(mapped, release, offset, info.file_size)
+            else:
+                return _DeflatedZipMember(
+                    mapped, release, offset, info.compress_size, info.file_size
+                )
+        return BytesIO(self.read(info))
+
+    def _map(self):
+        """
+        Return a read-only memory map of the zip file, and a function to
+        call once it is no longer used.  The map is shared with the other
+        users of the same zip file, and closed when none of them uses it.
+        """
+        key = (self.filename,) + self._map_key
+        with self._mapped_lock:
+            entry = self._mapped.get(key)
+            if entry is None:
+                with open(self.filename, "rb") as fp:
+                    buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+                entry = self._mapped[key] = [buffer, 0]
+            entry[1] += 1
+        return entry[0], functools.partial(OpenOnDemandZipFile._unmap, key)
+
+    @classmethod
+    def _unmap(cls, key):
+        """Release a memory map returned by ``_map()``."""
+        with cls._mapped_lock:
+            entry = cls._mapped[key]
+            entry[1] -= 1
+            if not entry[1]:
+                del cls._mapped[key]
+                entry[0].close()
+
     def write(self, *args, **kwargs):
         """:raise NotImplementedError: OpenOnDemandZipfile is read-only"""
         raise NotImplementedError("OpenOnDemandZipfile is read-only")
@@ -960,6 +1049,231 @@ class OpenOnDemandZipFile(zipfile.ZipFile):
         return repr("OpenOnDemandZipFile(%r)" % self.filename)
 
 
+_zipfile_cache = {}
+"""A dictionary used to cache the ``OpenOnDemandZipFile`` of each zip
+   file, so that its central directory is only read once."""
+
+
+def _zipfile_key(filename):
+    """The modification time and size of a file, which tell whether the
+    zip file changed since its central directory was read."""
+    stat = os.stat(filename)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _open_zipfile(filename):
+    """
+    Return the ``OpenOnDemandZipFile`` of ``filename``, reusing the one
+    last opened unless the file was modified since.
+    """
+    key = _zipfile_key(filename)
+    cached = _zipfile_cache.get(filename)
+    if cached is None or cached._map_key != key:
+        cached = _zipfile_cache[filename] = OpenOnDemandZipFile(filename)
+    return cached
+
+
+def _zip_data_offset(buffer, info):
+    """
+    Return the offset in the zip file ``buffer`` of the data of the
+    member ``info``, which follows its local file header; or None if
+    that header is not where the central directory says it is.
+    """
+    start = info.header_offset
+    header = buffer[start : start + zipfile.sizeFileHeader]
+    if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+        return None
+    fields = struct.unpack(zipfile.structFileHeader, header)
+    offset = (
+        start
+        + zipfile.sizeFileHeader
+        + fields[zipfile._FH_FILENAME_LENGTH]
+        + fields[zipfile._FH_EXTRA_FIELD_LENGTH]
+    )
+    if offset + info.compress_size > len(buffer):
+        return None
+    return offset
+
+
+class _ZipMember(io.RawIOBase):
+    """
+    A read-only, seekable binary stream of the contents of a zip file
+    member, read from ``buffer``, the memory map of the zip file.
+    ``release`` is called once the stream is closed.  Subclasses define
+    ``_window()``, which gives a buffer holding the data at the current
+    position.
+    """
+
+    def __init__(self, buffer, release, size):
+        self._buffer = buffer
+        self._release = release
+        self._size = size
+        self._pos = 0
+
+    def close(self):
+        if self._release is not None:
+            self._buffer = None
+            self._release()
+            self._release = None
+        io.RawIOBase.close(self)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        self._checkClosed()
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self._checkClosed()
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence})")
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._pos = offset
+        return offset
+
+    def _window(self):
+        """
+        Return a buffer ``buf`` and the indices ``start`` and ``end`` in
+        it, such that ``buf[start:end]`` holds the member data from the
+        current position on.  The position must be before the end.
+
+        :rtype: tuple(bytes or mmap, int, int)
+        """
+        raise NotImplementedError()
+
+    def read(self, size=-1):
+        self._checkClosed()
+        if size is None or size < 0:
+            size = self._size - self._pos
+        chunks = []
+        while size > 0 and self._pos < self._size:
+            buffer, start, end = self._window()
+            chunk = buffer[start : min(end, start + size)]
+            chunks.append(chunk)
+            self._pos += len(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def readall(self):
+        return self.read()
+
+    def readinto(self, b):
+        data = self.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    def readline(self, size=-1):
+        self._checkClosed()
+        if size is None or size < 0:
+            size = self._size - self._pos
+        chunks = []
+        while size > 0 and self._pos < self._size:
+            buffer, start, end = self._window()
+            end = min(end, start + size)
+            newline = buffer.find(b"\n", start, end)
+            if newline >= 0:
+                end = newline + 1
+            chunks.append(buffer[start:end])
+            self._pos += end - start
+            size -= end - start
+            if newline >= 0:
+                break
+        return b"".join(chunks)
+
+
+class _StoredZipMember(_ZipMember):
+    """A stream of a stored zip member, read from the memory map of the
+    zip file without any intermediate copy."""
+
+    def __init__(self, buffer, release, offset, size):
+        _ZipMember.__init__(self, buffer, release, size)
+        self._offset = offset
+
+    def _window(self):
+        return (self._buffer, self._offset + self._pos, self._offset + self._size)
+
+
+class _DeflatedZipMember(_ZipMember):
+    """
+    A stream of a deflated zip member, decompressed from the memory map
+    of the zip file as it is read.  The state of the decompressor is
+    saved every ``CHECKPOINT_SIZE`` bytes of output, so that seeking
+    backwards resumes from the closest checkpoint rather than from the
+    start of the member.
+    """
+
+    CHUNK_SIZE = 1 << 16
+    """The number of bytes decompressed at once."""
+
+    CHECKPOINT_SIZE = 1 << 20
+    """The number of bytes decompressed between two checkpoints."""
+
+    def __init__(self, buffer, release, offset, compress_size, size):
+        _ZipMember.__init__(self, buffer, release, size)
+        self._input_start = offset
+        self._input_end = offset + compress_size
+        # The output position of each checkpoint, and its input position
+        # and decompressor
+        self._checkpoint_pos = [0]
+        self._checkpoints = [(offset, zlib.decompressobj(-zlib.MAX_WBITS))]
+        self._restore(0)
+
+    def _restore(self, index):
+        self._out_pos = self._checkpoint_pos[index]
+        self._in_pos, decompressor = self._checkpoints[index]
+        self._decompressor = decompressor.copy()
+        self._chunk = b""
+
+    def _window(self):
+        if self._pos < self._out_pos:
+            index = bisect_right(self._checkpoint_pos, self._pos)
+            self._restore(index - 1)
+        while self._pos >= self._out_pos + len(self._chunk):
+            self._decompress()
+        start = self._pos - self._out_pos
+        return (self._chunk, start, len(self._chunk))
+
+    def _decompress(self):
+        """Replace the current chunk of output by the next one."""
+        self._out_pos += len(self._chunk)
+        decompressor = self._decompressor
+        pending = decompressor.unconsumed_tail
+        if (
+            not pending
+            and self._out_pos >= self._checkpoint_pos[-1] + self.CHECKPOINT_SIZE
+        ):
+            self._checkpoint_pos.append(self._out_pos)
+            self._checkpoints.append((self._in_pos, decompressor.copy()))
+        if not pending:
+            if decompressor.eof:
+                raise zipfile.BadZipFile("Truncated deflated zip member")
+            if self._in_pos >= self._input_end:
+                # All the input was consumed, but the decompressor may
+                # still hold output held back by the ``max_length`` limit
+                self._chunk = decompressor.decompress(b"", self.CHUNK_SIZE)
+                if not self._chunk:
+                    raise zipfile.BadZipFile("Truncated deflated zip member")
+                return
+            end = min(self._in_pos + self.CHUNK_SIZE, self._input_end)
+            pending = self._buffer[self._in_pos : end]
+            self._in_pos = end
+        self._chunk = decompressor.decompress(pending, self.CHUNK_SIZE)
+
+    def close(self):
+        self._decompressor = None
+        self._checkpoint_pos = self._checkpoints = None
+        _ZipMember.close(self)
+
+
 ######################################################################
 # Seekable Unicode Stream Reader
 ######################################################################
@@ -210,7 +210,8 @@ on 2 preceding words. If you pass in a 4-word context, the first two words
 will be ignored.
 """
 
-from nltk.lm.counter import NgramCounter
+from nltk.lm.arpa import ArpaModel
+from nltk.lm.counter import ArrayNgramCounter, NgramCounter
 from nltk.lm.models import (
     MLE,
     AbsoluteDiscountingInterpolated,
@@ -225,6 +226,7 @@ from nltk.lm.vocabulary import Vocabulary
 __all__ = [
     "Vocabulary",
     "NgramCounter",
+    "ArrayNgramCounter",
     "MLE",
     "Lidstone",
     "Laplace",
@@ -232,4 +234,5 @@ __all__ = [
     "KneserNeyInterpolated",
     "AbsoluteDiscountingInterpolated",
     "StupidBackoff",
+    "ArpaModel",
 ]
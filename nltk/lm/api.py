@@ -6,15 +6,61 @@
 # For license information, see LICENSE.TXT
 """Language Model Interface."""
 
+import inspect
+import os
+import pickle
 import random
 import warnings
 from abc import ABCMeta, abstractmethod
 from bisect import bisect
-from itertools import accumulate
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial, wraps
+from itertools import accumulate, islice
 
 from nltk.lm.counter import NgramCounter
 from nltk.lm.util import log_base2
 from nltk.lm.vocabulary import Vocabulary
+from nltk.util import parallel_imap
+
+
+def _batch_cached(method):
+    """Memoize a method while its object is scoring a batch.
+
+    Outside of `LanguageModel.score_many` and the methods built on it, the
+    method is called as usual. Within them, its results are cached by
+    argument until the batch is done, so quantities that only depend on the
+    context, e.g. gamma, are computed once per context. The arguments are
+    normalized into positional ones, with the context as a tuple, so that
+    e.g. ``score(w, ["a"])`` and ``score(w, context=("a",))`` share an entry.
+    """
+    signature = inspect.signature(method)
+    params = list(signature.parameters)[1:]
+    context_index = params.index("context") if "context" in params else None
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = getattr(self, "_batch_cache", None)
+        if cache is None:
+            return method(self, *args, **kwargs)
+        if kwargs or len(args) < len(params):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            args = bound.args[1:]
+        if context_index is not None:
+            context = args[context_index]
+            if context is not None and type(context) is not tuple:
+                args = list(args)
+                args[context_index] = tuple(context)
+                args = tuple(args)
+        key = (method.__name__,) + args
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = method(self, *args)
+            return result
+
+    return wrapper
 
 
 class Smoothing(metaclass=ABCMeta):
@@ -34,6 +80,7 @@ class Smoothing(metaclass=ABCMeta):
         """
         self.vocab = vocabulary
         self.counts = counter
+        self._batch_cache = None
 
     @abstractmethod
     def unigram_score(self, word):
@@ -70,6 +117,13 @@ def _weighted_choice(population, weights, random_generator=None):
     return population[bisect(cum_weights, total * threshold)]
 
 
+def _count_shard(preprocess, counter_class, shard):
+    """Count the words and ngrams of one shard, for `LanguageModel.fit_shards`."""
+    text, vocabulary_text = preprocess(shard)
+    vocab = Vocabulary(vocabulary_text)
+    return vocab.counts, counter_class(text)
+
+
 class LanguageModel(metaclass=ABCMeta):
     """ABC for Language Models.
 
@@ -100,6 +154,8 @@ class LanguageModel(metaclass=ABCMeta):
             )
         self.vocab = Vocabulary() if vocabulary is None else vocabulary
         self.counts = NgramCounter() if counter is None else counter
+        self._batch_cache = None
+        self._generation_cache = OrderedDict()
 
     def fit(self, text, vocabulary_text=None):
         """Trains the model on a text.
@@ -114,6 +170,82 @@ class LanguageModel(metaclass=ABCMeta):
                 )
             self.vocab.update(vocabulary_text)
         self.counts.update(self.vocab.lookup(sent) for sent in text)
+        self._generation_cache = OrderedDict()
+
+    def fit_shards(
+        self, shards, preprocess, processes=1, checkpoint=None, checkpoint_every=10
+    ):
+        """Trains the model on a text split into shards, possibly in parallel.
+
+        Each shard is turned into training text and vocabulary text by
+        ``preprocess``, and its words and ngrams are counted separately, in
+        one of ``processes`` worker processes. The partial counts are merged
+        in the order of the shards, and the ngrams are only looked up in the
+        vocabulary once all the shards are counted. If the model has no
+        vocabulary yet, it is built from the vocabulary text of the shards.
+        Otherwise the model is trained as by calling `fit` on all the shards.
+
+        If ``checkpoint`` is given, the merged counts are saved to that file
+        after every ``checkpoint_every`` shards, and when done. If the file
+        exists, the counts it holds are loaded and the shards they cover are
+        skipped, so an interrupted training can be resumed by calling this
+        method again with the same arguments.
+
+        >>> from functools import partial
+        >>> from nltk.lm import MLE
+        >>> from nltk.lm.preprocessing import padded_everygram_pipeline
+        >>> shards = [[list("abcd")], [list("acdc"), list("ab")]]
+        >>> lm = MLE(2)
+        >>> lm.fit_shards(shards, partial(padded_everygram_pipeline, 2))
+        >>> lm.counts["a"], lm.score("b", ["a"])
+        (3, 0.6666666666666666)
+
+        :param shards: The shards of the training text, which must be
+            picklable when ``processes > 1``.
+        :type shards: Iterable
+        :param preprocess: Function turning a shard into a sequence of
+            sentences of ngrams and a sequence of words, such as
+            `nltk.lm.preprocessing.padded_everygram_pipeline` with the order
+            bound. It must be picklable when ``processes > 1``.
+        :param int processes: The number of worker processes
+        :param checkpoint: Optional path of the file holding the partial counts
+        :type checkpoint: str or None
+        :param int checkpoint_every: Number of shards between two checkpoints
+        """
+        vocab_counts, counts, done = None, type(self.counts)(), 0
+        if checkpoint is not None and os.path.exists(checkpoint):
+            with open(checkpoint, "rb") as fin:
+                vocab_counts, counts, done = pickle.load(fin)
+
+        def save_checkpoint():
+            tmp = f"{checkpoint}.tmp"
+            with open(tmp, "wb") as fout:
+                pickle.dump((vocab_counts, counts, done), fout, protocol=4)
+            os.replace(tmp, checkpoint)
+
+        count_shard = partial(_count_shard, preprocess, type(self.counts))
+        for shard_vocab, shard_counts in parallel_imap(
+            count_shard, islice(shards, done, None), processes, chunksize=1
+        ):
+            if vocab_counts is None:
+                vocab_counts = shard_vocab
+            else:
+                vocab_counts.update(shard_vocab)
+            counts.merge(shard_counts)
+            done += 1
+            if checkpoint is not None and done % checkpoint_every == 0:
+                save_checkpoint()
+        if checkpoint is not None:
+            save_checkpoint()
+
+        if not self.vocab:
+            if not vocab_counts:
+                raise ValueError(
+                    "Cannot fit without a vocabulary or text to create it from."
+                )
+            self.vocab.update(vocab_counts)
+        self.counts.merge(counts._map_words(self.vocab.lookup))
+        self._generation_cache = OrderedDict()
 
     def score(self, word, context=None):
         """Masks out of vocab (OOV) words and computes their model score.
@@ -149,6 +281,59 @@ class LanguageModel(metaclass=ABCMeta):
         """
         return log_base2(self.score(word, context))
 
+    @contextmanager
+    def _batch(self):
+        """Memoize scores and context-level quantities within the block."""
+        if getattr(self, "_batch_cache", None) is not None:
+            # Already within a batch
+            yield
+            return
+        self._batch_cache = {}
+        try:
+            yield
+        finally:
+            self._batch_cache = None
+
+    def score_many(self, text_ngrams):
+        """Score the last word of each ngram given the words preceding it.
+
+        This is equivalent to calling `score` for each ngram, but the scores
+        of repeated ngrams and the quantities shared by ngrams with the same
+        context are only computed once.
+
+        >>> from nltk.lm import WittenBellInterpolated
+        >>> lm = WittenBellInterpolated(2)
+        >>> lm.fit([[("a", "b"), ("b", "c")]], vocabulary_text=["a", "b", "c"])
+        >>> lm.score_many([("a", "b"), ("b", "c"), ("a", "b")])
+        [0.5, 0.5, 0.5]
+        >>> lm.score("b", ["a"])
+        0.5
+
+        :param Iterable(tuple(str)) text_ngrams: A sequence of ngram tuples.
+        :rtype: list(float)
+        """
+        scores = []
+        with self._batch():
+            cache = self._batch_cache
+            for ngram in text_ngrams:
+                word = self.vocab.lookup(ngram[-1])
+                context = self.vocab.lookup(ngram[:-1]) if ngram[:-1] else None
+                key = ("score", word, context)
+                score = cache.get(key)
+                if score is None:
+                    score = cache[key] = self.unmasked_score(word, context)
+                scores.append(score)
+        return scores
+
+    def logscore_many(self, text_ngrams):
+        """Evaluate the log score of the last word of each ngram.
+
+        The arguments are the same as for `score_many`.
+
+        :rtype: list(float)
+        """
+        return [log_base2(score) for score in self.score_many(text_ngrams)]
+
     def context_counts(self, context):
         """Helper method for retrieving counts for a given context.
 
@@ -170,9 +355,7 @@ class LanguageModel(metaclass=ABCMeta):
         :rtype: float
 
         """
-        return -1 * _mean(
-            [self.logscore(ngram[-1], ngram[:-1]) for ngram in text_ngrams]
-        )
+        return -1 * _mean(self.logscore_many(text_ngrams))
 
     def perplexity(self, text_ngrams):
         """Calculates the perplexity of the given text.
@@ -182,13 +365,16 @@ class LanguageModel(metaclass=ABCMeta):
         """
         return pow(2.0, self.entropy(text_ngrams))
 
-    def generate(self, num_words=1, text_seed=None, random_seed=None):
+    def generate(self, num_words=1, text_seed=None, random_seed=None, cache_size=1000):
         """Generate words from the model.
 
         :param int num_words: How many words to generate. By default 1.
         :param text_seed: Generation can be conditioned on preceding context.
         :param random_seed: A random seed or an instance of `random.Random`. If provided,
             makes the random sampling part of generation reproducible.
+        :param int cache_size: How many contexts to keep the cumulative
+            distribution of words for, across calls. The least recently used
+            ones are evicted first. The cache is cleared when the model is fit.
         :return: One (str) word or a list of words generated from model.
 
         Examples:
@@ -203,36 +389,88 @@ class LanguageModel(metaclass=ABCMeta):
         'b'
 
         """
-        text_seed = [] if text_seed is None else list(text_seed)
+        generated = self._generate(
+            num_words,
+            [] if text_seed is None else list(text_seed),
+            _random_generator(random_seed),
+            cache_size,
+        )
+        return generated[0] if num_words == 1 else generated
+
+    def generate_many(self, text_seeds, num_words=1, random_seed=None, cache_size=1000):
+        """Generate a sequence of words for each of the given text seeds.
+
+        This is the same as calling `generate` for each seed in turn with the
+        same random generator, except that a list is returned for every seed.
+
+        >>> from nltk.lm import MLE
+        >>> lm = MLE(2)
+        >>> lm.fit([[("a", "b"), ("b", "c")]], vocabulary_text=['a', 'b', 'c'])
+        >>> lm.fit([[("a",), ("b",), ("c",)]])
+        >>> lm.generate_many([["a"], None, ["b"]], num_words=2, random_seed=3)
+        [['b', 'c'], ['b', 'c'], ['c', 'a']]
+
+        :param text_seeds: The seeds, each of which is a sequence of words or None.
+        :type text_seeds: Iterable(list(str) or None)
+        :param int num_words: How many words to generate per seed.
+        :param random_seed: A random seed or an instance of `random.Random`.
+        :param int cache_size: As for `generate`
+        :return: One list of words per seed
+        :rtype: list(list(str))
+        """
         random_generator = _random_generator(random_seed)
-        # This is the base recursion case.
-        if num_words == 1:
-            context = (
-                text_seed[-self.order + 1 :]
-                if len(text_seed) >= self.order
-                else text_seed
-            )
-            samples = self.context_counts(self.vocab.lookup(context))
-            while context and not samples:
-                context = context[1:] if len(context) > 1 else []
-                samples = self.context_counts(self.vocab.lookup(context))
-            # Sorting samples achieves two things:
-            # - reproducible randomness when sampling
-            # - turns Mapping into Sequence which `_weighted_choice` expects
-            samples = sorted(samples)
-            return _weighted_choice(
-                samples,
-                tuple(self.score(w, context) for w in samples),
+        return [
+            self._generate(
+                num_words,
+                [] if text_seed is None else list(text_seed),
                 random_generator,
+                cache_size,
             )
-        # We build up text one word at a time using the preceding context.
-        generated = []
+            for text_seed in text_seeds
+        ]
+
+    def _generate(self, num_words, text_seed, random_generator, cache_size):
+        text = text_seed
         for _ in range(num_words):
-            generated.append(
-                self.generate(
-                    num_words=1,
-                    text_seed=text_seed + generated,
-                    random_seed=random_generator,
-                )
+            context = text[-self.order + 1 :] if len(text) >= self.order else text
+            samples, cum_weights = self._cumulative_distribution(
+                tuple(self.vocab.lookup(context)), cache_size
             )
-        return generated
+            threshold = random_generator.random()
+            text.append(samples[bisect(cum_weights, cum_weights[-1] * threshold)])
+        return text[len(text) - num_words :]
+
+    def _cumulative_distribution(self, context, cache_size):
+        """Return the words which may follow `context` and the cumulative sums
+        of their scores, as `_weighted_choice` would compute them.
+
+        The results are kept in a least recently used cache of `cache_size`
+        contexts.
+        """
+        cache = getattr(self, "_generation_cache", None)
+        if cache is None:
+            cache = self._generation_cache = OrderedDict()
+        if context in cache:
+            cache.move_to_end(context)
+            return cache[context]
+
+        key = context
+        samples = self.context_counts(context)
+        while context and not samples:
+            context = context[1:]
+            samples = self.context_counts(context)
+        if not samples:
+            raise ValueError("Can't choose from empty population")
+        # Sorting samples achieves two things:
+        # - reproducible randomness when sampling
+        # - turns Mapping into Sequence which can be indexed
+        samples = sorted(samples)
+        cum_weights = list(
+            accumulate(self.score_many([context + (word,) for word in samples]))
+        )
+
+        if cache_size > 0:
+            cache[key] = samples, cum_weights
+            while len(cache) > cache_size:
+                cache.popitem(last=False)
+        return samples, cum_weights
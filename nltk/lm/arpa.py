@@ -0,0 +1,337 @@
+# Natural Language Toolkit: ARPA Language Models
+#
+# Copyright (C) 2001-2023 NLTK Project
+# URL: <https://www.nltk.org/>
+# For license information, see LICENSE.TXT
+r"""Import and export of language models in the ARPA backoff format.
+
+The ARPA format lists, for every ngram of a backoff model, the base 10 log
+of its probability and, if the ngram is the context of longer ngrams, the
+base 10 log of its backoff weight. The probability of a word given a context
+is that of the longest listed ngram made of the word and the end of the
+context, multiplied by the backoff weights of the contexts which were
+skipped.
+
+    >>> from nltk.lm import WittenBellInterpolated
+    >>> from nltk.lm.arpa import ArpaModel
+    >>> from nltk.lm.preprocessing import padded_everygram_pipeline
+    >>> lm = WittenBellInterpolated(2)
+    >>> lm.fit(*padded_everygram_pipeline(2, [list("abcd"), list("acdc")]))
+    >>> arpa = ArpaModel.from_model(lm)
+    >>> round(arpa.score("c", ["a"]), 4), round(lm.score("c", ["a"]), 4)
+    (0.375, 0.375)
+
+Words unseen in a context are scored through the backoff weights.
+
+    >>> round(arpa.score("b", ["d"]), 4), round(lm.score("b", ["d"]), 4)
+    (0.0417, 0.0417)
+
+Models are written and read with the `write` and `read` methods, which take
+paths or open text files.
+
+    >>> from io import StringIO
+    >>> arpa_file = StringIO()
+    >>> arpa.write(arpa_file)
+    >>> arpa_file.getvalue().splitlines()[:5]
+    ['', '\\data\\', 'ngram 1=7', 'ngram 2=8', '']
+    >>> _ = arpa_file.seek(0)
+    >>> ArpaModel.read(arpa_file)
+    <ArpaModel with order 2 and 15 ngrams>
+"""
+
+import math
+from collections import defaultdict
+
+from nltk.lm.api import _mean
+from nltk.lm.util import NEG_INF
+
+# The base 10 log which stands for a probability of zero
+ARPA_LOG_ZERO = -99.0
+
+_LOG2_10 = math.log2(10)
+
+
+def _log10(probability):
+    return math.log10(probability) if probability > 0 else NEG_INF
+
+
+class ArpaModel:
+    """Read-only backoff language model, such as one read from an ARPA file.
+
+    The ngrams are kept in a single hash table, so that scoring a word only
+    takes one lookup per order, without any counting. Words missing from
+    the unigrams are looked up as ``unk_label``.
+
+    :param ngrams: The base 10 log probability and backoff weight of each ngram
+    :type ngrams: dict(tuple(str), tuple(float, float))
+    :param int order: The highest order of the ngrams
+    :param str unk_label: Label standing for the words which are not unigrams
+    """
+
+    def __init__(self, ngrams, order, unk_label="<UNK>"):
+        self._ngrams = ngrams
+        self.order = order
+        self.unk_label = unk_label
+
+    @classmethod
+    def from_model(cls, model, min_count=1, threshold=None):
+        """Convert a trained `nltk.lm` model to a backoff model.
+
+        All the words of the model vocabulary and all the ngrams it counted
+        are listed, with the probability the model gives them. The backoff
+        weights are set such that the probabilities of all the words in a
+        context sum to one. For interpolated models, which assign
+        probabilities proportional to those of the shorter context to the
+        words unseen in a context, the backoff model thus gives the same
+        probabilities as the original one.
+
+        The ngrams of order 2 and above can be pruned in two ways. Those seen
+        less than ``min_count`` times are dropped. So are those whose removal
+        increases the relative entropy of the model by less than
+        ``threshold``, as estimated by Stolcke (1998). Ngrams which are the
+        context of a longer ngram are kept.
+
+        :param model: The trained model
+        :type model: nltk.lm.api.LanguageModel
+        :param int min_count: The smallest count of the ngrams to keep
+        :param threshold: The relative entropy threshold for pruning, if any
+        :type threshold: float or None
+        :rtype: ArpaModel
+        """
+        probs = {(word,): model.score(word) for word in model.vocab}
+        by_context = [{} for _ in range(model.order + 1)]
+        for order in range(2, model.order + 1):
+            for context, counts in model.counts[order].items():
+                words = [word for word, count in counts.items() if count > 0]
+                if words:
+                    by_context[order][context] = {word: counts[word] for word in words}
+                    for word in words:
+                        probs[context + (word,)] = model.score(word, context)
+
+        context_probs = {}
+
+        def context_prob(context):
+            """The probability of a sequence of words, for entropy pruning."""
+            if context not in context_probs:
+                prob = 1.0
+                for i, word in enumerate(context):
+                    prob *= model.score(word, context[:i])
+                context_probs[context] = prob
+            return context_probs[context]
+
+        # Prune from the highest order down, so that the contexts of the
+        # ngrams which are kept can be kept as well
+        for order in range(model.order, 1, -1):
+            for context, counts in by_context[order].items():
+                if threshold is not None:
+                    seen = sum(probs[context + (word,)] for word in counts)
+                    seen_lower = sum(model.score(word, context[1:]) for word in counts)
+                    prob_context = context_prob(context)
+                for word in list(counts):
+                    ngram = context + (word,)
+                    if order < model.order and ngram in by_context[order + 1]:
+                        continue
+                    if counts[word] < min_count or (
+                        threshold is not None
+                        and _pruning_cost(
+                            probs[ngram],
+                            model.score(word, context[1:]),
+                            1.0 - seen,
+                            1.0 - seen_lower,
+                            prob_context,
+                        )
+                        < threshold
+                    ):
+                        del counts[word]
+                        del probs[ngram]
+            by_context[order] = {
+                context: counts
+                for context, counts in by_context[order].items()
+                if counts
+            }
+
+        arpa = cls(
+            {ngram: (_log10(prob), 0.0) for ngram, prob in probs.items()},
+            model.order,
+            model.vocab.unk_label,
+        )
+        # Set the backoff weights from the lowest order up, as they depend
+        # on the probabilities of the shorter contexts
+        for order in range(2, model.order + 1):
+            for context, counts in by_context[order].items():
+                seen = sum(probs[context + (word,)] for word in counts)
+                seen_lower = sum(arpa._score(word, context[1:]) for word in counts)
+                arpa._ngrams[context] = (
+                    arpa._ngrams[context][0],
+                    _log10(_backoff_weight(1.0 - seen, 1.0 - seen_lower)),
+                )
+        return arpa
+
+    @classmethod
+    def read(cls, source, unk_label="<UNK>"):
+        """Read a backoff model in the ARPA format.
+
+        :param source: The path of an ARPA file, or an open text file
+        :type source: str or file
+        :param str unk_label: Label standing for the words which are not unigrams
+        :rtype: ArpaModel
+        """
+        if isinstance(source, str):
+            with open(source, encoding="utf8") as fin:
+                return cls.read(fin, unk_label)
+
+        ngrams, order, section = {}, 0, None
+        for line_number, line in enumerate(source, 1):
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("\\"):
+                if line == "\\end\\":
+                    break
+                if line.endswith("-grams:"):
+                    section = int(line[1:-7])
+                    order = max(order, section)
+                else:
+                    section = None
+                continue
+            if section is None:
+                # The \data\ header: the number of ngrams of each order
+                continue
+            fields = line.split()
+            if len(fields) not in (section + 1, section + 2):
+                raise ValueError(
+                    f"Line {line_number}: expected a {section}-gram entry, got {line!r}"
+                )
+            prob = float(fields[0])
+            backoff = float(fields[section + 1]) if len(fields) > section + 1 else 0.0
+            ngrams[tuple(fields[1 : section + 1])] = (
+                NEG_INF if prob <= ARPA_LOG_ZERO else prob,
+                NEG_INF if backoff <= ARPA_LOG_ZERO else backoff,
+            )
+        return cls(ngrams, order, unk_label)
+
+    def write(self, dest):
+        """Write the model in the ARPA format.
+
+        :param dest: The path of the ARPA file, or an open text file
+        :type dest: str or file
+        """
+        if isinstance(dest, str):
+            with open(dest, "w", encoding="utf8") as fout:
+                return self.write(fout)
+
+        by_order = defaultdict(list)
+        for ngram, entry in self._ngrams.items():
+            by_order[len(ngram)].append((ngram, entry))
+        contexts = {ngram[:-1] for ngram in self._ngrams}
+
+        fout = dest
+        fout.write("\n\\data\\\n")
+        for order in range(1, self.order + 1):
+            fout.write(f"ngram {order}={len(by_order[order])}\n")
+        for order in range(1, self.order + 1):
+            fout.write(f"\n\\{order}-grams:\n")
+            for ngram, (prob, backoff) in sorted(by_order[order]):
+                line = f"{max(prob, ARPA_LOG_ZERO):.7g}\t{' '.join(ngram)}"
+                if order < self.order and ngram in contexts:
+                    line += f"\t{max(backoff, ARPA_LOG_ZERO):.7g}"
+                fout.write(line + "\n")
+        fout.write("\n\\end\\\n")
+
+    def lookup(self, word):
+        """Return ``word``, or ``unk_label`` if it is not a unigram."""
+        return word if (word,) in self._ngrams else self.unk_label
+
+    def _logscore10(self, word, context):
+        context = context[len(context) - self.order + 1 :] if self.order > 1 else ()
+        ngrams = self._ngrams
+        backoff = 0.0
+        for start in range(len(context) + 1):
+            entry = ngrams.get(context[start:] + (word,))
+            if entry is not None:
+                return backoff + entry[0]
+            entry = ngrams.get(context[start:])
+            if entry is not None:
+                backoff += entry[1]
+        return NEG_INF
+
+    def _score(self, word, context):
+        return 10 ** self._logscore10(word, context)
+
+    def score(self, word, context=None):
+        """Return the probability of ``word`` following ``context``.
+
+        Words missing from the unigrams are looked up as ``unk_label``.
+
+        :param str word: The word to score
+        :param context: The words preceding it, if any
+        :type context: tuple(str) or None
+        :rtype: float
+        """
+        context = tuple(map(self.lookup, context)) if context else ()
+        return self._score(self.lookup(word), context)
+
+    def logscore(self, word, context=None):
+        """Return the base 2 log of `score`, as `LanguageModel.logscore` does."""
+        context = tuple(map(self.lookup, context)) if context else ()
+        return self._logscore10(self.lookup(word), context) * _LOG2_10
+
+    def entropy(self, text_ngrams):
+        """Calculate the cross-entropy of the model for an evaluation text.
+
+        :param Iterable(tuple(str)) text_ngrams: A sequence of ngram tuples.
+        :rtype: float
+        """
+        return -1 * _mean(
+            [self.logscore(ngram[-1], ngram[:-1]) for ngram in text_ngrams]
+        )
+
+    def perplexity(self, text_ngrams):
+        """Calculate the perplexity of the model for an evaluation text.
+
+        :param Iterable(tuple(str)) text_ngrams: A sequence of ngram tuples.
+        :rtype: float
+        """
+        return pow(2.0, self.entropy(text_ngrams))
+
+    def __len__(self):
+        return len(self._ngrams)
+
+    def __contains__(self, ngram):
+        return tuple(ngram) in self._ngrams
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} with order {self.order} and {len(self)} ngrams>"
+
+
+def _backoff_weight(left, left_lower):
+    """The weight by which to scale the probabilities of a shorter context,
+    given the probability mass left for unlisted words in a context and in
+    the shorter one."""
+    if left <= 1e-12:
+        return 0.0
+    if left_lower <= 1e-12:
+        return 1.0
+    return left / left_lower
+
+
+def _pruning_cost(prob, prob_lower, left, left_lower, prob_context):
+    """Estimate the increase in relative entropy caused by pruning an ngram.
+
+    This is equation (8) of Stolcke (1998) "Entropy-based Pruning of Backoff
+    Language Models", where ``prob`` and ``prob_lower`` are the probabilities
+    of the word after the context and after the shorter one, ``left`` and
+    ``left_lower`` the mass left for unlisted words in both contexts and
+    ``prob_context`` the probability of the context.
+    """
+    if prob <= 0:
+        return 0.0
+    if prob_lower <= 0:
+        # The word would become impossible
+        return math.inf
+    backoff = _backoff_weight(left, left_lower)
+    new_backoff = _backoff_weight(left + prob, left_lower + prob_lower)
+    cost = prob * (math.log(prob_lower * new_backoff) - math.log(prob))
+    if left > 1e-12:
+        cost += left * (math.log(new_backoff) - math.log(backoff))
+    return -prob_context * cost
@@ -9,11 +9,17 @@ Language Model Counter
 ----------------------
 """
 
+from array import array
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
 from nltk.probability import ConditionalFreqDist, FreqDist
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class NgramCounter:
     """Class for counting ngrams.
@@ -128,6 +134,44 @@ class NgramCounter:
                 context, word = ngram[:-1], ngram[-1]
                 self[ngram_order][context][word] += 1
 
+    def merge(self, other):
+        """Add the counts of another `NgramCounter` to this one.
+
+        Merging is associative and commutative, so ngrams can be counted
+        separately for parts of a text and the counts merged afterwards.
+
+        >>> from nltk.lm import NgramCounter
+        >>> counts = NgramCounter([[("a", "b"), ("c",)]])
+        >>> counts.merge(NgramCounter([[("a", "b"), ("a", "c")]]))
+        >>> sorted(counts[["a"]].items())
+        [('b', 2), ('c', 1)]
+
+        :param NgramCounter other: The counts to add.
+        """
+        self.unigrams.update(other.unigrams)
+        for order, cfd in other._counts.items():
+            if order == 1:
+                continue
+            for context, fdist in cfd.items():
+                self[order][context].update(fdist)
+
+    def _map_words(self, func):
+        """Return a new counter with each word replaced by ``func(word)``.
+
+        The counts of ngrams which become identical are added up.
+        """
+        mapped = self.__class__()
+        for word, count in self.unigrams.items():
+            mapped.unigrams[func(word)] += count
+        for order, cfd in self._counts.items():
+            if order == 1:
+                continue
+            for context, fdist in cfd.items():
+                mapped_fdist = mapped[order][tuple(map(func, context))]
+                for word, count in fdist.items():
+                    mapped_fdist[func(word)] += count
+        return mapped
+
     def N(self):
         """Returns grand total number of ngrams stored.
 
@@ -161,3 +205,355 @@ class NgramCounter:
 
     def __contains__(self, item):
         return item in self._counts
+
+
+def _pack_ngrams(ids):
+    """Pack rows of word ids into opaque keys which sort like the rows.
+
+    The ids are stored as big-endian unsigned integers, such that comparing
+    the bytes of two keys compares the rows lexicographically.
+    """
+    ids = np.ascontiguousarray(ids, dtype=">u4")
+    return ids.view(f"V{4 * ids.shape[1]}").ravel()
+
+
+def _unpack_ngrams(keys, order):
+    """Unpack keys made by `_pack_ngrams` into rows of `order` word ids."""
+    return keys.view(">u4").reshape(-1, order)
+
+
+class _ArrayFreqDist(Mapping):
+    """Read-only, `FreqDist`-like view over sorted word ids and their counts.
+
+    Used by `ArrayNgramCounter` to represent the counts of the words following
+    one context.
+    """
+
+    def __init__(self, counter, ids, counts):
+        self._counter = counter
+        self._ids = ids
+        self._counts = counts
+        self._N = None
+
+    def _index(self, word):
+        word_id = self._counter._word_ids.get(word)
+        if word_id is None:
+            return None
+        index = np.searchsorted(self._ids, word_id)
+        if index < len(self._ids) and self._ids[index] == word_id:
+            return index
+        return None
+
+    def __getitem__(self, word):
+        index = self._index(word)
+        return 0 if index is None else int(self._counts[index])
+
+    def __contains__(self, word):
+        return self._index(word) is not None
+
+    def __iter__(self):
+        words = self._counter._words
+        return (words[word_id] for word_id in self._ids.tolist())
+
+    def __len__(self):
+        return len(self._ids)
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return self._counts.tolist()
+
+    def items(self):
+        return list(zip(self, self._counts.tolist()))
+
+    def N(self):
+        """Return the total number of outcomes, as `FreqDist.N` does."""
+        if self._N is None:
+            self._N = int(self._counts.sum())
+        return self._N
+
+    def B(self):
+        """Return the number of distinct outcomes, as `FreqDist.B` does."""
+        return len(self._ids)
+
+    def freq(self, word):
+        """Return the relative frequency of `word`, as `FreqDist.freq` does."""
+        n = self.N()
+        if n == 0:
+            return 0
+        return self[word] / n
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} with {self.B()} samples and {self.N()} outcomes>"
+
+
+class _ArrayConditionalFreqDist(Mapping):
+    """Read-only, `ConditionalFreqDist`-like view over the ngrams of one order
+    stored in an `ArrayNgramCounter`, keyed by their contexts."""
+
+    def __init__(self, counter, order):
+        self._counter = counter
+        self._order = order
+        self._keys, self._counts = counter._ngrams.get(order, (None, None))
+
+    def _bounds(self, context):
+        if self._keys is None or len(context) != self._order - 1:
+            return 0, 0
+        try:
+            ids = [self._counter._word_ids[word] for word in context]
+        except (KeyError, TypeError):
+            return 0, 0
+        low = _pack_ngrams([ids + [0]])[0]
+        high = _pack_ngrams([ids + [0xFFFFFFFF]])[0]
+        return (
+            np.searchsorted(self._keys, low, "left"),
+            np.searchsorted(self._keys, high, "right"),
+        )
+
+    def _dist(self, start, stop):
+        if self._keys is None:
+            empty = np.zeros(0, dtype=np.int64)
+            return _ArrayFreqDist(self._counter, empty, empty)
+        ids = _unpack_ngrams(self._keys[start:stop], self._order)[:, -1]
+        return _ArrayFreqDist(self._counter, ids, self._counts[start:stop])
+
+    def _context_starts(self):
+        if self._keys is None or not len(self._keys):
+            return np.zeros(0, dtype=np.intp)
+        contexts = _unpack_ngrams(self._keys, self._order)[:, :-1]
+        changes = np.any(contexts[1:] != contexts[:-1], axis=1)
+        return np.flatnonzero(np.concatenate([[True], changes]))
+
+    def __getitem__(self, context):
+        return self._dist(*self._bounds(tuple(context)))
+
+    def __contains__(self, context):
+        start, stop = self._bounds(tuple(context))
+        return stop > start
+
+    def __iter__(self):
+        words = self._counter._words
+        for start in self._context_starts().tolist():
+            ids = _unpack_ngrams(self._keys[start : start + 1], self._order)[0, :-1]
+            yield tuple(words[word_id] for word_id in ids.tolist())
+
+    def __len__(self):
+        return len(self._context_starts())
+
+    def conditions(self):
+        """Return the list of contexts, as `ConditionalFreqDist.conditions` does."""
+        return list(self)
+
+    def items(self):
+        starts = self._context_starts().tolist()
+        stops = starts[1:] + [len(self._keys)] if starts else []
+        return [
+            (context, self._dist(start, stop))
+            for context, start, stop in zip(self, starts, stops)
+        ]
+
+    def values(self):
+        return [dist for _, dist in self.items()]
+
+    def N(self):
+        """Return the total number of ngrams of this order."""
+        return 0 if self._counts is None else int(self._counts.sum())
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} with {len(self)} conditions>"
+
+
+class ArrayNgramCounter:
+    """Memory-efficient alternative to `NgramCounter`.
+
+    Words are interned to integer ids, and the ngrams of each order are kept
+    as a sorted `numpy` array of packed ids with a parallel array of counts,
+    rather than as a `ConditionalFreqDist` of tuples of strings. Counting
+    happens in batches of `buffer_size` ngrams, which are sorted and merged
+    into the arrays.
+
+    It can be used in place of `NgramCounter` in all language models.
+
+    >>> from nltk.lm import MLE
+    >>> from nltk.lm.counter import ArrayNgramCounter
+    >>> from nltk.lm.preprocessing import padded_everygram_pipeline
+    >>> train, vocab = padded_everygram_pipeline(2, [list("abcd"), list("acdc")])
+    >>> lm = MLE(2, counter=ArrayNgramCounter())
+    >>> lm.fit(train, vocab)
+    >>> lm.counts['a'], lm.counts[['a']]['b'], lm.score("b", ["a"])
+    (2, 1, 0.5)
+
+    The counts returned for an order or a context are read-only views which
+    behave like `ConditionalFreqDist` and `FreqDist` respectively.
+
+    >>> sorted(lm.counts[2].conditions())
+    [('<s>',), ('a',), ('b',), ('c',), ('d',)]
+    >>> sorted(lm.counts[['c']].items())
+    [('</s>', 1), ('d', 2)]
+    """
+
+    def __init__(self, ngram_text=None, buffer_size=1000000):
+        """Creates a new ArrayNgramCounter.
+
+        :param ngram_text: Optional text containing sentences of ngrams, as for `update` method.
+        :type ngram_text: Iterable(Iterable(tuple(str))) or None
+        :param int buffer_size: Number of ngrams counted before they are
+            merged into the arrays.
+        """
+        self._buffer_size = buffer_size
+        self._word_ids = {}
+        self._words = []
+        self._unigram_counts = np.zeros(0, dtype=np.int64)
+        # The view returned by `unigrams`, rebuilt after the counts change
+        self._unigrams = None
+        # Maps each order > 1 to a pair of arrays: the sorted packed ngrams,
+        # and their counts
+        self._ngrams = {}
+        # Maps each order to the flat array of word ids of uncounted ngrams
+        self._buffers = {}
+        self._buffered = 0
+
+        if ngram_text:
+            self.update(ngram_text)
+
+    def _intern(self, word):
+        word_id = self._word_ids.get(word)
+        if word_id is None:
+            word_id = self._word_ids[word] = len(self._words)
+            self._words.append(word)
+        return word_id
+
+    def update(self, ngram_text):
+        """Updates ngram counts from `ngram_text`.
+
+        Expects `ngram_text` to be a sequence of sentences (sequences).
+        Each sentence consists of ngrams as tuples of strings.
+
+        :param Iterable(Iterable(tuple(str))) ngram_text: Text containing sentences of ngrams.
+        :raises TypeError: if the ngrams are not tuples.
+
+        """
+        intern = self._intern
+        for sent in ngram_text:
+            for ngram in sent:
+                if not isinstance(ngram, tuple):
+                    raise TypeError(
+                        "Ngram <{}> isn't a tuple, " "but {}".format(ngram, type(ngram))
+                    )
+                buffer = self._buffers.get(len(ngram))
+                if buffer is None:
+                    buffer = self._buffers[len(ngram)] = array("L")
+                buffer.extend(intern(word) for word in ngram)
+                self._buffered += 1
+                if self._buffered >= self._buffer_size:
+                    self._flush()
+        self._flush()
+
+    def _flush(self):
+        """Count the buffered ngrams and merge them into the arrays."""
+        for order, buffer in self._buffers.items():
+            ids = np.array(buffer, dtype=np.int64).reshape(-1, order)
+            self._add(order, ids, np.ones(len(ids), dtype=np.int64))
+        self._buffers = {}
+        self._buffered = 0
+
+    def _add(self, order, ids, counts):
+        """Add `counts` to the ngrams given as rows of word `ids`, which need
+        not be unique."""
+        if order == 1:
+            new_counts = np.bincount(
+                ids[:, 0], weights=counts, minlength=len(self._words)
+            ).astype(np.int64)
+            new_counts[: len(self._unigram_counts)] += self._unigram_counts
+            self._unigram_counts = new_counts
+            self._unigrams = None
+            return
+        keys, inverse = np.unique(_pack_ngrams(ids), return_inverse=True)
+        counts = np.bincount(
+            inverse.ravel(), weights=counts, minlength=len(keys)
+        ).astype(np.int64)
+        if order in self._ngrams:
+            # Merge the sorted new ngrams into the sorted stored ones, rather
+            # than sorting them all again
+            old_keys, old_counts = self._ngrams[order]
+            positions = np.searchsorted(old_keys, keys)
+            found = positions < len(old_keys)
+            found[found] = old_keys[positions[found]] == keys[found]
+            old_counts = old_counts.copy()
+            old_counts[positions[found]] += counts[found]
+            new = ~found
+            keys = np.insert(old_keys, positions[new], keys[new])
+            counts = np.insert(old_counts, positions[new], counts[new])
+        self._ngrams[order] = (keys, counts)
+
+    def merge(self, other):
+        """Add the counts of another `ArrayNgramCounter` to this one.
+
+        Merging is associative and commutative, as for `NgramCounter.merge`.
+
+        :param ArrayNgramCounter other: The counts to add.
+        """
+        self._flush()
+        other._flush()
+        self._merge_mapped(other, other._words)
+
+    def _merge_mapped(self, other, words):
+        """Add the counts of `other`, with its word ids mapped to `words`."""
+        id_map = np.array([self._intern(word) for word in words], dtype=np.int64)
+        ids = np.flatnonzero(other._unigram_counts)
+        self._add(1, id_map[ids][:, None], other._unigram_counts[ids])
+        for order, (keys, counts) in other._ngrams.items():
+            ids = _unpack_ngrams(keys, order).astype(np.int64)
+            self._add(order, id_map[ids], counts)
+
+    def _map_words(self, func):
+        """Return a new counter with each word replaced by ``func(word)``.
+
+        The counts of ngrams which become identical are added up.
+        """
+        self._flush()
+        mapped = self.__class__(buffer_size=self._buffer_size)
+        mapped._merge_mapped(self, [func(word) for word in self._words])
+        return mapped
+
+    @property
+    def unigrams(self):
+        """Counts of all the words, as a `FreqDist`-like view."""
+        if self._unigrams is None:
+            ids = np.flatnonzero(self._unigram_counts)
+            self._unigrams = _ArrayFreqDist(self, ids, self._unigram_counts[ids])
+        return self._unigrams
+
+    def N(self):
+        """Returns grand total number of ngrams stored.
+
+        This includes ngrams from all orders, so some duplication is expected.
+        :rtype: int
+
+        """
+        return int(self._unigram_counts.sum()) + sum(
+            int(counts.sum()) for _, counts in self._ngrams.values()
+        )
+
+    def __getitem__(self, item):
+        """User-friendly access to ngram counts, as for `NgramCounter`."""
+        if isinstance(item, int):
+            return self.unigrams if item == 1 else _ArrayConditionalFreqDist(self, item)
+        elif isinstance(item, str):
+            return self.unigrams[item]
+        elif isinstance(item, Sequence):
+            if not item:
+                return self.unigrams
+            return _ArrayConditionalFreqDist(self, len(item) + 1)[tuple(item)]
+
+    def __str__(self):
+        return "<{} with {} ngram orders and {} ngrams>".format(
+            self.__class__.__name__, len(self), self.N()
+        )
+
+    def __len__(self):
+        return len(self._ngrams) + 1
+
+    def __contains__(self, item):
+        return item == 1 or item in self._ngrams
@@ -7,7 +7,9 @@
 # For license information, see LICENSE.TXT
 """Language Models"""
 
-from nltk.lm.api import LanguageModel, Smoothing
+from contextlib import contextmanager
+
+from nltk.lm.api import LanguageModel, Smoothing, _batch_cached
 from nltk.lm.smoothing import AbsoluteDiscounting, KneserNey, WittenBell
 
 
@@ -73,6 +75,7 @@ class StupidBackoff(LanguageModel):
         super().__init__(*args, **kwargs)
         self.alpha = alpha
 
+    @_batch_cached
     def unmasked_score(self, word, context=None):
         if not context:
             # Base recursion
@@ -98,6 +101,19 @@ class InterpolatedLanguageModel(LanguageModel):
         super().__init__(order, **kwargs)
         self.estimator = smoothing_cls(self.vocab, self.counts, **params)
 
+    @contextmanager
+    def _batch(self):
+        if getattr(self, "_batch_cache", None) is not None:
+            yield
+            return
+        with super()._batch():
+            self.estimator._batch_cache = {}
+            try:
+                yield
+            finally:
+                self.estimator._batch_cache = None
+
+    @_batch_cached
     def unmasked_score(self, word, context=None):
         if not context:
             # The base recursion case: no context, we only have a unigram.
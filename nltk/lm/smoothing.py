@@ -10,9 +10,10 @@
 According to Chen & Goodman 1995 these should work with both Backoff and
 Interpolation.
 """
+from collections import Counter
 from operator import methodcaller
 
-from nltk.lm.api import Smoothing
+from nltk.lm.api import Smoothing, _batch_cached
 from nltk.probability import ConditionalFreqDist
 
 
@@ -44,6 +45,7 @@ class WittenBell(Smoothing):
         gamma = self._gamma(context)
         return (1.0 - gamma) * alpha, gamma
 
+    @_batch_cached
     def _gamma(self, context):
         n_plus = _count_values_gt_zero(self.counts[context])
         return n_plus / (n_plus + self.counts[context].N())
@@ -67,6 +69,7 @@ class AbsoluteDiscounting(Smoothing):
         gamma = self._gamma(context)
         return alpha, gamma
 
+    @_batch_cached
     def _gamma(self, context):
         n_plus = _count_values_gt_zero(self.counts[context])
         return (self.discount * n_plus) / self.counts[context].N()
@@ -105,9 +108,13 @@ class KneserNey(Smoothing):
             else self._continuation_counts(word, context)
         )
         alpha = max(word_continuation_count - self.discount, 0.0) / total_count
-        gamma = self.discount * _count_values_gt_zero(prefix_counts) / total_count
+        gamma = self.discount * self._n_plus(context) / total_count
         return alpha, gamma
 
+    @_batch_cached
+    def _n_plus(self, context):
+        return _count_values_gt_zero(self.counts[context])
+
     def _continuation_counts(self, word, context=tuple()):
         """Count continuations that end with context and word.
 
@@ -115,13 +122,21 @@ class KneserNey(Smoothing):
         instances were observed for each "type".
         This is different than raw ngram counts which track number of instances.
         """
+        continuations, total = self._continuation_table(context)
+        return continuations[word], total
+
+    @_batch_cached
+    def _continuation_table(self, context):
+        """Count continuations that end with context, for all words at once."""
         higher_order_ngrams_with_context = (
             counts
             for prefix_ngram, counts in self.counts[len(context) + 2].items()
             if prefix_ngram[1:] == context
         )
-        higher_order_ngrams_with_word_count, total = 0, 0
+        continuations, total = Counter(), 0
         for counts in higher_order_ngrams_with_context:
-            higher_order_ngrams_with_word_count += int(counts[word] > 0)
-            total += _count_values_gt_zero(counts)
-        return higher_order_ngrams_with_word_count, total
+            for word, count in counts.items():
+                if count > 0:
+                    continuations[word] += 1
+                    total += 1
+        return continuations, total
@@ -9,14 +9,40 @@
 Provides scoring functions for a number of association measures through a
 generic, abstract implementation in ``NgramAssocMeasures``, and n-specific
 ``BigramAssocMeasures`` and ``TrigramAssocMeasures``.
+
+Except for ``fisher``, the measures also accept ``numpy`` arrays of counts
+in place of each count, and then score many ngrams at once:
+
+    >>> import numpy as np
+    >>> from nltk.metrics import BigramAssocMeasures
+    >>> n_ii, n_ix, n_xi = np.array([2.0, 1.0]), np.array([4.0, 3.0]), np.array([2.0, 5.0])
+    >>> BigramAssocMeasures.pmi(n_ii, (n_ix, n_xi), 100).round(4)
+    array([4.6439, 2.737 ])
+    >>> [round(BigramAssocMeasures.pmi(2, (4, 2), 100), 4)]
+    [4.6439]
 """
 
 import math as _math
 from abc import ABCMeta, abstractmethod
 from functools import reduce
 
-_log2 = lambda x: _math.log2(x)
-_ln = _math.log
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _log2(x):
+    if np is not None and isinstance(x, np.ndarray):
+        return np.log2(x)
+    return _math.log2(x)
+
+
+def _ln(x):
+    if np is not None and isinstance(x, np.ndarray):
+        return np.log(x)
+    return _math.log(x)
+
 
 _product = lambda s: reduce(lambda x, y: x * y, s)
 
@@ -38,14 +38,25 @@ implementation of the ``ConditionalProbDistI`` interface is
 """
 
 import array
+import hashlib
+import heapq
+import json
 import math
+import operator
 import random
 import warnings
 from abc import ABCMeta, abstractmethod
 from collections import Counter, defaultdict
-from functools import reduce
+from collections.abc import Mapping, MutableMapping
+from functools import partial, reduce
 
 from nltk.internals import raise_unorderable_types
+from nltk.util import parallel_imap
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 _NINF = float("-1e300")
 
@@ -420,14 +431,14 @@ class FreqDist(Counter):
         >>> c <= d and d <= e and c <= e
         True
         """
-        if not isinstance(other, FreqDist):
+        if not isinstance(other, (FreqDist, CompactFreqDist)):
             raise_unorderable_types("<=", self, other)
         return set(self).issubset(other) and all(
             self[key] <= other[key] for key in self
         )
 
     def __ge__(self, other):
-        if not isinstance(other, FreqDist):
+        if not isinstance(other, (FreqDist, CompactFreqDist)):
             raise_unorderable_types(">=", self, other)
         return set(self).issuperset(other) and all(
             self[key] >= other[key] for key in other
@@ -485,6 +496,743 @@ class FreqDist(Counter):
             yield token
 
 
+class CompactFreqDist(MutableMapping):
+    """
+    A frequency distribution with the same interface as ``FreqDist``,
+    which stores the counts of its samples in a ``numpy`` array rather than
+    in a dictionary. Each sample is interned to an integer id, its index
+    in the array, so that many outcomes can be counted at once from an
+    array of ids, and the total number of outcomes is kept up to date.
+    ``most_common``, ``r_Nr``, ``Nr`` and ``hapaxes`` are computed on the
+    whole array at once.
+
+        >>> from nltk.probability import CompactFreqDist
+        >>> fdist = CompactFreqDist("abracadabra")
+        >>> fdist.most_common(2)
+        [('a', 5), ('b', 2)]
+        >>> fdist.N(), fdist.B(), fdist["r"], fdist.freq("c")
+        (11, 5, 2, 0.09090909090909091)
+        >>> ids = fdist.index(["a", "d", "z"])
+        >>> fdist.update_ids(ids, [10, 1, 3])
+        >>> fdist.most_common(3)
+        [('a', 15), ('z', 3), ('b', 2)]
+        >>> dict(fdist.r_Nr())
+        {1: 1, 2: 3, 3: 1, 15: 1, 0: 0}
+
+    Samples whose count is zero are not part of the distribution. The
+    ``ProbDistI`` estimators accept a ``CompactFreqDist`` wherever they
+    accept a ``FreqDist``.
+    """
+
+    def __init__(self, samples=None):
+        """
+        Construct a new frequency distribution.  If ``samples`` is
+        given, then the frequency distribution will be initialized
+        with the count of each object in ``samples``.
+
+        :param samples: The samples to initialize the frequency
+            distribution with, or a mapping from samples to their counts.
+        :type samples: Sequence or dict
+        """
+        if np is None:
+            raise ImportError("CompactFreqDist requires numpy to be installed.")
+        self._ids = {}
+        self._samples = []
+        self._counts = np.zeros(16, dtype=np.int64)
+        self._N = 0
+        if samples is not None:
+            self.update(samples)
+
+    def _intern(self, sample):
+        sample_id = self._ids.get(sample)
+        if sample_id is None:
+            sample_id = self._ids[sample] = len(self._samples)
+            self._samples.append(sample)
+            if sample_id == len(self._counts):
+                self._grow(sample_id + 1)
+        return sample_id
+
+    def _grow(self, size):
+        counts = np.zeros(max(size, 2 * len(self._counts)), dtype=np.int64)
+        counts[: len(self._counts)] = self._counts
+        self._counts = counts
+
+    def _used_counts(self):
+        return self._counts[: len(self._samples)]
+
+    def index(self, samples):
+        """
+        Return the ids of the given samples, assigning new ids to the
+        samples which have none yet, for use with ``update_ids``.
+
+        :param samples: The samples to look up
+        :type samples: iter
+        :rtype: numpy.ndarray
+        """
+        return np.fromiter(map(self._intern, samples), dtype=np.int64)
+
+    def sample(self, sample_id):
+        """
+        Return the sample with the given id.
+
+        :param sample_id: The id returned by ``index``
+        :type sample_id: int
+        """
+        return self._samples[sample_id]
+
+    def update_ids(self, ids, counts=None):
+        """
+        Add the outcomes given as an array of sample ids to the counts.
+
+        :param ids: The ids of the samples, as returned by ``index``
+        :type ids: numpy.ndarray or Sequence(int)
+        :param counts: The number of outcomes to add for each id, one by default
+        :type counts: numpy.ndarray or Sequence(int) or None
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if ids.size and (ids.min() < 0 or ids.max() >= len(self._samples)):
+            raise ValueError("Sample ids must be returned by CompactFreqDist.index()")
+        added = np.bincount(ids, weights=counts, minlength=len(self._samples)).astype(
+            np.int64
+        )
+        self._used_counts()[:] += added
+        self._N += int(added.sum())
+
+    def update(self, *args, **kwargs):
+        """
+        Add counts from an iterable of samples, or from a mapping of samples
+        to counts, as ``FreqDist.update`` does.
+        """
+        for samples in args + ((kwargs,) if kwargs else ()):
+            if samples is None:
+                continue
+            if isinstance(samples, Mapping):
+                self.update_ids(self.index(samples.keys()), list(samples.values()))
+            else:
+                self.update_ids(self.index(samples))
+
+    def N(self):
+        """
+        Return the total number of sample outcomes that have been
+        recorded by this frequency distribution.
+
+        :rtype: int
+        """
+        return self._N
+
+    def B(self):
+        """
+        Return the number of samples with a count other than zero.
+
+        :rtype: int
+        """
+        return int(np.count_nonzero(self._used_counts()))
+
+    def setdefault(self, sample, val):
+        """
+        Set the count of ``sample`` to ``val`` if it is not part of the
+        distribution, as ``FreqDist.setdefault`` does, and return its count.
+        """
+        count = self[sample]
+        if count:
+            return count
+        self[sample] = val
+        return val
+
+    def __getitem__(self, sample):
+        sample_id = self._ids.get(sample)
+        return 0 if sample_id is None else int(self._counts[sample_id])
+
+    def __setitem__(self, sample, count):
+        sample_id = self._intern(sample)
+        self._N += count - int(self._counts[sample_id])
+        self._counts[sample_id] = count
+
+    def __delitem__(self, sample):
+        if not self[sample]:
+            raise KeyError(sample)
+        self[sample] = 0
+
+    def __contains__(self, sample):
+        return self[sample] != 0
+
+    def __len__(self):
+        return self.B()
+
+    def __iter__(self):
+        """
+        Return an iterator which yields samples ordered by frequency.
+        """
+        return (sample for sample, _ in self.most_common())
+
+    def _present_ids(self):
+        return np.flatnonzero(self._used_counts())
+
+    def keys(self):
+        """Return the samples, in the order in which they were first counted."""
+        samples = self._samples
+        return [samples[i] for i in self._present_ids().tolist()]
+
+    def _counts_of(self, samples, fdist=None):
+        """
+        Return the counts of the given samples in ``fdist``, a frequency
+        distribution of any kind, or in this one by default, as an array.
+        """
+        if fdist is None:
+            fdist = self
+        return np.fromiter(
+            (fdist[sample] for sample in samples), dtype=np.int64, count=len(samples)
+        )
+
+    def values(self):
+        return self._used_counts()[self._present_ids()].tolist()
+
+    def items(self):
+        ids = self._present_ids()
+        samples = self._samples
+        return [
+            (samples[i], count)
+            for i, count in zip(ids.tolist(), self._counts[ids].tolist())
+        ]
+
+    def most_common(self, n=None):
+        """
+        Return the ``n`` samples with the highest counts and their counts,
+        most common first, breaking ties in the order in which the samples
+        were first counted, as ``FreqDist.most_common`` does. Only ``n``
+        samples are sorted.
+
+        :param n: The number of samples, all of them by default
+        :type n: int or None
+        :rtype: list(tuple)
+        """
+        ids = self._present_ids()
+        counts = self._counts[ids]
+        if n is not None and n < len(ids):
+            if n <= 0:
+                return []
+            # The n-th largest count, above which all samples are kept, and
+            # at which the first samples are kept
+            kth = np.partition(counts, len(counts) - n)[len(counts) - n]
+            above = counts > kth
+            ties = np.flatnonzero(counts == kth)[: n - int(above.sum())]
+            keep = np.concatenate([np.flatnonzero(above), ties])
+            keep.sort()
+            ids, counts = ids[keep], counts[keep]
+        order = np.argsort(-counts, kind="stable")
+        samples = self._samples
+        return [
+            (samples[i], count)
+            for i, count in zip(ids[order].tolist(), counts[order].tolist())
+        ]
+
+    def hapaxes(self):
+        """
+        Return a list of all samples that occur once (hapax legomena)
+
+        :rtype: list
+        """
+        samples = self._samples
+        return [samples[i] for i in np.flatnonzero(self._used_counts() == 1).tolist()]
+
+    def Nr(self, r, bins=None):
+        if r == 0:
+            return bins - self.B() if bins is not None else 0
+        return int(np.count_nonzero(self._used_counts() == r))
+
+    def r_Nr(self, bins=None):
+        """
+        Return the dictionary mapping r to Nr, the number of samples with
+        frequency r, as ``FreqDist.r_Nr`` does.
+
+        :type bins: int
+        :param bins: The number of possible sample outcomes, used to
+            calculate Nr(0).
+        :rtype: dict
+        """
+        counts = self._used_counts()
+        r, nr = np.unique(counts[counts != 0], return_counts=True)
+        _r_Nr = defaultdict(int, zip(r.tolist(), nr.tolist()))
+        _r_Nr[0] = bins - self.B() if bins is not None else 0
+        return _r_Nr
+
+    freq = FreqDist.freq
+    max = FreqDist.max
+    plot = FreqDist.plot
+    tabulate = FreqDist.tabulate
+    pprint = FreqDist.pprint
+    _cumulative_frequencies = FreqDist._cumulative_frequencies
+
+    def copy(self):
+        """
+        Create a copy of this frequency distribution.
+
+        :rtype: CompactFreqDist
+        """
+        fdist = self.__class__()
+        fdist._ids = dict(self._ids)
+        fdist._samples = list(self._samples)
+        fdist._counts = self._counts.copy()
+        fdist._N = self._N
+        return fdist
+
+    def __add__(self, other):
+        """
+        Add counts from two frequency distributions.
+
+        >>> CompactFreqDist('abbb') + CompactFreqDist('bcc')
+        CompactFreqDist({'b': 4, 'c': 2, 'a': 1})
+        """
+        fdist = self.copy()
+        fdist.update(other)
+        return fdist
+
+    def _positive(self, samples, counts):
+        """
+        Return a new frequency distribution of the given samples which
+        have a positive count.
+        """
+        keep = counts > 0
+        fdist = self.__class__()
+        ids = fdist.index(sample for sample, kept in zip(samples, keep) if kept)
+        fdist.update_ids(ids, counts[keep])
+        return fdist
+
+    def __sub__(self, other):
+        """
+        Subtract count, but keep only results with positive counts.
+
+        >>> CompactFreqDist('abbbc') - CompactFreqDist('bccd')
+        CompactFreqDist({'b': 2, 'a': 1})
+        """
+        samples = self.keys()
+        counts = self._counts_of(samples) - self._counts_of(samples, other)
+        return self._positive(samples, counts)
+
+    def __or__(self, other):
+        """
+        Union is the maximum of value in either of the input counters.
+
+        >>> CompactFreqDist('abbb') | CompactFreqDist('bcc')
+        CompactFreqDist({'b': 3, 'c': 2, 'a': 1})
+        """
+        samples = self.keys()
+        samples += [sample for sample in other.keys() if sample not in self]
+        counts = np.maximum(self._counts_of(samples), self._counts_of(samples, other))
+        return self._positive(samples, counts)
+
+    def __and__(self, other):
+        """
+        Intersection is the minimum of corresponding counts.
+
+        >>> CompactFreqDist('abbb') & CompactFreqDist('bcc')
+        CompactFreqDist({'b': 1})
+        """
+        samples = self.keys()
+        counts = np.minimum(self._counts_of(samples), self._counts_of(samples, other))
+        return self._positive(samples, counts)
+
+    def __le__(self, other):
+        """
+        Returns True if this frequency distribution is a subset of the other
+        and for no key the value exceeds the value of the same key from
+        the other frequency distribution, as ``FreqDist.__le__`` does.
+
+        >>> CompactFreqDist('abc') <= CompactFreqDist('aabcd')
+        True
+        >>> CompactFreqDist('abc') <= CompactFreqDist('xyz')
+        False
+        """
+        if not isinstance(other, (FreqDist, CompactFreqDist)):
+            raise_unorderable_types("<=", self, other)
+        samples = self.keys()
+        return bool(np.all(self._counts_of(samples) <= self._counts_of(samples, other)))
+
+    def __ge__(self, other):
+        if not isinstance(other, (FreqDist, CompactFreqDist)):
+            raise_unorderable_types(">=", self, other)
+        samples = list(other.keys())
+        return bool(np.all(self._counts_of(samples) >= self._counts_of(samples, other)))
+
+    __lt__ = lambda self, other: self <= other and not self == other
+    __gt__ = lambda self, other: self >= other and not self == other
+
+    def __repr__(self):
+        return self.pformat()
+
+    def pformat(self, maxlen=10):
+        """
+        Return a string representation of this frequency distribution.
+
+        :param maxlen: The maximum number of items to display
+        :type maxlen: int
+        :rtype: string
+        """
+        items = ["{!r}: {!r}".format(*item) for item in self.most_common(maxlen)]
+        if len(self) > maxlen:
+            items.append("...")
+        return "{}({{{}}})".format(self.__class__.__name__, ", ".join(items))
+
+    def __str__(self):
+        return "<%s with %d samples and %d outcomes>" % (
+            self.__class__.__name__,
+            len(self),
+            self.N(),
+        )
+
+
+class CountMinSketch:
+    """
+    An approximate frequency distribution, which counts its samples in
+    a fixed amount of memory however many distinct samples there are.
+    Each sample is hashed to one counter in each of ``depth`` rows of
+    ``width`` counters, and its count is estimated as the smallest of
+    these counters (Cormode and Muthukrishnan, 2005). Estimates are never
+    too low and, with probability ``1 - delta``, exceed the true count by
+    at most ``epsilon * N()``.
+
+        >>> from nltk.probability import CountMinSketch
+        >>> sketch = CountMinSketch(epsilon=0.01, delta=0.01)
+        >>> sketch.update("abracadabra")
+        >>> sketch["a"], sketch["z"], sketch.N()
+        (5, 0, 11)
+
+    The samples are hashed from their ``repr``, so sketches of the same
+    shape built in different processes can be merged by adding their
+    counters, as long as the ``repr`` of the samples is deterministic, as
+    it is for strings, numbers and tuples of them. The samples
+    themselves are not stored, so a sketch cannot be iterated over.
+
+        >>> other = CountMinSketch(epsilon=0.01, delta=0.01)
+        >>> other.update({"a": 10, "c": 1})
+        >>> sketch.update(other)
+        >>> sketch["a"], sketch["c"], sketch.N()
+        (15, 2, 22)
+
+    :param epsilon: The bound on the overestimation of the counts, relative
+        to the total number of outcomes
+    :type epsilon: float
+    :param delta: The probability that an estimate exceeds this bound
+    :type delta: float
+    """
+
+    def __init__(self, epsilon=1e-5, delta=0.01):
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = max(1, math.ceil(math.log(1 / delta)))
+        self._rows = [
+            array.array("q", bytes(8 * self.width)) for _ in range(self.depth)
+        ]
+        self._N = 0
+
+    def _cells(self, sample):
+        digest = hashlib.blake2b(repr(sample).encode("utf8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        width = self.width
+        return [(h1 + i * h2) % width for i in range(self.depth)]
+
+    def add(self, sample, count=1):
+        """
+        Record ``count`` more outcomes of ``sample``.
+
+        :type count: int
+        """
+        for row, cell in zip(self._rows, self._cells(sample)):
+            row[cell] += count
+        self._N += count
+
+    def update(self, samples):
+        """
+        Record the outcomes of ``samples``, which may be an iterable of
+        samples, a mapping from samples to their counts, or another sketch
+        of the same width and depth.
+        """
+        if isinstance(samples, CountMinSketch):
+            self.merge(samples)
+        elif isinstance(samples, Mapping):
+            for sample, count in samples.items():
+                self.add(sample, count)
+        else:
+            for sample in samples:
+                self.add(sample)
+
+    def merge(self, other):
+        """
+        Add the counts of another sketch of the same width and depth.
+
+        :type other: CountMinSketch
+        """
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Only sketches of the same width and depth can be merged")
+        for i, (row, other_row) in enumerate(zip(self._rows, other._rows)):
+            self._rows[i] = array.array("q", map(operator.add, row, other_row))
+        self._N += other._N
+
+    def __getitem__(self, sample):
+        return min(row[cell] for row, cell in zip(self._rows, self._cells(sample)))
+
+    def __iter__(self):
+        raise TypeError(f"{self.__class__.__name__} does not store its samples")
+
+    def N(self):
+        """
+        Return the total number of sample outcomes that have been
+        recorded by this sketch.
+
+        :rtype: int
+        """
+        return self._N
+
+    def freq(self, sample):
+        """
+        Return the estimated frequency of ``sample``.
+
+        :rtype: float
+        """
+        return self[sample] / self._N if self._N else 0
+
+    def copy(self):
+        """
+        Create a copy of this sketch.
+
+        :rtype: CountMinSketch
+        """
+        sketch = self.__class__.__new__(self.__class__)
+        sketch.width, sketch.depth, sketch._N = self.width, self.depth, self._N
+        sketch._rows = [array.array("q", row) for row in self._rows]
+        return sketch
+
+    def __repr__(self):
+        return "<%s of %dx%d counters with %d outcomes>" % (
+            self.__class__.__name__,
+            self.depth,
+            self.width,
+            self._N,
+        )
+
+
+class SpaceSavingCounter(Mapping):
+    """
+    An approximate frequency distribution of the most frequent samples,
+    which monitors at most ``capacity`` samples (Metwally et al., 2005).
+    When a sample which is not monitored occurs and all the slots are
+    taken, it replaces the sample with the smallest count, and inherits
+    that count as its possible error. Any sample occurring more than
+    ``N() / capacity`` times is therefore monitored.
+
+    The count of a monitored sample is the number of its outcomes which
+    are certain, and is never higher than its true count, which is at most
+    its count plus its ``error``. Samples which are not monitored have a
+    count of zero.
+
+        >>> from nltk.probability import SpaceSavingCounter
+        >>> counter = SpaceSavingCounter(2)
+        >>> counter.update("aababca")
+        >>> counter.most_common()
+        [('a', 4), ('c', 1)]
+        >>> counter.error("c"), counter.N()
+        (2, 7)
+
+    Counters built separately, e.g. in different processes, can be merged
+    with the bounds on their counts preserved (Agarwal et al., 2012).
+
+        >>> other = SpaceSavingCounter(2)
+        >>> other.update("aaab")
+        >>> counter.update(other)
+        >>> counter.most_common(), counter.N()
+        ([('a', 7), ('c', 1)], 11)
+
+    :param capacity: The largest number of samples to monitor
+    :type capacity: int
+    """
+
+    def __init__(self, capacity=100000):
+        if capacity < 1:
+            raise ValueError("The capacity must be at least 1")
+        self.capacity = capacity
+        # Map each monitored sample to its [count, error]; the count
+        # includes the error, i.e. it is an upper bound
+        self._counts = {}
+        # A min-heap of (count, tiebreak, sample), with one entry per
+        # monitored sample whose count may be out of date: counts only
+        # grow, so stale entries are refreshed as they reach the top
+        self._heap = []
+        self._pushed = 0
+        self._N = 0
+
+    def _push(self, sample, count):
+        heapq.heappush(self._heap, (count, self._pushed, sample))
+        self._pushed += 1
+
+    def _pop_min(self):
+        """Stop monitoring the sample with the smallest count, and return
+        that count."""
+        heap, counts = self._heap, self._counts
+        while True:
+            count, _, sample = heapq.heappop(heap)
+            entry = counts.get(sample)
+            if entry is None:
+                continue
+            if entry[0] == count:
+                del counts[sample]
+                return count
+            self._push(sample, entry[0])
+
+    def _min_count(self):
+        """The smallest count that any sample may have, which is the count
+        of all the samples which are not monitored."""
+        if len(self._counts) < self.capacity:
+            return 0
+        heap, counts = self._heap, self._counts
+        while True:
+            count, _, sample = heap[0]
+            entry = counts.get(sample)
+            if entry is not None and entry[0] == count:
+                return count
+            heapq.heappop(heap)
+            if entry is not None:
+                self._push(sample, entry[0])
+
+    def add(self, sample, count=1):
+        """
+        Record ``count`` more outcomes of ``sample``.
+
+        :type count: int
+        """
+        entry = self._counts.get(sample)
+        if entry is not None:
+            entry[0] += count
+        else:
+            error = self._pop_min() if len(self._counts) >= self.capacity else 0
+            self._counts[sample] = [error + count, error]
+            self._push(sample, error + count)
+        self._N += count
+
+    def update(self, samples):
+        """
+        Record the outcomes of ``samples``, which may be an iterable of
+        samples, a mapping from samples to their counts, or another
+        ``SpaceSavingCounter``.
+        """
+        if isinstance(samples, SpaceSavingCounter):
+            self.merge(samples)
+        elif isinstance(samples, Mapping):
+            for sample, count in samples.items():
+                self.add(sample, count)
+        else:
+            for sample in samples:
+                self.add(sample)
+
+    def merge(self, other):
+        """
+        Add the counts of another ``SpaceSavingCounter``. A sample which
+        is not monitored by one of the counters may have occurred as often
+        as the smallest count of that counter, which is added to both its
+        count and its error. The ``capacity`` samples with the highest
+        counts are kept.
+
+        :type other: SpaceSavingCounter
+        """
+        self_min, other_min = self._min_count(), other._min_count()
+        merged = {}
+        new = [sample for sample in other._counts if sample not in self._counts]
+        for sample in [*self._counts, *new]:
+            count, error = self._counts.get(sample, (self_min, self_min))
+            other_count, other_error = other._counts.get(sample, (other_min, other_min))
+            merged[sample] = [count + other_count, error + other_error]
+        if len(merged) > self.capacity:
+            kept = heapq.nlargest(
+                self.capacity, merged.items(), key=lambda item: item[1][0]
+            )
+            merged = dict(kept)
+        self._counts = merged
+        self._heap = []
+        for sample, (count, _) in merged.items():
+            self._push(sample, count)
+        self._N += other._N
+
+    def error(self, sample):
+        """
+        Return the largest number of outcomes of ``sample`` which may have
+        been missed, i.e. the difference between the upper bound of its
+        true count and its count. For samples which are not monitored,
+        this is the smallest count of the monitored samples.
+
+        :rtype: int
+        """
+        entry = self._counts.get(sample)
+        return entry[1] if entry is not None else self._min_count()
+
+    def __getitem__(self, sample):
+        entry = self._counts.get(sample)
+        return entry[0] - entry[1] if entry is not None else 0
+
+    def __delitem__(self, sample):
+        del self._counts[sample]
+
+    def __contains__(self, sample):
+        return sample in self._counts
+
+    def __iter__(self):
+        return iter(self._counts)
+
+    def __len__(self):
+        return len(self._counts)
+
+    def N(self):
+        """
+        Return the total number of sample outcomes that have been
+        recorded, including those of the samples no longer monitored.
+
+        :rtype: int
+        """
+        return self._N
+
+    def freq(self, sample):
+        """
+        Return the frequency of ``sample``, from its certain count.
+
+        :rtype: float
+        """
+        return self[sample] / self._N if self._N else 0
+
+    def most_common(self, n=None):
+        """
+        Return the ``n`` monitored samples with the highest counts, and
+        their counts, from the most common to the least common.
+
+        :rtype: list(tuple)
+        """
+        items = [
+            (sample, count - error) for sample, (count, error) in self._counts.items()
+        ]
+        if n is None:
+            return sorted(items, key=lambda item: item[1], reverse=True)
+        return heapq.nlargest(n, items, key=lambda item: item[1])
+
+    def copy(self):
+        """
+        Create a copy of this counter.
+
+        :rtype: SpaceSavingCounter
+        """
+        counter = self.__class__(self.capacity)
+        counter._counts = {
+            sample: list(entry) for sample, entry in self._counts.items()
+        }
+        counter._heap = list(self._heap)
+        counter._pushed, counter._N = self._pushed, self._N
+        return counter
+
+    def __repr__(self):
+        return "<%s monitoring %d of at most %d samples, with %d outcomes>" % (
+            self.__class__.__name__,
+            len(self),
+            self.capacity,
+            self._N,
+        )
+
+
 ##//////////////////////////////////////////////////////
 ##  Probability Distributions
 ##//////////////////////////////////////////////////////
@@ -1392,19 +2140,68 @@ class SimpleGoodTuringProbDist(ProbDistI):
         assert (
             bins is None or bins > freqdist.B()
         ), "bins parameter must not be less than %d=freqdist.B()+1" % (freqdist.B() + 1)
-        if bins is None:
-            bins = freqdist.B() + 1
         self._freqdist = freqdist
-        self._bins = bins
+        self._default_bins = bins is None
+        self._bins = freqdist.B() + 1 if bins is None else bins
+        # The number of samples with each count, maintained by ``update``
+        self._count_Nr = freqdist.r_Nr()
+        del self._count_Nr[0]
+        self._fit()
+
+    def _fit(self):
+        """
+        Fit the smoothing parameters to the counts of counts, and tabulate
+        the probability of a sample for each count which occurs.
+        """
         r, nr = self._r_Nr()
         self.find_best_fit(r, nr)
         self._switch(r, nr)
         self._renormalize(r, nr)
+        self._prob_table = {r_: self._prob_measure(r_) * self._renormal for r_ in r}
+
+    def update(self, samples):
+        """
+        Add samples to the underlying frequency distribution, and refit the
+        smoothing. Only the counts of counts of the added samples are
+        recomputed, so the cost of an update does not grow with the number
+        of samples already seen. The frequency distribution should only be
+        modified through this method once the ``ProbDist`` is built.
+
+            >>> from nltk.probability import FreqDist, SimpleGoodTuringProbDist
+            >>> fd = FreqDist("abracadabra")
+            >>> sgt = SimpleGoodTuringProbDist(fd)
+            >>> sgt.update("cadabra")
+            >>> sgt.prob("a") == SimpleGoodTuringProbDist(fd).prob("a")
+            True
+
+        :param samples: The samples to add, or a mapping from samples to
+            the number of times to add them, as for ``FreqDist.update``
+        :type samples: iter or dict
+        """
+        increments = samples if isinstance(samples, Mapping) else Counter(samples)
+        count_Nr = self._count_Nr
+        for sample, increment in increments.items():
+            if not increment:
+                continue
+            count = self._freqdist[sample]
+            if count:
+                count_Nr[count] -= 1
+                if not count_Nr[count]:
+                    del count_Nr[count]
+            count_Nr[count + increment] += 1
+        self._freqdist.update(increments)
+
+        if self._default_bins:
+            self._bins = self._freqdist.B() + 1
+        assert (
+            self._bins > self._freqdist.B()
+        ), "bins parameter must not be less than %d=freqdist.B()+1" % (
+            self._freqdist.B() + 1
+        )
+        self._fit()
 
     def _r_Nr_non_zero(self):
-        r_Nr = self._freqdist.r_Nr()
-        del r_Nr[0]
-        return r_Nr
+        return self._count_Nr
 
     def _r_Nr(self):
         """
@@ -1522,6 +2319,8 @@ class SimpleGoodTuringProbDist(ProbDistI):
         :rtype: float
         """
         count = self._freqdist[sample]
+        if count in self._prob_table:
+            return self._prob_table[count]
         p = self._prob_measure(count)
         if count == 0:
             if self._bins == self._freqdist.B():
@@ -1536,11 +2335,11 @@ class SimpleGoodTuringProbDist(ProbDistI):
         if count == 0 and self._freqdist.N() == 0:
             return 1.0
         elif count == 0 and self._freqdist.N() != 0:
-            return self._freqdist.Nr(1) / self._freqdist.N()
+            return self._count_Nr.get(1, 0) / self._freqdist.N()
 
         if self._switch_at > count:
-            Er_1 = self._freqdist.Nr(count + 1)
-            Er = self._freqdist.Nr(count)
+            Er_1 = self._count_Nr.get(count + 1, 0)
+            Er = self._count_Nr.get(count, 0)
         else:
             Er_1 = self.smoothedNr(count + 1)
             Er = self.smoothedNr(count)
@@ -1919,6 +2718,73 @@ class ConditionalFreqDist(defaultdict):
         """
         return sum(fdist.N() for fdist in self.values())
 
+    def merge(self, other):
+        """
+        Add the counts of another conditional frequency distribution to
+        this one. Merging is associative and commutative, so the counts of
+        separate parts of a corpus can be merged in any grouping.
+
+            >>> from nltk.probability import ConditionalFreqDist
+            >>> cfd = ConditionalFreqDist([(1, "a"), (2, "bb")])
+            >>> cfd.merge(ConditionalFreqDist([(1, "a"), (1, "c")]))
+            >>> cfd[1]
+            FreqDist({'a': 2, 'c': 1})
+
+        :param other: The counts to add
+        :type other: ConditionalFreqDist
+        """
+        for cond, fdist in other.items():
+            self[cond].update(fdist)
+
+    @classmethod
+    def from_shards(cls, shards, func=None, processes=1):
+        """
+        Build a conditional frequency distribution from shards of a corpus,
+        counting each shard in one of ``processes`` worker processes and
+        merging the results.
+
+        Each shard is either an iterable of ``(condition, sample)`` pairs,
+        or is turned into one by ``func``. Shards and ``func`` are sent to
+        the workers, so with ``processes > 1`` they must be picklable, e.g.
+        file identifiers and a module-level function which reads the
+        corresponding file, rather than open corpus views.
+
+            >>> from nltk.probability import ConditionalFreqDist
+            >>> from nltk.util import bigrams
+            >>> shards = [["the", "cat", "sat"], ["the", "dog"]]
+            >>> cfd = ConditionalFreqDist.from_shards(shards, bigrams, processes=2)
+            >>> cfd["the"]
+            FreqDist({'cat': 1, 'dog': 1})
+
+        :param shards: The shards of the corpus
+        :type shards: iter
+        :param func: Function turning a shard into ``(condition, sample)`` pairs
+        :type func: callable or None
+        :param processes: The number of worker processes
+        :type processes: int
+        :rtype: ConditionalFreqDist
+        """
+        result = cls()
+        for cfd in parallel_imap(
+            partial(_cfd_from_shard, cls, func), shards, processes, chunksize=1
+        ):
+            result.merge(cfd)
+        return result
+
+    def save_mmap(self, path):
+        """
+        Save this conditional frequency distribution to ``path`` in a
+        compact binary format, which ``MappedConditionalFreqDist`` reads
+        through a memory map without loading it. Conditions and samples
+        must be strings, numbers, booleans, None, or tuples of those.
+
+        :param path: The path of the file to write
+        :type path: str
+        """
+        if np is None:
+            raise ImportError("save_mmap requires numpy to be installed.")
+        _write_cfd_mmap(path, self)
+
     def plot(
         self,
         *args,
@@ -2140,6 +3006,271 @@ class ConditionalFreqDist(defaultdict):
         return "<ConditionalFreqDist with %d conditions>" % len(self)
 
 
+def _cfd_from_shard(cls, func, shard):
+    """Count one shard, in a worker of ``ConditionalFreqDist.from_shards``."""
+    return cls(func(shard) if func is not None else shard)
+
+
+CFD_MMAP_MAGIC = b"NLTKCF\x00\x01"
+
+
+def _align(offset, alignment):
+    return -(-offset // alignment) * alignment
+
+
+def _encode_key(key):
+    return json.dumps(key, ensure_ascii=False).encode("utf8")
+
+
+def _decode_key(data):
+    return _tuplify(json.loads(data.decode("utf8")))
+
+
+def _tuplify(obj):
+    return tuple(map(_tuplify, obj)) if isinstance(obj, list) else obj
+
+
+def _encode_keys(encoded):
+    """Return the byte offsets and the concatenation of encoded keys."""
+    offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(key) for key in encoded], out=offsets[1:])
+    return offsets, b"".join(encoded)
+
+
+def _write_cfd_mmap(path, cfd):
+    """
+    Write ``cfd`` to ``path`` as: the magic bytes, the length of a JSON
+    header followed by the header itself, and the sections it lists,
+    aligned to 64 bytes. The conditions and the samples are sorted by
+    their JSON encoding, and stored as byte offsets followed by the
+    concatenated encodings. The counts are stored row by row, one row per
+    condition, as sorted sample ids and their counts.
+    """
+    samples = {sample for fdist in cfd.values() for sample in fdist}
+    encoded_samples = sorted((_encode_key(sample), sample) for sample in samples)
+    sample_ids = {sample: i for i, (_, sample) in enumerate(encoded_samples)}
+    encoded_conds = sorted((_encode_key(cond), cond) for cond in cfd)
+
+    indptr = np.zeros(len(encoded_conds) + 1, dtype="<u8")
+    row_N = np.zeros(len(encoded_conds), dtype="<i8")
+    rows = []
+    for i, (_, cond) in enumerate(encoded_conds):
+        fdist = cfd[cond]
+        ids = np.fromiter((sample_ids[s] for s in fdist), dtype="<u4", count=len(fdist))
+        counts = np.fromiter(fdist.values(), dtype="<i8", count=len(fdist))
+        order = np.argsort(ids)
+        rows.append((ids[order], counts[order]))
+        indptr[i + 1] = indptr[i] + len(ids)
+        row_N[i] = fdist.N()
+
+    def concatenate(arrays, dtype):
+        return np.concatenate(arrays).astype(dtype) if arrays else np.zeros(0, dtype)
+
+    cond_offsets, cond_blob = _encode_keys([key for key, _ in encoded_conds])
+    sample_offsets, sample_blob = _encode_keys([key for key, _ in encoded_samples])
+    sections = [
+        ("cond_offsets", cond_offsets),
+        ("cond_blob", np.frombuffer(cond_blob, dtype="u1")),
+        ("sample_offsets", sample_offsets),
+        ("sample_blob", np.frombuffer(sample_blob, dtype="u1")),
+        ("indptr", indptr),
+        ("row_N", row_N),
+        ("ids", concatenate([ids for ids, _ in rows], "<u4")),
+        ("counts", concatenate([counts for _, counts in rows], "<i8")),
+    ]
+    layout, offset = {}, 0
+    for name, array in sections:
+        layout[name] = [offset, array.dtype.str, len(array)]
+        offset = _align(offset + array.nbytes, 64)
+    header = json.dumps({"sections": layout}).encode("utf8")
+
+    with open(path, "wb") as fout:
+        fout.write(CFD_MMAP_MAGIC)
+        fout.write(len(header).to_bytes(8, "little"))
+        fout.write(header)
+        start = _align(fout.tell(), 64)
+        for name, array in sections:
+            fout.write(b"\0" * (start + layout[name][0] - fout.tell()))
+            fout.write(array.tobytes())
+
+
+class MappedConditionalFreqDist(Mapping):
+    """
+    A read-only conditional frequency distribution, memory-mapped from a
+    file written by ``ConditionalFreqDist.save_mmap``. Only the parts of
+    the file needed to answer a query are read, so huge distributions can
+    be opened instantly and shared between processes.
+
+        >>> import os, tempfile
+        >>> from nltk.probability import ConditionalFreqDist, MappedConditionalFreqDist
+        >>> cfd = ConditionalFreqDist([("a", "x"), ("a", "y"), ("a", "x"), ("b", "x")])
+        >>> path = os.path.join(tempfile.mkdtemp(), "cfd.bin")
+        >>> cfd.save_mmap(path)
+        >>> mapped = MappedConditionalFreqDist(path)
+        >>> mapped.conditions(), mapped.N()
+        (['a', 'b'], 4)
+        >>> mapped["a"]["x"], mapped["a"].freq("y"), mapped["c"]["x"]
+        (2, 0.3333333333333333, 0)
+        >>> mapped["a"].most_common()
+        [('x', 2), ('y', 1)]
+
+    :param path: The path of the file
+    :type path: str
+    """
+
+    def __init__(self, path):
+        if np is None:
+            raise ImportError(
+                "MappedConditionalFreqDist requires numpy to be installed."
+            )
+        with open(path, "rb") as fin:
+            if fin.read(len(CFD_MMAP_MAGIC)) != CFD_MMAP_MAGIC:
+                raise ValueError(
+                    f"{path} is not a memory-mappable conditional frequency distribution"
+                )
+            header = json.loads(fin.read(int.from_bytes(fin.read(8), "little")))
+            start = _align(fin.tell(), 64)
+        raw = np.memmap(path, dtype="u1", mode="r")
+        for name, (offset, dtype, length) in header["sections"].items():
+            dtype = np.dtype(dtype)
+            begin = start + offset
+            section = raw[begin : begin + length * dtype.itemsize].view(dtype)
+            setattr(self, "_" + name, section)
+
+    def _find(self, offsets, blob, key):
+        """Return the index of ``key`` in sorted encoded keys, or None."""
+        key = _encode_key(key)
+        lo, hi = 0, len(offsets) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if blob[int(offsets[mid]) : int(offsets[mid + 1])].tobytes() < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if (
+            lo < len(offsets) - 1
+            and blob[int(offsets[lo]) : int(offsets[lo + 1])].tobytes() == key
+        ):
+            return lo
+        return None
+
+    def _key(self, offsets, blob, index):
+        return _decode_key(
+            blob[int(offsets[index]) : int(offsets[index + 1])].tobytes()
+        )
+
+    def _sample_id(self, sample):
+        try:
+            return self._find(self._sample_offsets, self._sample_blob, sample)
+        except TypeError:
+            return None
+
+    def _sample(self, sample_id):
+        return self._key(self._sample_offsets, self._sample_blob, sample_id)
+
+    def _row(self, index):
+        start, end = int(self._indptr[index]), int(self._indptr[index + 1])
+        return _MappedFreqDist(
+            self, self._ids[start:end], self._counts[start:end], int(self._row_N[index])
+        )
+
+    def _condition_index(self, condition):
+        try:
+            return self._find(self._cond_offsets, self._cond_blob, condition)
+        except TypeError:
+            return None
+
+    def __getitem__(self, condition):
+        index = self._condition_index(condition)
+        if index is None:
+            empty = np.zeros(0, dtype="<i8")
+            return _MappedFreqDist(self, empty, empty, 0)
+        return self._row(index)
+
+    def __contains__(self, condition):
+        return self._condition_index(condition) is not None
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._key(self._cond_offsets, self._cond_blob, index)
+
+    def __len__(self):
+        return len(self._row_N)
+
+    def conditions(self):
+        """
+        Return a list of the conditions, sorted by their encoding.
+
+        :rtype: list
+        """
+        return list(self)
+
+    def N(self):
+        """
+        Return the total number of sample outcomes.
+
+        :rtype: int
+        """
+        return int(self._row_N.sum())
+
+    def __repr__(self):
+        return "<%s with %d conditions>" % (self.__class__.__name__, len(self))
+
+
+class _MappedFreqDist(Mapping):
+    """
+    A read-only ``FreqDist``-like view of one condition of a
+    ``MappedConditionalFreqDist``.
+    """
+
+    def __init__(self, owner, ids, counts, N):
+        self._owner = owner
+        self._ids = ids
+        self._counts = counts
+        self._N = N
+
+    def __getitem__(self, sample):
+        sample_id = self._owner._sample_id(sample)
+        if sample_id is None:
+            return 0
+        index = int(np.searchsorted(self._ids, sample_id))
+        if index < len(self._ids) and self._ids[index] == sample_id:
+            return int(self._counts[index])
+        return 0
+
+    def __contains__(self, sample):
+        return self[sample] != 0
+
+    def __iter__(self):
+        return (self._owner._sample(i) for i in self._ids.tolist())
+
+    def __len__(self):
+        return len(self._ids)
+
+    def N(self):
+        return self._N
+
+    def B(self):
+        return len(self._ids)
+
+    def most_common(self, n=None):
+        order = np.argsort(-self._counts, kind="stable")[:n]
+        return [
+            (self._owner._sample(i), count)
+            for i, count in zip(self._ids[order].tolist(), self._counts[order].tolist())
+        ]
+
+    freq = FreqDist.freq
+    max = FreqDist.max
+
+    def __repr__(self):
+        return "<%s with %d samples and %d outcomes>" % (
+            self.__class__.__name__,
+            self.B(),
+            self.N(),
+        )
+
+
 class ConditionalProbDistI(dict, metaclass=ABCMeta):
     """
     A collection of probability distributions for a single experiment
@@ -2559,6 +3690,10 @@ __all__ = [
     "DictionaryProbDist",
     "ELEProbDist",
     "FreqDist",
+    "CompactFreqDist",
+    "CountMinSketch",
+    "SpaceSavingCounter",
+    "MappedConditionalFreqDist",
     "SimpleGoodTuringProbDist",
     "HeldoutProbDist",
     "ImmutableProbabilisticMixIn",
@@ -65,6 +65,8 @@ For more information, please consult chapter 5 of the NLTK Book.
 isort:skip_file
 """
 
+import threading
+
 from nltk.tag.api import TaggerI
 from nltk.tag.util import str2tuple, tuple2str, untag
 from nltk.tag.sequential import (
@@ -97,8 +99,13 @@ RUS_PICKLE = (
     "taggers/averaged_perceptron_tagger_ru/averaged_perceptron_tagger_ru.pickle"
 )
 
+# Process-wide registry of the taggers used by pos_tag and pos_tag_sents,
+# keyed by language, so each model is only located and loaded once.
+_taggers = {}
+_taggers_lock = threading.Lock()
 
-def _get_tagger(lang=None):
+
+def _load_tagger(lang):
     if lang == "rus":
         tagger = PerceptronTagger(False)
         ap_russian_model_loc = "file:" + str(find(RUS_PICKLE))
@@ -108,6 +115,50 @@ def _get_tagger(lang=None):
     return tagger
 
 
+def _get_tagger(lang=None):
+    lang = "rus" if lang == "rus" else "eng"
+    tagger = _taggers.get(lang)
+    if tagger is None:
+        with _taggers_lock:
+            # Another thread may have loaded the tagger while we waited
+            tagger = _taggers.get(lang)
+            if tagger is None:
+                tagger = _taggers[lang] = _load_tagger(lang)
+    return tagger
+
+
+def warm_up_tagger(lang="eng"):
+    """
+    Load the tagger used by ``pos_tag`` and ``pos_tag_sents`` for the given
+    language, unless it has already been loaded. This allows e.g. a server
+    to pay the cost of loading the model at startup rather than on the first
+    request. The tagger is shared by all threads of the process.
+
+    :param lang: the ISO 639 code of the language, e.g. 'eng' for English, 'rus' for Russian
+    :type lang: str
+    :return: The loaded tagger
+    :rtype: PerceptronTagger
+    """
+    return _get_tagger(lang)
+
+
+def evict_tagger(lang=None):
+    """
+    Remove a tagger loaded by ``pos_tag``, ``pos_tag_sents`` or
+    ``warm_up_tagger`` from the registry, such that the next call reloads it,
+    e.g. after the model in ``nltk_data`` has been updated.
+
+    :param lang: the ISO 639 code of the language whose tagger should be
+        evicted, or None to evict the taggers of all languages
+    :type lang: str
+    """
+    with _taggers_lock:
+        if lang is None:
+            _taggers.clear()
+        else:
+            _taggers.pop("rus" if lang == "rus" else "eng", None)
+
+
 def _pos_tag(tokens, tagset=None, tagger=None, lang=None):
     # Currently only supports English and Russian.
     if lang not in ["eng", "rus"]:
@@ -152,6 +203,8 @@ def pos_tag(tokens, tagset=None, lang="eng"):
         ("n't", 'ADV'), ('all', 'DET'), ('that', 'DET'), ('bad', 'ADJ'), ('.', '.')]
 
     NB. Use `pos_tag_sents()` for efficient tagging of more than one sentence.
+    The tagger is loaded on the first call for each language, and reused
+    afterwards; see `warm_up_tagger()` and `evict_tagger()`.
 
     :param tokens: Sequence of tokens to be tagged
     :type tokens: list(str)
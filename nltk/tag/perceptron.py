@@ -8,10 +8,14 @@
 #
 # This module is provided under the terms of the MIT License.
 
+import json
 import logging
+import multiprocessing
 import pickle
 import random
+import time
 from collections import defaultdict
+from collections.abc import Mapping
 
 from nltk import jsontags
 from nltk.data import find, load
@@ -20,10 +24,13 @@ from nltk.tag.api import TaggerI
 try:
     import numpy as np
 except ImportError:
-    pass
+    np = None
 
 PICKLE = "averaged_perceptron_tagger.pickle"
 
+# Magic bytes identifying the memory-mappable model format of ``save_mmap``
+MMAP_MAGIC = b"NLTKAP\x00\x01"
+
 
 @jsontags.register_tag
 class AveragedPerceptron:
@@ -49,14 +56,31 @@ class AveragedPerceptron:
         self._tstamps = defaultdict(int)
         # Number of instances seen
         self.i = 0
+        # Interned features and dense weight matrix used by ``predict_batch``,
+        # built lazily by ``compile`` and dropped whenever the weights change
+        self._compiled = None
 
     def _softmax(self, scores):
         s = np.fromiter(scores.values(), dtype=float)
+        return self._softmax_array(s)
+
+    def _softmax_array(self, s):
         exps = np.exp(s)
         return exps / np.sum(exps)
 
     def predict(self, features, return_conf=False):
         """Dot-product the features and current weights and return the best label."""
+        if isinstance(self.weights, MappedWeights):
+            # Decoding a row of the mapped matrix per feature is slow, so
+            # score the features on the matrix itself, summing the rows in
+            # order like ``predict_batch``
+            feat_index, matrix, labels = self._compiled
+            rows = [feat_index.get(feat, 0) for feat in features]
+            values = np.fromiter(features.values(), dtype=float, count=len(rows))
+            scores = (values[:, None] * matrix[rows]).sum(axis=0)
+            conf = max(self._softmax_array(scores)) if return_conf == True else None
+            return labels[scores.argmax()], conf
+
         scores = defaultdict(float)
         for feat, value in features.items():
             if feat not in self.weights or value == 0:
@@ -72,6 +96,59 @@ class AveragedPerceptron:
 
         return best_label, conf
 
+    def compile(self):
+        """
+        Intern the features to integer ids and pack the weights into a dense
+        ``numpy`` matrix with one row per feature and one column per class.
+        Row 0 is left empty, and is used for features without any weights.
+        The columns are sorted in reverse alphabetical order, such that
+        ``argmax`` breaks ties in the same way as ``predict``.
+        """
+        labels = sorted(self.classes, reverse=True)
+        label_index = {label: j for j, label in enumerate(labels)}
+        feat_index = {}
+        matrix = np.zeros((len(self.weights) + 1, len(labels)))
+        for row, (feat, weights) in enumerate(self.weights.items(), start=1):
+            feat_index[feat] = row
+            for label, weight in weights.items():
+                if label in label_index:
+                    matrix[row, label_index[label]] = weight
+        self._compiled = (feat_index, matrix, labels)
+
+    def predict_batch(self, features_list):
+        """
+        Return the best label for each of the feature dicts in ``features_list``,
+        i.e. ``[self.predict(features)[0] for features in features_list]``,
+        using vectorized gathers over the compiled weight matrix.
+
+        The weights of every feature are added in the same order as ``predict``
+        does, so the scores and hence the labels are exactly the same.
+
+        :param features_list: A list of {feature: value} dicts
+        :type features_list: list(dict)
+        :rtype: list(str)
+        """
+        if not features_list:
+            return []
+        if self._compiled is None:
+            self.compile()
+        feat_index, matrix, labels = self._compiled
+
+        width = max(len(features) for features in features_list)
+        ids = []
+        values = []
+        for features in features_list:
+            padding = width - len(features)
+            ids.append([feat_index.get(feat, 0) for feat in features] + [0] * padding)
+            values.append(list(features.values()) + [0] * padding)
+        ids = np.array(ids, dtype=np.intp)
+        values = np.array(values, dtype=float)
+
+        scores = np.zeros((len(features_list), len(labels)))
+        for column in range(width):
+            scores += values[:, column, None] * matrix[ids[:, column]]
+        return [labels[best] for best in scores.argmax(axis=1)]
+
     def update(self, truth, guess, features):
         """Update the feature weights."""
 
@@ -84,19 +161,34 @@ class AveragedPerceptron:
         self.i += 1
         if truth == guess:
             return None
+        self._compiled = None
         for f in features:
             weights = self.weights.setdefault(f, {})
             upd_feat(truth, f, weights.get(truth, 0.0), 1.0)
             upd_feat(guess, f, weights.get(guess, 0.0), -1.0)
 
-    def average_weights(self):
-        """Average weights from all iterations."""
+    def accumulated_totals(self):
+        """
+        Return the sum of every weight over all the instances seen so far,
+        as a dict-of-dicts keyed by feature and class like ``weights``.
+        """
+        totals = {}
         for feat, weights in self.weights.items():
-            new_feat_weights = {}
+            feat_totals = {}
             for clas, weight in weights.items():
                 param = (feat, clas)
                 total = self._totals[param]
                 total += (self.i - self._tstamps[param]) * weight
+                feat_totals[clas] = total
+            totals[feat] = feat_totals
+        return totals
+
+    def average_weights(self):
+        """Average weights from all iterations."""
+        self._compiled = None
+        for feat, totals in self.accumulated_totals().items():
+            new_feat_weights = {}
+            for clas, total in totals.items():
                 averaged = round(total / self.i, 3)
                 if averaged:
                     new_feat_weights[clas] = averaged
@@ -110,6 +202,40 @@ class AveragedPerceptron:
     def load(self, path):
         """Load the pickled model weights."""
         self.weights = load(path)
+        self._compiled = None
+
+    def save_mmap(self, path, dtype="float32"):
+        """
+        Save the model weights in a compact binary format, which can be
+        memory-mapped by ``load_mmap``: the feature strings, followed by a
+        flat weight matrix with one row per feature and one column per class.
+
+        :param path: The file to write the model to.
+        :param dtype: The ``numpy`` type of the weights. With ``float32`` the
+            scores may differ from those of the pickled model in the last
+            digits; use ``float64`` to keep them exactly the same.
+        """
+        _write_mmap(path, self.weights, self.classes, dtype)
+
+    def load_mmap(self, path):
+        """
+        Load model weights saved by ``save_mmap``. The weight matrix is
+        memory-mapped read-only rather than read into memory, so processes
+        which load the same file share its pages. ``self.weights`` becomes a
+        read-only view on the matrix, so the model can no longer be trained;
+        ``predict`` and ``predict_batch`` score the features on the matrix
+        itself rather than through that view.
+
+        :param path: The file to read the model from.
+        :return: The metadata stored along with the weights.
+        :rtype: dict
+        """
+        header, feat_index, matrix = _read_mmap(path)
+        labels = header["labels"]
+        self.classes = set(labels)
+        self.weights = MappedWeights(feat_index, matrix, labels)
+        self._compiled = (feat_index, matrix, labels)
+        return header
 
     def encode_json_obj(self):
         return self.weights
@@ -192,14 +318,89 @@ class PerceptronTagger(TaggerI):
 
         return output
 
-    def train(self, sentences, save_loc=None, nr_iter=5):
+    def tag_sents(
+        self, sentences, return_conf=False, use_tagdict=True, batch_size=1000
+    ):
+        """
+        Tag a list of tokenized sentences. The output is the same as that of
+        ``[self.tag(sent) for sent in sentences]``, but the sentences are
+        tagged in batches of ``batch_size``: all tokens at the same position
+        in a batch are scored at once by ``AveragedPerceptron.predict_batch``.
+        Falls back to tagging one sentence at a time if ``numpy`` is not
+        available, or if ``return_conf`` is True.
+
+        :params sentences: list of tokenized sentences
+        :type sentences: list(list(str))
+        :params batch_size: number of sentences scored together
+        :type batch_size: int
+        :rtype: list(list(tuple(str, str)))
+        """
+        if np is None or return_conf:
+            return [self.tag(sent, return_conf, use_tagdict) for sent in sentences]
+
+        output = []
+        batch = []
+        for sent in sentences:
+            batch.append(list(sent))
+            if len(batch) >= batch_size:
+                output.extend(self._tag_batch(batch, use_tagdict))
+                batch = []
+        if batch:
+            output.extend(self._tag_batch(batch, use_tagdict))
+        return output
+
+    def _tag_batch(self, sentences, use_tagdict=True):
+        """
+        Tag a batch of sentences greedily from left to right, scoring the
+        tokens at position ``i`` of every sentence in a single call to
+        ``AveragedPerceptron.predict_batch``.
+        """
+        contexts = [
+            self.START + [self.normalize(w) for w in sent] + self.END
+            for sent in sentences
+        ]
+        tags = [[None] * len(sent) for sent in sentences]
+        history = [list(self.START) for _ in sentences]
+
+        for i in range(max(len(sent) for sent in sentences)):
+            pending = []
+            features_list = []
+            for j, sent in enumerate(sentences):
+                if i >= len(sent):
+                    continue
+                word = sent[i]
+                tag = self.tagdict.get(word) if use_tagdict == True else None
+                if tag:
+                    tags[j][i] = tag
+                else:
+                    prev, prev2 = history[j]
+                    pending.append(j)
+                    features_list.append(
+                        self._get_features(i, word, contexts[j], prev, prev2)
+                    )
+            for j, tag in zip(pending, self.model.predict_batch(features_list)):
+                tags[j][i] = tag
+            for j, sent in enumerate(sentences):
+                if i < len(sent):
+                    history[j] = [tags[j][i], history[j][0]]
+
+        return [list(zip(sent, sent_tags)) for sent, sent_tags in zip(sentences, tags)]
+
+    def train(self, sentences, save_loc=None, nr_iter=5, processes=1):
         """Train a model from sentences, and save it at ``save_loc``. ``nr_iter``
         controls the number of Perceptron training iterations.
 
+        With ``processes > 1``, the sentences are split into as many shards,
+        and each iteration trains one perceptron per shard in a separate
+        process, starting from the mixture of the previous iteration's
+        weights (iterative parameter mixing, McDonald et al., 2010). The
+        final weights are averaged over all the instances of all the shards.
+
         :param sentences: A list or iterator of sentences, where each sentence
             is a list of (words, tags) tuples.
         :param save_loc: If not ``None``, saves a pickled model in this location.
         :param nr_iter: Number of training iterations.
+        :param processes: Number of worker processes used for training.
         """
         # We'd like to allow ``sentences`` to be either a list or an iterator,
         # the latter being especially important for a large training dataset.
@@ -211,38 +412,126 @@ class PerceptronTagger(TaggerI):
         self._sentences = list()  # to be populated by self._make_tagdict...
         self._make_tagdict(sentences)
         self.model.classes = self.classes
-        for iter_ in range(nr_iter):
-            c = 0
-            n = 0
-            for sentence in self._sentences:
-                words, tags = zip(*sentence)
-
-                prev, prev2 = self.START
-                context = self.START + [self.normalize(w) for w in words] + self.END
-                for i, word in enumerate(words):
-                    guess = self.tagdict.get(word)
-                    if not guess:
-                        feats = self._get_features(i, word, context, prev, prev2)
-                        guess, _ = self.model.predict(feats)
-                        self.model.update(tags[i], guess, feats)
-                    prev2 = prev
-                    prev = guess
-                    c += guess == tags[i]
-                    n += 1
-            random.shuffle(self._sentences)
-            logging.info(f"Iter {iter_}: {c}/{n}={_pc(c, n)}")
+        if processes > 1:
+            self._train_parallel(nr_iter, processes)
+        else:
+            for iter_ in range(nr_iter):
+                start = time.perf_counter()
+                c, n = self._train_epoch(self._sentences)
+                random.shuffle(self._sentences)
+                elapsed = time.perf_counter() - start
+                logging.info(f"Iter {iter_}: {c}/{n}={_pc(c, n)} in {elapsed:.2f}s")
+            self.model.average_weights()
 
         # We don't need the training sentences anymore, and we don't want to
         # waste space on them when we pickle the trained tagger.
         self._sentences = None
 
-        self.model.average_weights()
         # Pickle as a binary file
         if save_loc is not None:
             with open(save_loc, "wb") as fout:
                 # changed protocol from -1 to 2 to make pickling Python 2 compatible
                 pickle.dump((self.model.weights, self.tagdict, self.classes), fout, 2)
 
+    def _train_epoch(self, sentences):
+        """
+        Make one training pass over ``sentences``, and return the number of
+        correctly guessed tags and the total number of tags.
+        """
+        c = 0
+        n = 0
+        for sentence in sentences:
+            words, tags = zip(*sentence)
+
+            prev, prev2 = self.START
+            context = self.START + [self.normalize(w) for w in words] + self.END
+            for i, word in enumerate(words):
+                guess = self.tagdict.get(word)
+                if not guess:
+                    feats = self._get_features(i, word, context, prev, prev2)
+                    guess, _ = self.model.predict(feats)
+                    self.model.update(tags[i], guess, feats)
+                prev2 = prev
+                prev = guess
+                c += guess == tags[i]
+                n += 1
+        return c, n
+
+    def _train_parallel(self, nr_iter, processes):
+        """
+        Train on ``self._sentences`` with iterative parameter mixing: the
+        sentences are split into one shard per worker process, which keeps
+        its shard for the whole training. Every iteration, each worker is
+        sent the current weights, makes one pass over its shard, and the
+        resulting weights are mixed in proportion to the number of instances
+        (tokens not found in the tag dictionary) seen on each shard. Only
+        weights go between the processes after the shards have been sent.
+        """
+        totals = defaultdict(lambda: defaultdict(float))
+        seen = 0
+        shards = [self._sentences[k::processes] for k in range(processes)]
+        workers = []
+        try:
+            for shard in shards:
+                if not shard:
+                    continue
+                conn, child_conn = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=_shard_worker,
+                    args=(child_conn, type(self), self.tagdict, self.classes, shard),
+                    daemon=True,
+                )
+                process.start()
+                child_conn.close()
+                workers.append((process, conn))
+
+            for iter_ in range(nr_iter):
+                start = time.perf_counter()
+                for _, conn in workers:
+                    conn.send(self.model.weights)
+                results = [conn.recv() for _, conn in workers]
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+
+                c = sum(result[3] for result in results)
+                n = sum(result[4] for result in results)
+                epoch_seen = sum(result[2] for result in results)
+                mixed = defaultdict(lambda: defaultdict(float))
+                for weights, shard_totals, shard_seen, _, _ in results:
+                    share = shard_seen / epoch_seen if epoch_seen else 1 / len(results)
+                    for feat, feat_weights in weights.items():
+                        for clas, weight in feat_weights.items():
+                            mixed[feat][clas] += share * weight
+                    for feat, feat_totals in shard_totals.items():
+                        for clas, total in feat_totals.items():
+                            totals[feat][clas] += total
+                seen += epoch_seen
+                self.model.weights = {feat: dict(w) for feat, w in mixed.items()}
+
+                elapsed = time.perf_counter() - start
+                logging.info(f"Iter {iter_}: {c}/{n}={_pc(c, n)} in {elapsed:.2f}s")
+        finally:
+            for process, conn in workers:
+                try:
+                    conn.send(None)
+                except OSError:
+                    pass
+                conn.close()
+            for process, _ in workers:
+                process.join()
+
+        if seen:
+            self.model.weights = {}
+            for feat, feat_totals in totals.items():
+                new_feat_weights = {}
+                for clas, total in feat_totals.items():
+                    averaged = round(total / seen, 3)
+                    if averaged:
+                        new_feat_weights[clas] = averaged
+                self.model.weights[feat] = new_feat_weights
+        self.model._compiled = None
+
     def load(self, loc):
         """
         :param loc: Load a pickled model at location.
@@ -251,6 +540,34 @@ class PerceptronTagger(TaggerI):
 
         self.model.weights, self.tagdict, self.classes = load(loc)
         self.model.classes = self.classes
+        self.model._compiled = None
+
+    def save_mmap(self, path, dtype="float32"):
+        """
+        Save the tagger in the memory-mappable format of
+        ``AveragedPerceptron.save_mmap``, along with its tag dictionary.
+
+        :param path: The file to write the model to.
+        :type path: str
+        :param dtype: The ``numpy`` type of the weights, e.g. ``float32`` or
+            ``float64``.
+        :type dtype: str
+        """
+        _write_mmap(
+            path, self.model.weights, self.classes, dtype, {"tagdict": self.tagdict}
+        )
+
+    def load_mmap(self, path):
+        """
+        Load a tagger saved by ``save_mmap``, memory-mapping its weights such
+        that forked or spawned worker processes share a single copy of them.
+
+        :param path: The file to read the model from.
+        :type path: str
+        """
+        header = self.model.load_mmap(path)
+        self.tagdict = header.get("tagdict", {})
+        self.classes = self.model.classes
 
     def encode_json_obj(self):
         return self.model.weights, self.tagdict, list(self.classes)
@@ -330,10 +647,135 @@ class PerceptronTagger(TaggerI):
                 self.tagdict[word] = tag
 
 
+class MappedWeights(Mapping):
+    """
+    A read-only dict-of-dicts view of a weight matrix, as loaded by
+    ``AveragedPerceptron.load_mmap``. Mapping a feature to its weights
+    yields the dict of the classes which have a non-zero weight.
+    """
+
+    def __init__(self, feat_index, matrix, labels):
+        self._feat_index = feat_index
+        self._matrix = matrix
+        self._labels = labels
+
+    def __getitem__(self, feat):
+        row = self._matrix[self._feat_index[feat]]
+        return {self._labels[j]: float(row[j]) for j in np.flatnonzero(row)}
+
+    def __contains__(self, feat):
+        return feat in self._feat_index
+
+    def __iter__(self):
+        return iter(self._feat_index)
+
+    def __len__(self):
+        return len(self._feat_index)
+
+
+def _align(offset, alignment):
+    return -(-offset // alignment) * alignment
+
+
+def _write_mmap(path, weights, classes, dtype, metadata=None):
+    """
+    Write ``weights`` to ``path`` as: the magic bytes, the length of a JSON
+    header followed by the header itself, the byte offsets of the UTF-8
+    encoded feature strings followed by the strings themselves, and finally
+    the weight matrix, aligned to 64 bytes. Row 0 of the matrix is empty,
+    and row ``i + 1`` holds the weights of feature ``i``.
+    """
+    labels = sorted(classes, reverse=True)
+    label_index = {label: j for j, label in enumerate(labels)}
+    dtype = np.dtype(dtype).newbyteorder("<")
+
+    encoded = []
+    matrix = np.zeros((len(weights) + 1, len(labels)), dtype=dtype)
+    for row, (feat, feat_weights) in enumerate(weights.items(), start=1):
+        encoded.append(feat.encode("utf8"))
+        for label, weight in feat_weights.items():
+            if label in label_index:
+                matrix[row, label_index[label]] = weight
+    offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(feat) for feat in encoded], out=offsets[1:])
+
+    header = dict(metadata or {})
+    header.update(labels=labels, dtype=dtype.str, n_features=len(encoded))
+    header = json.dumps(header).encode("utf8")
+
+    with open(path, "wb") as fout:
+        fout.write(MMAP_MAGIC)
+        fout.write(len(header).to_bytes(8, "little"))
+        fout.write(header)
+        fout.write(b"\0" * (_align(fout.tell(), 8) - fout.tell()))
+        fout.write(offsets.tobytes())
+        fout.write(b"".join(encoded))
+        fout.write(b"\0" * (_align(fout.tell(), 64) - fout.tell()))
+        fout.write(matrix.tobytes())
+
+
+def _read_mmap(path):
+    """
+    Read a model written by ``_write_mmap``, and return its header, a dict
+    mapping the features to their rows, and the memory-mapped weight matrix.
+    """
+    with open(path, "rb") as fin:
+        if fin.read(len(MMAP_MAGIC)) != MMAP_MAGIC:
+            raise ValueError(f"{path} is not a memory-mappable perceptron model")
+        header = json.loads(fin.read(int.from_bytes(fin.read(8), "little")))
+        n_features = header["n_features"]
+        fin.seek(_align(fin.tell(), 8))
+        offsets = np.frombuffer(fin.read(8 * (n_features + 1)), dtype="<u8")
+        blob = fin.read(int(offsets[-1]))
+        matrix_offset = _align(fin.tell(), 64)
+
+    bounds = offsets.tolist()
+    feat_index = {
+        blob[start:end].decode("utf8"): row
+        for row, (start, end) in enumerate(zip(bounds, bounds[1:]), start=1)
+    }
+    shape = (n_features + 1, len(header["labels"]))
+    dtype = np.dtype(header["dtype"])
+    if not header["labels"]:
+        matrix = np.zeros(shape, dtype=dtype)
+    else:
+        matrix = np.memmap(
+            path, dtype=dtype, mode="r", offset=matrix_offset, shape=shape
+        )
+    return header, feat_index, matrix
+
+
 def _pc(n, d):
     return (n / d) * 100
 
 
+def _shard_worker(conn, cls, tagdict, classes, sentences):
+    """
+    Train copies of a tagger on a shard of sentences, in a worker process
+    of ``PerceptronTagger._train_parallel``. Each set of weights received
+    on ``conn`` starts one pass over the shard, whose resulting weights,
+    accumulated totals, number of instances and accuracy are sent back.
+    The worker stops when it receives ``None``.
+    """
+    while True:
+        weights = conn.recv()
+        if weights is None:
+            break
+        try:
+            tagger = cls(load=False)
+            tagger.tagdict = tagdict
+            tagger.classes = tagger.model.classes = classes
+            tagger.model.weights = weights
+            c, n = tagger._train_epoch(sentences)
+            random.shuffle(sentences)
+            model = tagger.model
+            result = (model.weights, model.accumulated_totals(), model.i, c, n)
+        except Exception as e:
+            result = e
+        conn.send(result)
+    conn.close()
+
+
 def _load_data_conll_format(filename):
     print("Read from file: ", filename)
     with open(filename, "rb") as fin:
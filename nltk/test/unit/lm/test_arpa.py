@@ -0,0 +1,121 @@
+# Natural Language Toolkit: Language Model Unit Tests
+#
+# Copyright (C) 2001-2023 NLTK Project
+# URL: <https://www.nltk.org/>
+# For license information, see LICENSE.TXT
+import io
+import math
+
+import pytest
+
+from nltk.lm import (
+    MLE,
+    AbsoluteDiscountingInterpolated,
+    ArpaModel,
+    KneserNeyInterpolated,
+    Lidstone,
+    WittenBellInterpolated,
+)
+from nltk.lm.preprocessing import padded_everygram_pipeline, padded_everygrams
+
+TEXT = [list("abcdab"), list("acdcba"), list("bbadc"), list("dcab")]
+CONTEXTS = [(), ("a",), ("b", "a"), ("<s>", "a"), ("d", "c"), ("x", "a"), ("a", "y")]
+
+
+def _fit(model_class, **kwargs):
+    model = model_class(order=3, **kwargs)
+    model.fit(*padded_everygram_pipeline(3, TEXT))
+    return model
+
+
+def _roundtrip(arpa):
+    arpa_file = io.StringIO()
+    arpa.write(arpa_file)
+    arpa_file.seek(0)
+    return ArpaModel.read(arpa_file)
+
+
+@pytest.mark.parametrize(
+    "model_class",
+    [WittenBellInterpolated, KneserNeyInterpolated, AbsoluteDiscountingInterpolated],
+)
+def test_interpolated_models_are_exact(model_class):
+    model = _fit(model_class)
+    arpa = ArpaModel.from_model(model)
+    loaded = _roundtrip(arpa)
+    assert loaded.order == 3
+    assert len(loaded) == len(arpa)
+    for context in CONTEXTS:
+        for word in list(model.vocab) + ["aliens"]:
+            expected = model.score(word, context)
+            assert arpa.score(word, context) == pytest.approx(expected)
+            assert loaded.score(word, context) == pytest.approx(expected, rel=1e-6)
+            assert loaded.logscore(word, context) == pytest.approx(
+                model.logscore(word, context), rel=1e-6
+            )
+
+
+def test_mle_seen_contexts():
+    model = _fit(MLE)
+    arpa = _roundtrip(ArpaModel.from_model(model))
+    assert arpa.score("b", ["c", "b"]) == 0
+    assert arpa.logscore("b", ["c", "b"]) == -math.inf
+    for ngram in padded_everygrams(3, TEXT[0]):
+        assert arpa.score(ngram[-1], ngram[:-1]) == pytest.approx(
+            model.score(ngram[-1], ngram[:-1]), rel=1e-6
+        )
+
+
+@pytest.mark.parametrize("model_class", [MLE, Lidstone, KneserNeyInterpolated])
+@pytest.mark.parametrize("pruning", [{}, {"min_count": 2}, {"threshold": 1e-3}])
+def test_probabilities_sum_to_1(model_class, pruning):
+    kwargs = {"gamma": 0.1} if model_class is Lidstone else {}
+    model = _fit(model_class, **kwargs)
+    arpa = ArpaModel.from_model(model, **pruning)
+    for context in CONTEXTS:
+        total = sum(arpa.score(word, context) for word in model.vocab)
+        assert total == pytest.approx(1.0)
+
+
+def test_pruning():
+    model = _fit(KneserNeyInterpolated)
+    arpa = ArpaModel.from_model(model)
+    by_count = ArpaModel.from_model(model, min_count=2)
+    by_entropy = ArpaModel.from_model(model, threshold=1e-3)
+    assert len(by_count) < len(arpa)
+    assert len(by_entropy) < len(arpa)
+
+    # Unigrams are never pruned, nor are the contexts of the ngrams kept
+    for pruned in (by_count, by_entropy):
+        for ngram in arpa._ngrams:
+            if len(ngram) == 1:
+                assert ngram in pruned
+        for ngram in pruned._ngrams:
+            assert ngram[:-1] in pruned or len(ngram) == 1
+    assert ("c", "b") not in by_count
+    assert ("d", "c") in by_count
+
+    # Pruning loses some fit to the training data
+    test = [ngram for sent in TEXT for ngram in padded_everygrams(3, sent)]
+    assert by_entropy.perplexity(test) > arpa.perplexity(test)
+    assert arpa.perplexity(test) == pytest.approx(model.perplexity(test))
+
+
+def test_read_errors(tmp_path):
+    path = tmp_path / "model.arpa"
+    path.write_text("\\data\\\nngram 1=1\n\n\\1-grams:\n-1.0\ta b\n\\end\\\n")
+    with pytest.raises(ValueError):
+        ArpaModel.read(str(path))
+
+
+def test_read_unknown_words(tmp_path):
+    path = tmp_path / "model.arpa"
+    path.write_text(
+        "\\data\\\nngram 1=2\nngram 2=1\n\n\\1-grams:\n"
+        "-0.30103\t<unk>\n-0.30103\ta\t-0.5\n\n\\2-grams:\n-0.1\ta a\n\n\\end\\\n"
+    )
+    arpa = ArpaModel.read(str(path), unk_label="<unk>")
+    assert arpa.order == 2
+    assert arpa.score("zebra") == pytest.approx(0.5)
+    assert arpa.score("a", ["a"]) == pytest.approx(10**-0.1)
+    assert arpa.score("zebra", ["a"]) == pytest.approx(10 ** (-0.5 - 0.30103))
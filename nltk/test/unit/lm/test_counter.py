@@ -5,12 +5,13 @@
 # URL: <https://www.nltk.org/>
 # For license information, see LICENSE.TXT
 
+import random
 import unittest
 
 import pytest
 
 from nltk import FreqDist
-from nltk.lm import NgramCounter
+from nltk.lm import ArrayNgramCounter, NgramCounter
 from nltk.util import everygrams
 
 
@@ -114,3 +115,108 @@ class TestNgramCounterTraining:
         self.case.assertCountEqual(unigrams, counter[1].keys())
         self.case.assertCountEqual(bigram_contexts, counter[2].keys())
         self.case.assertCountEqual(trigram_contexts, counter[3].keys())
+
+
+def test_merge():
+    text = [list("abcd"), list("egdbe"), list("abcabd")]
+    expected = NgramCounter(everygrams(sent, max_len=3) for sent in text)
+    counter = NgramCounter(everygrams(sent, max_len=3) for sent in text[:1])
+    counter.merge(NgramCounter(everygrams(sent, max_len=3) for sent in text[1:]))
+    assert counter.unigrams == expected.unigrams
+    for order in (2, 3):
+        assert counter[order] == expected[order]
+    assert counter.N() == expected.N()
+
+
+class TestArrayNgramCounter:
+    """ArrayNgramCounter should give the same counts as NgramCounter."""
+
+    @classmethod
+    def setup_class(self):
+        pytest.importorskip("numpy")
+        text = [list("abcd"), list("egdbe"), list("abcabd")]
+        self.expected = NgramCounter(everygrams(sent, max_len=3) for sent in text)
+        # A tiny buffer forces several merges of partial counts
+        self.counter = ArrayNgramCounter(
+            (everygrams(sent, max_len=3) for sent in text), buffer_size=4
+        )
+
+    def test_N(self):
+        assert self.counter.N() == self.expected.N()
+        assert self.counter[2].N() == self.expected[2].N()
+
+    def test_unigrams(self):
+        assert dict(self.counter.unigrams) == dict(self.expected.unigrams)
+        assert self.counter["b"] == 4
+        assert self.counter["z"] == 0
+        assert self.counter.unigrams.freq("b") == self.expected.unigrams.freq("b")
+
+    @pytest.mark.parametrize("order", [2, 3])
+    def test_conditional_counts(self, order):
+        expected = self.expected[order]
+        counts = self.counter[order]
+        assert sorted(counts.conditions()) == sorted(expected.conditions())
+        assert len(counts) == len(expected)
+        for context, dist in counts.items():
+            assert dict(dist) == dict(expected[context])
+            assert dist.N() == expected[context].N()
+            assert context in counts
+
+    def test_context_lookup(self):
+        assert self.counter[["a"]]["b"] == 3
+        assert self.counter[("a", "b")]["c"] == 2
+        assert self.counter[["a"]]["z"] == 0
+        assert "z" not in self.counter[["a"]]
+        assert not self.counter[["z"]]
+        assert not self.counter[["a", "z", "b"]]
+        assert ("z",) not in self.counter[2]
+
+    def test_len_and_contains(self):
+        assert len(self.counter) == 3
+        assert 3 in self.counter
+        assert 4 not in self.counter
+
+    def test_train_on_illegal_sentences(self):
+        with pytest.raises(TypeError):
+            ArrayNgramCounter([["Check", "this", "out", "!"]])
+
+    @pytest.mark.parametrize("case", ["", [], None])
+    def test_empty_inputs(self, case):
+        test = ArrayNgramCounter(case)
+        assert 2 not in test
+        assert test[1] == FreqDist()
+        assert not test[2]
+
+    def test_merge(self):
+        text = [list("abcd"), list("egdbe"), list("abcabd")]
+        counter = ArrayNgramCounter([everygrams(text[2], max_len=3)])
+        counter.merge(
+            ArrayNgramCounter(everygrams(sent, max_len=3) for sent in text[:2])
+        )
+        assert dict(counter.unigrams) == dict(self.expected.unigrams)
+        for context, dist in self.expected[3].items():
+            assert dict(counter[context]) == dict(dist)
+
+    def test_incremental_update(self):
+        rng = random.Random(0)
+        text = [[rng.choice("abcdefgh") for _ in range(10)] for _ in range(30)]
+        expected = NgramCounter(everygrams(sent, max_len=3) for sent in text)
+        counter = ArrayNgramCounter(buffer_size=7)
+        for sent in text:
+            unigrams = counter.unigrams
+            assert counter.unigrams is unigrams
+            counter.update([everygrams(sent, max_len=3)])
+            assert counter.unigrams is not unigrams
+        assert dict(counter.unigrams) == dict(expected.unigrams)
+        for order in (2, 3):
+            keys = counter._ngrams[order][0]
+            assert keys.tolist() == sorted(set(keys.tolist()))
+            for context, dist in expected[order].items():
+                assert dict(counter[context]) == dict(dist)
+        assert counter.N() == expected.N()
+
+    def test_pickle(self):
+        import pickle
+
+        loaded = pickle.loads(pickle.dumps(self.counter))
+        assert dict(loaded[["a"]]) == dict(self.counter[["a"]])
@@ -5,6 +5,8 @@
 # URL: <https://www.nltk.org/>
 # For license information, see LICENSE.TXT
 import math
+import random
+from functools import partial
 from operator import itemgetter
 
 import pytest
@@ -12,14 +14,16 @@ import pytest
 from nltk.lm import (
     MLE,
     AbsoluteDiscountingInterpolated,
+    ArrayNgramCounter,
     KneserNeyInterpolated,
     Laplace,
     Lidstone,
+    NgramCounter,
     StupidBackoff,
     Vocabulary,
     WittenBellInterpolated,
 )
-from nltk.lm.preprocessing import padded_everygrams
+from nltk.lm.preprocessing import padded_everygram_pipeline, padded_everygrams
 
 
 @pytest.fixture(scope="session")
@@ -545,6 +549,139 @@ def test_sums_to_1(model_fixture, context, request):
     assert pytest.approx(scores_for_context, 1e-7) == 1.0
 
 
+###############################################################################
+#                               Sharded Fitting                               #
+###############################################################################
+
+SHARDS = [
+    [list("abcd"), list("egadbe")],
+    [list("abcabd")],
+    [list("bdbdbd"), list("ca"), list("dab")],
+    [],
+    [list("eeg")],
+]
+
+
+def _fitted_models(counter_class, preprocess=None, **kwargs):
+    expected = KneserNeyInterpolated(3, vocabulary=Vocabulary(unk_cutoff=2))
+    expected.fit(*padded_everygram_pipeline(3, sum(SHARDS, [])))
+    model = KneserNeyInterpolated(
+        3, vocabulary=Vocabulary(unk_cutoff=2), counter=counter_class()
+    )
+    if preprocess is None:
+        preprocess = partial(padded_everygram_pipeline, 3)
+    model.fit_shards(SHARDS, preprocess, **kwargs)
+    return expected, model
+
+
+def _assert_same_scores(model, expected):
+    assert model.vocab == expected.vocab
+    for context in [(), ("a",), ("<s>", "a"), ("b", "d"), ("<UNK>", "a")]:
+        for word in expected.vocab:
+            assert model.score(word, context) == pytest.approx(
+                expected.score(word, context)
+            )
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_fit_shards(processes):
+    expected, model = _fitted_models(NgramCounter, processes=processes)
+    _assert_same_scores(model, expected)
+    assert model.counts.N() == expected.counts.N()
+
+
+def test_fit_shards_array_counter():
+    pytest.importorskip("numpy")
+    expected, model = _fitted_models(ArrayNgramCounter, processes=2)
+    _assert_same_scores(model, expected)
+
+
+def _failing_pipeline(failing_shards, shard):
+    if shard in failing_shards:
+        raise KeyboardInterrupt
+    return padded_everygram_pipeline(3, shard)
+
+
+def test_fit_shards_resume(tmp_path):
+    checkpoint = str(tmp_path / "counts.pickle")
+    model = KneserNeyInterpolated(3)
+    with pytest.raises(KeyboardInterrupt):
+        model.fit_shards(
+            SHARDS,
+            partial(_failing_pipeline, SHARDS[2:3]),
+            checkpoint=checkpoint,
+            checkpoint_every=1,
+        )
+    assert not model.vocab
+
+    # The shards counted before the interruption are skipped
+    expected, model = _fitted_models(
+        NgramCounter,
+        partial(_failing_pipeline, SHARDS[:2]),
+        checkpoint=checkpoint,
+        checkpoint_every=1,
+    )
+    _assert_same_scores(model, expected)
+
+
+###############################################################################
+#                                Batch Scoring                                #
+###############################################################################
+
+
+@pytest.mark.parametrize(
+    "model_fixture",
+    [
+        "mle_bigram_model",
+        "mle_trigram_model",
+        "lidstone_trigram_model",
+        "laplace_bigram_model",
+        "wittenbell_trigram_model",
+        "kneserney_trigram_model",
+        "absolute_discounting_trigram_model",
+        "stupid_backoff_trigram_model",
+    ],
+)
+def test_score_many(model_fixture, training_data, request):
+    model = request.getfixturevalue(model_fixture)
+    test_ngrams = [
+        ngram
+        for sent in training_data + [["a", "z", "c", "aliens"], ["d", "b"]]
+        for ngram in padded_everygrams(model.order, sent)
+    ]
+    # Repeat the ngrams so that some scores come from the cache
+    test_ngrams += test_ngrams[::2]
+
+    assert model.score_many(test_ngrams) == [
+        model.score(ngram[-1], ngram[:-1]) for ngram in test_ngrams
+    ]
+    assert model.logscore_many(iter(test_ngrams)) == [
+        model.logscore(ngram[-1], ngram[:-1]) for ngram in test_ngrams
+    ]
+    assert model._batch_cache is None
+
+
+@pytest.mark.parametrize(
+    "model_fixture",
+    [
+        "wittenbell_trigram_model",
+        "kneserney_trigram_model",
+        "stupid_backoff_trigram_model",
+    ],
+)
+def test_unmasked_score_context_keyword(model_fixture, request):
+    model = request.getfixturevalue(model_fixture)
+    expected = model.unmasked_score("c", ("b",))
+    assert model.unmasked_score("c", context=("b",)) == expected
+    with model._batch():
+        assert model.unmasked_score("c", context=["b"]) == expected
+        assert model.unmasked_score("c", ["b"]) == expected
+        assert model.unmasked_score(word="c", context=("b",)) == expected
+        assert model.unmasked_score("c") == model.unmasked_score("c", None)
+        assert ("unmasked_score", "c", ("b",)) in model._batch_cache
+    assert model._batch_cache is None
+
+
 ###############################################################################
 #                               Generating Text                               #
 ###############################################################################
@@ -608,3 +745,63 @@ def test_generate_None_text_seed(mle_trigram_model):
     assert mle_trigram_model.generate(
         text_seed=None, random_seed=3
     ) == mle_trigram_model.generate(random_seed=3)
+
+
+###############################################################################
+#                           Array-backed Counter                              #
+###############################################################################
+
+
+@pytest.mark.parametrize(
+    "model_class",
+    [
+        MLE,
+        Lidstone,
+        Laplace,
+        WittenBellInterpolated,
+        KneserNeyInterpolated,
+        AbsoluteDiscountingInterpolated,
+        StupidBackoff,
+    ],
+)
+def test_array_counter_scores(model_class, trigram_training_data, vocabulary):
+    pytest.importorskip("numpy")
+    kwargs = {"gamma": 0.1} if model_class is Lidstone else {}
+    expected = model_class(order=3, vocabulary=vocabulary, **kwargs)
+    expected.fit(trigram_training_data)
+    model = model_class(
+        order=3, vocabulary=vocabulary, counter=ArrayNgramCounter(), **kwargs
+    )
+    model.fit(trigram_training_data)
+
+    for context in [(), ("a",), ("<s>", "a"), ("b", "c"), ("e", "g"), ("z", "z")]:
+        for word in model.vocab:
+            assert model.score(word, context) == pytest.approx(
+                expected.score(word, context)
+            )
+    assert model.generate(6, random_seed=3) == expected.generate(6, random_seed=3)
+
+
+def test_generate_many(mle_trigram_model):
+    seeds = [None, ["c"], ("<s>", "e"), ["aliens"], ["b", "d"]] * 3
+    rng = random.Random(3)
+    expected = [mle_trigram_model.generate(5, seed, rng) for seed in seeds]
+    generated = mle_trigram_model.generate_many(seeds, num_words=5, random_seed=3)
+    assert generated == expected
+
+    # A list is returned even for single words
+    rng = random.Random(3)
+    expected = [[mle_trigram_model.generate(1, seed, rng)] for seed in seeds]
+    assert mle_trigram_model.generate_many(seeds, random_seed=3) == expected
+
+
+def test_generation_cache(mle_trigram_model):
+    expected = mle_trigram_model.generate(20, random_seed=3, cache_size=0)
+    assert not mle_trigram_model._generation_cache
+    assert mle_trigram_model.generate(20, random_seed=3, cache_size=2) == expected
+    assert len(mle_trigram_model._generation_cache) == 2
+    assert mle_trigram_model.generate(20, random_seed=3) == expected
+    assert len(mle_trigram_model._generation_cache) > 2
+
+    mle_trigram_model.fit([padded_everygrams(3, list("bdbdbd"))])
+    assert not mle_trigram_model._generation_cache
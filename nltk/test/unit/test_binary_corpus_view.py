@@ -0,0 +1,178 @@
+"""
+Tests for BinaryCorpusView and the binary caches of corpus readers
+"""
+
+import os
+
+import pytest
+
+from nltk.corpus.reader import BracketParseCorpusReader, ConllCorpusReader
+from nltk.corpus.reader.api import CorpusReader
+from nltk.corpus.reader.util import BinaryCorpusView, StreamBackedCorpusView, concat
+from nltk.tree import ParentedTree, Tree
+
+CONLL = """\
+Confidence NN B-NP (S(NP*
+in IN B-PP (PP*
+the DT B-NP (NP*
+pound NN I-NP *))))
+
+Chancellor NNP O (S(NP*)
+Nigel NNP B-NP (NP*
+Lawson NNP I-NP *)
+. . O *)
+"""
+
+TREES = """\
+(S (NP (DT The) (NN dog)) (VP (VBD barked)) (. .))
+(S (NP (PRP It)) (VP (VBD ran) (ADVP (RB away))))
+(S (NP (NNP Zoë)) (VP (VBD left)))
+"""
+
+
+def test_roundtrip(tmp_path):
+    items = [
+        "word",
+        [],
+        ("dog", "NN", "B-NP"),
+        [("The", "DT"), ("dog", "NN")],
+        [["a", "b"], ("c",)],
+        Tree("S", [Tree("NP", [("Zoë", "NNP")]), Tree("VP", ["ran"])]),
+        ParentedTree("S", [ParentedTree("NP", ["it"])]),
+    ]
+    path = str(tmp_path / "items.bcv")
+    BinaryCorpusView.write(items, path)
+    view = BinaryCorpusView(path)
+    assert len(view) == len(items)
+    assert list(view) == items
+    assert [type(item) for item in view] == [type(item) for item in items]
+    assert view[-1][0].parent() is not None
+    assert view[3] == items[3] and view[-2] == items[-2]
+    assert list(view[2:5]) == items[2:5]
+    assert list(view.iterate_from(5)) == items[5:]
+    with pytest.raises(IndexError):
+        view[len(items)]
+
+    # The view is mapped again after it is closed
+    view.close()
+    assert view[0] == "word"
+    view.close()
+
+
+class _OtherTree(Tree):
+    pass
+
+
+def test_bad_files(tmp_path):
+    with pytest.raises(TypeError):
+        BinaryCorpusView.write([["a", 1]], str(tmp_path / "bad.bcv"))
+    # Only the tree classes of nltk.tree are written, and read
+    with pytest.raises(TypeError):
+        BinaryCorpusView.write([_OtherTree("S", [])], str(tmp_path / "bad.bcv"))
+    path = str(tmp_path / "tree.bcv")
+    BinaryCorpusView.write([Tree("S", [])], path)
+    with open(path, "rb") as fin:
+        data = fin.read()
+    with open(path, "wb") as fout:
+        fout.write(data.replace(b'"nltk.tree.tree"', b'"nltk.tree.xxxx"'))
+    with pytest.raises(ValueError):
+        BinaryCorpusView(path)
+
+    path = str(tmp_path / "items.bcv")
+    BinaryCorpusView.write([["a", "b"]] * 10, path)
+    with open(path, "rb") as fin:
+        data = fin.read()
+    with open(path, "wb") as fout:
+        fout.write(data[:-8])
+    with pytest.raises(ValueError):
+        BinaryCorpusView(path)
+    with open(path, "wb") as fout:
+        fout.write(b"garbage!" + data[8:])
+    with pytest.raises(ValueError):
+        BinaryCorpusView(path)
+
+
+def test_cache_to_tempfile():
+    view = BinaryCorpusView.cache_to_tempfile([["x"]] * 3)
+    path = view.fileid
+    assert list(view) == [["x"]] * 3
+    del view
+    assert not os.path.exists(path)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.setattr(CorpusReader, "CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+def test_conll_cache(tmp_path, cache_dir):
+    (tmp_path / "a.conll").write_text(CONLL, "utf8")
+    (tmp_path / "b.conll").write_text(CONLL.replace("pound", "euro"), "utf8")
+    reader = ConllCorpusReader(
+        str(tmp_path), r".*\.conll", ("words", "pos", "chunk", "tree")
+    )
+    methods = [
+        reader.words,
+        reader.tagged_sents,
+        reader.iob_sents,
+        reader.chunked_sents,
+        reader.parsed_sents,
+    ]
+    assert isinstance(reader._grids("a.conll"), StreamBackedCorpusView)
+    expected = [list(method()) for method in methods]
+    assert len(os.listdir(cache_dir)) == 2
+
+    reader = ConllCorpusReader(
+        str(tmp_path), r".*\.conll", ("words", "pos", "chunk", "tree")
+    )
+    assert isinstance(reader._grids("a.conll"), BinaryCorpusView)
+    assert [list(method()) for method in methods] == expected
+    assert reader.words("b.conll")[3] == "euro"
+
+    # Readers with other settings, and modified files, are not cached alike
+    other = ConllCorpusReader(
+        str(tmp_path), r".*\.conll", ("words", "pos", "chunk", "tree"), separator=" "
+    )
+    assert isinstance(other._grids("a.conll"), StreamBackedCorpusView)
+    (tmp_path / "a.conll").write_text(CONLL.replace("pound", "yen"), "utf8")
+    os.utime(tmp_path / "a.conll", ns=(0, 0))
+    assert isinstance(reader._grids("a.conll"), StreamBackedCorpusView)
+    assert reader.words("a.conll")[3] == "yen"
+
+
+def test_bracket_parse_cache(tmp_path, cache_dir):
+    (tmp_path / "trees.mrg").write_text(TREES, "utf8")
+    reader = BracketParseCorpusReader(str(tmp_path), r".*\.mrg")
+    expected = (
+        list(reader.parsed_sents()),
+        list(reader.tagged_sents()),
+        list(reader.tagged_words()),
+        list(reader.words()),
+    )
+    assert len(os.listdir(cache_dir)) == 4
+
+    reader = BracketParseCorpusReader(str(tmp_path), r".*\.mrg")
+    assert isinstance(reader.parsed_sents(), BinaryCorpusView)
+    assert isinstance(reader.sents(), StreamBackedCorpusView)
+    assert (
+        list(reader.parsed_sents()),
+        list(reader.tagged_sents()),
+        list(reader.tagged_words()),
+        list(reader.words()),
+    ) == expected
+    assert reader.parsed_sents()[2].leaves() == ["Zoë", "left"]
+
+
+def test_partial_reads_are_not_cached(tmp_path, cache_dir):
+    (tmp_path / "trees.mrg").write_text(TREES * 50, "utf8")
+    reader = BracketParseCorpusReader(str(tmp_path), r".*\.mrg")
+    view = reader.parsed_sents()
+    assert view[100].label() == "S"
+    assert not os.path.exists(cache_dir)
+    assert len(view) == 150
+    assert len(os.listdir(cache_dir)) == 1
+
+    view = concat([reader.parsed_sents(), reader.sents()])
+    assert len(view) == 300
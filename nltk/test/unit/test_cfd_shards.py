@@ -0,0 +1,89 @@
+"""
+Tests for merging, sharding and memory-mapping ConditionalFreqDist
+"""
+
+import pytest
+
+from nltk.probability import ConditionalFreqDist, MappedConditionalFreqDist, MLEProbDist
+from nltk.util import bigrams
+
+SHARDS = [
+    "the cat sat on the mat".split(),
+    "the dog sat on the log".split(),
+    [],
+    "a cat and a dog".split(),
+]
+
+
+def _expected():
+    return ConditionalFreqDist(pair for shard in SHARDS for pair in bigrams(shard))
+
+
+def test_merge():
+    cfd = ConditionalFreqDist(bigrams(SHARDS[0]))
+    for shard in SHARDS[1:]:
+        cfd.merge(ConditionalFreqDist(bigrams(shard)))
+    assert cfd == _expected()
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_from_shards(processes):
+    cfd = ConditionalFreqDist.from_shards(SHARDS, bigrams, processes=processes)
+    assert cfd == _expected()
+    assert cfd.N() == _expected().N()
+
+
+@pytest.fixture
+def mapped(tmp_path):
+    pytest.importorskip("numpy")
+    cfd = _expected()
+    cfd[3][("a", 1)] += 2
+    cfd[("x", "y")]["é"] += 1
+    path = str(tmp_path / "cfd.bin")
+    cfd.save_mmap(path)
+    return cfd, MappedConditionalFreqDist(path)
+
+
+def test_mmap_roundtrip(mapped):
+    cfd, loaded = mapped
+    assert len(loaded) == len(cfd)
+    assert set(loaded.conditions()) == set(cfd.conditions())
+    assert loaded.N() == cfd.N()
+    for condition in cfd:
+        assert condition in loaded
+        assert dict(loaded[condition].items()) == dict(cfd[condition])
+        assert loaded[condition].N() == cfd[condition].N()
+        assert loaded[condition].B() == cfd[condition].B()
+        assert loaded[condition].freq(loaded[condition].max()) == cfd[condition].freq(
+            cfd[condition].max()
+        )
+    assert loaded[3][("a", 1)] == 2
+    assert loaded[("x", "y")]["é"] == 1
+
+
+def test_mmap_missing(mapped):
+    _, loaded = mapped
+    assert "zebra" not in loaded
+    assert [1, 2] not in loaded
+    assert len(loaded["zebra"]) == 0
+    assert loaded["zebra"].N() == 0
+    assert loaded["the"]["zebra"] == 0
+    assert loaded["the"][{}] == 0
+
+
+def test_mmap_estimator(mapped):
+    cfd, loaded = mapped
+    expected = MLEProbDist(cfd["the"])
+    actual = MLEProbDist(loaded["the"])
+    for sample in cfd["the"]:
+        assert actual.prob(sample) == expected.prob(sample)
+    assert loaded[3].most_common(1) == [(("a", 1), 2)]
+    assert sorted(loaded["the"].most_common()) == sorted(cfd["the"].most_common())
+
+
+def test_mmap_bad_magic(tmp_path):
+    pytest.importorskip("numpy")
+    path = tmp_path / "cfd.bin"
+    path.write_bytes(b"garbage!" * 4)
+    with pytest.raises(ValueError):
+        MappedConditionalFreqDist(str(path))
@@ -0,0 +1,47 @@
+"""
+Tests for the nltk command-line interface
+"""
+
+import pytest
+from click.testing import CliRunner
+
+from nltk.cli import cli
+
+TEXT = "Good muffins cost $3.88\nin New York.\n\nPlease buy me two of them.\n" * 5
+
+
+@pytest.mark.parametrize("processes", ["1", "2"])
+def test_tokenize(processes):
+    result = CliRunner().invoke(
+        cli, ["tokenize", "-p", "-j", processes, "-b", "3", "-d", "|"], input=TEXT
+    )
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert lines[:4] == [
+        "Good|muffins|cost|$|3.88",
+        "in|New|York|.",
+        "",
+        "Please|buy|me|two|of|them|.",
+    ]
+    assert lines == lines[:4] * 5
+
+
+def test_tokenize_defaults(mocker):
+    word_tokenize = mocker.patch("nltk.cli.word_tokenize", return_value=["a", "b"])
+
+    result = CliRunner().invoke(cli, ["tokenize"], input="a b\n")
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == ["a b"]
+    # Lines are split into sentences before being tokenized, as by default
+    # in word_tokenize
+    word_tokenize.assert_called_once_with("a b", "english", False)
+
+
+def test_pos_tag(mocker):
+    tagger = mocker.Mock()
+    tagger.tag.side_effect = lambda tokens: [(token, "X") for token in tokens]
+    mocker.patch("nltk.tag._get_tagger", return_value=tagger)
+
+    result = CliRunner().invoke(cli, ["pos_tag", "-b", "2"], input="a b\n\nc\n")
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == ["a/X b/X", "", "c/X"]
@@ -1,5 +1,19 @@
-from nltk.collocations import BigramCollocationFinder
-from nltk.metrics import BigramAssocMeasures
+import pickle
+import random
+
+import pytest
+
+from nltk.collocations import (
+    BigramCollocationFinder,
+    QuadgramCollocationFinder,
+    TrigramCollocationFinder,
+)
+from nltk.metrics import (
+    BigramAssocMeasures,
+    QuadgramAssocMeasures,
+    TrigramAssocMeasures,
+)
+from nltk.probability import CountMinSketch, SpaceSavingCounter
 
 ## Test bigram counters with discontinuous bigrams and repeated words
 
@@ -118,3 +132,163 @@ def test_bigram5():
             ]
         ),
     )
+
+
+## Test approximate, mergeable collocation finders
+
+
+def _documents(n=200, seed=0):
+    rng = random.Random(seed)
+    filler = "a the of and to in is it that was for on are with as".split()
+    phrases = [["new", "york"], ["ice", "cream"], ["prime", "minister"]]
+    documents = []
+    for _ in range(n):
+        doc = []
+        for _ in range(rng.randint(3, 12)):
+            if rng.random() < 0.2:
+                doc.extend(rng.choice(phrases))
+            else:
+                doc.append(rng.choice(filler))
+        documents.append(doc)
+    return documents
+
+
+@pytest.mark.parametrize(
+    "finder_class, score_fn, window_size",
+    [
+        (BigramCollocationFinder, BigramAssocMeasures.likelihood_ratio, 2),
+        (BigramCollocationFinder, BigramAssocMeasures.pmi, 3),
+        (TrigramCollocationFinder, TrigramAssocMeasures.raw_freq, 3),
+        (QuadgramCollocationFinder, None, 4),
+    ],
+)
+def test_approximate_matches_exact(finder_class, score_fn, window_size):
+    documents = _documents()
+    exact = finder_class.from_documents(documents)
+    if window_size != finder_class.default_ws:
+        exact = finder_class.from_words(
+            finder_class._build_new_documents(documents, window_size, pad_right=True),
+            window_size,
+        )
+    approx = finder_class.approximate(window_size, capacity=10000, epsilon=1e-4)
+    for doc in documents:
+        approx.update(doc)
+
+    assert approx.N == exact.N
+    assert dict(approx.ngram_fd.items()) == dict(exact.ngram_fd)
+    if score_fn is not None:
+        assert approx.score_ngrams(score_fn) == exact.score_ngrams(score_fn)
+
+
+def test_approximate_merge():
+    documents = _documents()
+    whole = BigramCollocationFinder.approximate(capacity=10000, epsilon=1e-4)
+    parts = [
+        BigramCollocationFinder.approximate(capacity=10000, epsilon=1e-4)
+        for _ in range(2)
+    ]
+    for i, doc in enumerate(documents):
+        whole.update(doc)
+        parts[i % 2].update(doc)
+    merged = pickle.loads(pickle.dumps(parts[0]))
+    merged.merge(parts[1])
+
+    assert merged.N == whole.N
+    assert dict(merged.ngram_fd.items()) == dict(whole.ngram_fd.items())
+    assert merged.score_ngrams(BigramAssocMeasures.pmi) == whole.score_ngrams(
+        BigramAssocMeasures.pmi
+    )
+
+    exact = BigramCollocationFinder.from_documents(documents[::2])
+    exact.merge(BigramCollocationFinder.from_documents(documents[1::2]))
+    assert exact.ngram_fd == BigramCollocationFinder.from_documents(documents).ngram_fd
+
+
+def test_approximate_bounded_error():
+    documents = _documents(1000)
+    exact = BigramCollocationFinder.from_documents(documents)
+    approx = BigramCollocationFinder.approximate(capacity=20, epsilon=1e-3)
+    for doc in documents:
+        approx.update(doc)
+
+    assert len(approx.ngram_fd) <= 20
+    for ngram in approx.ngram_fd:
+        assert approx.ngram_fd[ngram] <= exact.ngram_fd[ngram]
+        assert exact.ngram_fd[ngram] <= approx.ngram_fd[ngram] + (
+            approx.ngram_fd.error(ngram)
+        )
+    for word, count in exact.word_fd.items():
+        assert count <= approx.word_fd[word] <= count + 1e-3 * exact.N
+    frequent = [
+        ngram for ngram, count in exact.ngram_fd.items() if count > exact.N / 20
+    ]
+    assert frequent and all(ngram in approx.ngram_fd for ngram in frequent)
+    assert approx.nbest(BigramAssocMeasures.raw_freq, 3) == exact.nbest(
+        BigramAssocMeasures.raw_freq, 3
+    )
+
+    approx.apply_freq_filter(5)
+    assert isinstance(approx.ngram_fd, SpaceSavingCounter)
+    assert all(count >= 5 for _, count in approx.ngram_fd.items())
+
+
+def test_approximate_bigram_finder():
+    exact = TrigramCollocationFinder.from_documents(_documents(20))
+    assert exact.bigram_finder().ngram_fd == exact.bigram_fd
+
+    approx = TrigramCollocationFinder.approximate(capacity=100)
+    approx.update(_documents(1)[0])
+    with pytest.raises(TypeError):
+        approx.bigram_finder()
+
+
+def test_count_min_sketch():
+    sketch = CountMinSketch(epsilon=0.1, delta=0.1)
+    with pytest.raises(TypeError):
+        list(sketch)
+    with pytest.raises(ValueError):
+        sketch.merge(CountMinSketch(epsilon=0.01))
+
+
+## Test the vectorized scoring of association measures
+
+MEASURES = ["raw_freq", "student_t", "chi_sq", "pmi", "likelihood_ratio"]
+MEASURES += ["poisson_stirling", "jaccard", "mi_like"]
+
+
+@pytest.mark.parametrize(
+    "finder_class, measures, window_size",
+    [
+        (BigramCollocationFinder, BigramAssocMeasures, 2),
+        (BigramCollocationFinder, BigramAssocMeasures, 4),
+        (TrigramCollocationFinder, TrigramAssocMeasures, 3),
+        (QuadgramCollocationFinder, QuadgramAssocMeasures, 4),
+    ],
+)
+def test_vectorized_scores(finder_class, measures, window_size):
+    pytest.importorskip("numpy")
+    words = [word for doc in _documents() for word in doc]
+    finder = finder_class.from_words(words, window_size)
+    finder.apply_freq_filter(2)
+    names = MEASURES + (["phi_sq", "dice"] if measures is BigramAssocMeasures else [])
+    for name in names:
+        score_fn = getattr(measures, name)
+        vectorized = dict(finder._score_ngrams_vectorized(score_fn))
+        expected = dict(finder._score_ngrams_iter(score_fn))
+        assert vectorized.keys() == expected.keys()
+        for ngram, score in expected.items():
+            assert vectorized[ngram] == pytest.approx(score, rel=1e-9), name
+
+
+def test_vectorized_fallback():
+    pytest.importorskip("numpy")
+    finder = BigramCollocationFinder.from_words(SENT)
+    custom = lambda n_ii, n_ix_xi, n_xx: max(n_ii, 1)
+    assert finder.score_ngrams(custom) == sorted(
+        finder._score_ngrams_iter(custom), key=lambda t: (-t[1], t[0])
+    )
+    assert finder._score_ngrams_vectorized(BigramAssocMeasures.fisher) is None
+    # Scores which are not finite are left to the per-ngram path
+    finder = BigramCollocationFinder.from_words("a a a".split())
+    with pytest.raises(ZeroDivisionError):
+        finder.score_ngrams(BigramAssocMeasures.phi_sq)
@@ -1,10 +1,14 @@
 import contextlib
+import os
+import random
+import shutil
 import sys
+import tempfile
 import unittest
 from io import StringIO
 
 from nltk.corpus import gutenberg
-from nltk.text import Text
+from nltk.text import ConcordanceIndex, MappedConcordanceIndex, Text
 
 
 @contextlib.contextmanager
@@ -96,3 +100,57 @@ class TestConcordance(unittest.TestCase):
             return raw_str.replace(" ", "")
 
         self.assertEqual(strip_space(print_out), strip_space(stdout.getvalue()))
+
+
+class TestMappedConcordanceIndex(unittest.TestCase):
+    def setUp(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        rng = random.Random(0)
+        vocab = "The the cat Cat sat on a mat dog ran é naïve".split()
+        self.tokens = [rng.choice(vocab) for _ in range(5000)]
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "index.bin")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_matches_concordance_index(self):
+        expected = ConcordanceIndex(self.tokens, key=str.lower)
+        index = MappedConcordanceIndex.build(
+            iter(self.tokens), self.path, key=str.lower, buffer_size=333
+        )
+        self.assertEqual(list(index.tokens()), self.tokens)
+        for word in ["the", "CAT", "é", "naïve", "zebra"]:
+            self.assertEqual(index.offsets(word).tolist(), expected.offsets(word))
+        for query in ["mat", ["the", "cat"], ["a", "dog", "ran"], ["zebra", "cat"]]:
+            self.assertEqual(
+                index.find_concordance(query, width=60),
+                expected.find_concordance(query, width=60),
+            )
+        with stdout_redirect(StringIO()) as stdout:
+            index.print_concordance("zebra")
+        self.assertEqual(stdout.getvalue(), "no matches\n")
+
+    def test_reopen(self):
+        MappedConcordanceIndex.build(self.tokens, self.path)
+        index = MappedConcordanceIndex(self.path)
+        self.assertEqual(
+            repr(index), "<MappedConcordanceIndex for 5000 tokens (12 types)>"
+        )
+        self.assertEqual(index.tokens()[-3:], self.tokens[-3:])
+        self.assertEqual(index.offsets("cat").tolist()[:1], [self.tokens.index("cat")])
+        self.assertEqual(len(index.offsets("The")), self.tokens.count("The"))
+
+    def test_empty(self):
+        index = MappedConcordanceIndex.build([], self.path)
+        self.assertEqual(len(index.tokens()), 0)
+        self.assertEqual(index.find_concordance("cat"), [])
+
+    def test_bad_file(self):
+        with open(self.path, "wb") as fout:
+            fout.write(b"garbage!" * 4)
+        with self.assertRaises(ValueError):
+            MappedConcordanceIndex(self.path)
@@ -0,0 +1,68 @@
+"""
+Tests for CorpusReader.imap
+"""
+
+import pickle
+
+import pytest
+
+from nltk.corpus.reader import PlaintextCorpusReader, TaggedCorpusReader
+from nltk.corpus.reader.util import StreamBackedCorpusView
+
+
+@pytest.fixture
+def root(tmp_path):
+    for n in range(3):
+        lines = [
+            " ".join(f"w{n}_{i}/T{j % 3}" for j in range(i % 5 + 1)) for i in range(200)
+        ]
+        (tmp_path / f"file{n}.pos").write_text("\n\n".join(lines) + "\n", "utf8")
+    return str(tmp_path)
+
+
+def test_imap_matches_direct_computation(root):
+    reader = TaggedCorpusReader(root, r".*\.pos")
+    expected = [len(sent) for sent in reader.tagged_sents()]
+    assert list(reader.imap(len, "tagged_sents")) == expected
+    assert list(reader.imap(len, "tagged_sents", processes=2)) == expected
+    assert list(reader.imap(len, "sents", fileids="file1.pos")) == [
+        len(sent) for sent in reader.sents("file1.pos")
+    ]
+
+
+def test_imap_keyword_arguments(root):
+    reader = TaggedCorpusReader(root, r".*\.pos")
+    assert list(reader.imap(str, "tagged_words", tagset="en-ptb", processes=2)) == [
+        str(word) for word in reader.tagged_words(tagset="en-ptb")
+    ]
+
+
+def test_imap_plaintext(root):
+    reader = PlaintextCorpusReader(root, r".*\.pos")
+    # Its lazily loaded sentence tokenizer must survive pickling
+    pickle.loads(pickle.dumps(reader))
+    assert list(reader.imap(str.upper, processes=2)) == [
+        word.upper() for word in reader.words()
+    ]
+
+
+def test_imap_block_ranges(root, tmp_path, monkeypatch):
+    reader = TaggedCorpusReader(root, r".*\.pos")
+    expected = [len(sent) for sent in reader.tagged_sents()]
+    monkeypatch.setattr(StreamBackedCorpusView, "INDEX_DIR", str(tmp_path / "index"))
+
+    # Without a known block index, files are not split
+    assert len(reader._imap_units("tagged_sents", "file0.pos", 10, {})) == 1
+    assert len(reader.tagged_sents("file0.pos")) == 200
+    units = reader._imap_units("tagged_sents", "file0.pos", 10, {})
+    assert len(units) > 1
+    assert units[0][1] == 0 and units[-1][3] == 200
+    assert all(a[3] == b[1] for a, b in zip(units, units[1:]))
+
+    for fileid in reader.fileids():
+        len(reader.tagged_sents(fileid))
+    for processes in (1, 2):
+        assert (
+            list(reader.imap(len, "tagged_sents", processes=processes, block_size=10))
+            == expected
+        )
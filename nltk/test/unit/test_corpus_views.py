@@ -1,14 +1,25 @@
 """
 Corpus View Regression Tests
 """
+import os
+import pickle
+import random
+import shutil
+import tempfile
 import unittest
 
 import nltk.data
+from nltk.corpus.reader import PlaintextCorpusReader, TaggedCorpusReader
 from nltk.corpus.reader.util import (
+    _INDEX_MAGIC,
     StreamBackedCorpusView,
+    _BulkLineReader,
+    read_blankline_block,
     read_line_block,
+    read_regexp_block,
     read_whitespace_block,
 )
+from nltk.data import SeekableUnicodeStreamReader
 
 
 class TestCorpusViews(unittest.TestCase):
@@ -45,3 +56,200 @@ class TestCorpusViews(unittest.TestCase):
 
             v = StreamBackedCorpusView(f, read_line_block)
             self.assertEqual(len(v), len(self.linetok.tokenize(file_data)))
+
+
+class TestBlockCacheAndIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "corpus.txt")
+        lines = [" ".join(f"w{i}_{j}" for j in range(i % 7)) for i in range(500)]
+        with open(self.path, "w", encoding="utf8") as fout:
+            fout.write("\n".join(lines) + "\n")
+        with open(self.path, encoding="utf8") as fin:
+            self.tokens = fin.read().split()
+        self.index_dir = os.path.join(self.tmpdir, "index")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_lru_cache(self):
+        view = StreamBackedCorpusView(self.path, read_whitespace_block, cache_size=8)
+        rng = random.Random(0)
+        for i in [rng.randrange(len(self.tokens)) for _ in range(300)]:
+            self.assertEqual(view[i], self.tokens[i])
+            self.assertEqual(list(view[i : i + 30]), self.tokens[i : i + 30])
+        self.assertLessEqual(len(view._block_cache), 8)
+        self.assertEqual(list(view), self.tokens)
+        self.assertEqual(view[-1], self.tokens[-1])
+
+        # Blocks in the cache are not read again
+        view = StreamBackedCorpusView(self.path, read_whitespace_block, cache_size=1000)
+        self.assertEqual(list(view), self.tokens)
+        view.read_block = None
+        self.assertEqual(list(view), self.tokens)
+        self.assertEqual(view[57], self.tokens[57])
+
+    def test_persisted_index(self):
+        view = StreamBackedCorpusView(
+            self.path, read_whitespace_block, index_dir=self.index_dir
+        )
+        self.assertEqual(len(view), len(self.tokens))
+        self.assertEqual(len(os.listdir(self.index_dir)), 1)
+
+        view = StreamBackedCorpusView(
+            self.path, read_whitespace_block, index_dir=self.index_dir
+        )
+        self.assertEqual(len(view), len(self.tokens))
+        self.assertIsNone(view._stream)
+        self.assertGreater(len(view._toknum), 1)
+        self.assertEqual(view[-3], self.tokens[-3])
+        self.assertEqual(list(view), self.tokens)
+
+        # Indices are plain arrays, and other files are ignored
+        (index_file,) = os.listdir(self.index_dir)
+        index_path = os.path.join(self.index_dir, index_file)
+        with open(index_path, "rb") as fin:
+            self.assertEqual(fin.read(len(_INDEX_MAGIC)), _INDEX_MAGIC)
+            data = fin.read()
+        for content in [pickle.dumps(([0], [0], 1)), _INDEX_MAGIC + data[:-1]]:
+            with open(index_path, "wb") as fout:
+                fout.write(content)
+            view = StreamBackedCorpusView(
+                self.path, read_whitespace_block, index_dir=self.index_dir
+            )
+            self.assertEqual(len(view), len(self.tokens))
+
+        # Views with other block readers have their own index
+        view = StreamBackedCorpusView(
+            self.path, read_line_block, index_dir=self.index_dir
+        )
+        self.assertEqual(len(view._toknum), 1)
+        self.assertEqual(len(view), 500)
+        self.assertEqual(len(os.listdir(self.index_dir)), 2)
+
+        # Modifying the file invalidates its index
+        with open(self.path, "a", encoding="utf8") as fout:
+            fout.write("one more line\n")
+        view = StreamBackedCorpusView(
+            self.path, read_whitespace_block, index_dir=self.index_dir
+        )
+        self.assertEqual(len(view), len(self.tokens) + 3)
+
+    def test_class_defaults(self):
+        class CachedView(StreamBackedCorpusView):
+            CACHE_SIZE = 5
+            INDEX_DIR = self.index_dir
+
+        view = CachedView(self.path, read_whitespace_block)
+        self.assertEqual(list(view), self.tokens)
+        self.assertEqual(len(view._block_cache), 5)
+        self.assertTrue(os.listdir(self.index_dir))
+
+
+class TestBulkRead(unittest.TestCase):
+    pieces = ["a", "bb", " ", "\t", "\n", "\r", "\r\n", "\n\n", "  \n", "é", "\x0c"]
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "corpus.txt")
+        self.buffer_size = _BulkLineReader.BUFFER_SIZE
+        # The sanity check of SeekableUnicodeStreamReader.tell() fails on
+        # some multi-byte characters, at the right file positions
+        SeekableUnicodeStreamReader.DEBUG = False
+
+    def tearDown(self):
+        _BulkLineReader.BUFFER_SIZE = self.buffer_size
+        SeekableUnicodeStreamReader.DEBUG = True
+        shutil.rmtree(self.tmpdir)
+
+    def check(self, data, same_filepos=True):
+        with open(self.path, "wb") as fout:
+            fout.write(data)
+        for block_reader in (
+            read_whitespace_block,
+            read_line_block,
+            read_blankline_block,
+        ):
+            view = StreamBackedCorpusView(self.path, block_reader)
+            view.BULK_READ = False
+            tokens = list(view)
+            bulk_view = StreamBackedCorpusView(self.path, block_reader)
+            self.assertEqual(list(bulk_view), tokens)
+            if same_filepos:
+                self.assertEqual(bulk_view._filepos, view._filepos)
+                self.assertEqual(bulk_view._toknum, view._toknum)
+            bulk_view = StreamBackedCorpusView(self.path, block_reader)
+            for i in reversed(range(0, len(tokens), 7)):
+                self.assertEqual(bulk_view[i], tokens[i])
+
+    def test_same_blocks(self):
+        rng = random.Random(0)
+        for buffer_size in (1, 5, 1 << 20):
+            _BulkLineReader.BUFFER_SIZE = buffer_size
+            for _ in range(10):
+                text = "".join(rng.choice(self.pieces) for _ in range(300))
+                self.check(text.encode("utf8"))
+            # The line by line reader misplaces blocks after a byte order mark
+            self.check(b"\xef\xbb\xbfone two\n\nthree\r\n", same_filepos=False)
+            self.check("Zoë\n\nnaïve café\n日本 語\n\n\n".encode("utf8") * 20)
+            self.check(b"")
+
+    def test_bulk_stream(self):
+        with open(self.path, "w", encoding="utf8") as fout:
+            fout.write("one two\nthree\n")
+        view = StreamBackedCorpusView(self.path, read_line_block)
+        self.assertEqual(view[1], "three")
+        self.assertIsInstance(view._stream, _BulkLineReader)
+        view = StreamBackedCorpusView(self.path, read_line_block, encoding="latin1")
+        self.assertEqual(view[1], "three")
+        self.assertNotIsInstance(view._stream, _BulkLineReader)
+
+    def test_reader_methods(self):
+        with open(self.path, "w", encoding="utf8") as fout:
+            fout.write("The/DT cat/NN sat/VBD ./.\n\nA/DT dog/NN ./.\n" * 50)
+        readers = [
+            PlaintextCorpusReader(self.tmpdir, ["corpus.txt"], sent_tokenizer=None),
+            TaggedCorpusReader(self.tmpdir, ["corpus.txt"]),
+        ]
+        views = [readers[0].words, readers[1].tagged_paras]
+        expected = []
+        for view in (views[0](), views[1]()):
+            self.assertTrue(view._reads_in_bulk())
+            self.assertTrue(view[1])
+            self.assertIsInstance(view._stream, _BulkLineReader)
+            expected.append(list(view))
+        StreamBackedCorpusView.BULK_READ = False
+        try:
+            self.assertEqual([list(views[0]()), list(views[1]())], expected)
+        finally:
+            StreamBackedCorpusView.BULK_READ = True
+
+        # Block readers which are not known to read whole lines only are
+        # read line by line
+        reader = TaggedCorpusReader(
+            self.tmpdir,
+            ["corpus.txt"],
+            para_block_reader=lambda stream: read_regexp_block(stream, r".*"),
+        )
+        view = reader.tagged_paras()
+        self.assertFalse(view._reads_in_bulk())
+        self.assertTrue(list(view))
+
+    def test_index_per_mode(self):
+        index_dir = os.path.join(self.tmpdir, "index")
+        with open(self.path, "wb") as fout:
+            fout.write(b"\xef\xbb\xbfone two\n\nthree\r\n")
+        # An index saved in one mode is not loaded in the other
+        for bulk_read in (True, False):
+            view = StreamBackedCorpusView(
+                self.path, read_blankline_block, index_dir=index_dir
+            )
+            view.BULK_READ = bulk_read
+            self.assertEqual(len(view), 2)
+        self.assertEqual(len(os.listdir(index_dir)), 2)
+        for bulk_read in (True, False):
+            view = StreamBackedCorpusView(
+                self.path, read_blankline_block, index_dir=index_dir
+            )
+            view.BULK_READ = bulk_read
+            self.assertEqual(list(view), ["one two\n", "three\r\n"])
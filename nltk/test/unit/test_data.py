@@ -1,6 +1,12 @@
+import gzip
+import random
+import zipfile
+
 import pytest
 
 import nltk.data
+from nltk.corpus.reader.util import StreamBackedCorpusView, read_whitespace_block
+from nltk.data import OpenOnDemandZipFile, ZipFilePathPointer
 
 
 def test_find_raises_exception():
@@ -13,3 +19,101 @@ def test_find_raises_exception_with_full_resource_name():
     with pytest.raises(LookupError) as exc:
         nltk.data.find(no_such_thing)
         assert no_such_thing in str(exc)
+
+
+TEXT = "".join(f"line {i} caf\u00e9 {'x' * (i % 37)}\n" for i in range(20000)).encode(
+    "utf8"
+)
+
+
+@pytest.fixture
+def zip_path(tmp_path):
+    path = str(tmp_path / "corpus.zip")
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("corpus/stored.txt", TEXT, zipfile.ZIP_STORED)
+        zf.writestr("corpus/deflated.txt", TEXT, zipfile.ZIP_DEFLATED)
+        zf.writestr("corpus/bzipped.txt", TEXT, zipfile.ZIP_BZIP2)
+        zf.writestr("corpus/text.gz", gzip.compress(TEXT), zipfile.ZIP_STORED)
+    return path
+
+
+@pytest.mark.parametrize("entry", ["stored", "deflated", "bzipped"])
+def test_zip_member_streams(zip_path, entry, monkeypatch):
+    monkeypatch.setattr(nltk.data._DeflatedZipMember, "CHUNK_SIZE", 1000)
+    monkeypatch.setattr(nltk.data._DeflatedZipMember, "CHECKPOINT_SIZE", 50000)
+    stream = ZipFilePathPointer(zip_path, f"corpus/{entry}.txt").open()
+    assert stream.read() == TEXT
+    rng = random.Random(0)
+    for _ in range(200):
+        pos, size = rng.randrange(len(TEXT) + 10), rng.randrange(5000)
+        assert stream.seek(pos) == pos
+        assert stream.read(size) == TEXT[pos : pos + size]
+        assert stream.tell() == min(pos + size, max(pos, len(TEXT)))
+    stream.seek(-100, 2)
+    assert stream.readline() == TEXT[-100:].split(b"\n", 1)[0] + b"\n"
+    stream.seek(0)
+    assert list(stream) == TEXT.splitlines(True)
+
+
+def test_zip_member_unicode_streams(zip_path):
+    expected = TEXT.decode("utf8").splitlines(True)
+    for entry in ["stored.txt", "deflated.txt", "text.gz"]:
+        pointer = ZipFilePathPointer(zip_path, f"corpus/{entry}")
+        stream = pointer.open("utf8") if entry.endswith("txt") else pointer.open()
+        lines = stream.readlines()
+        if entry.endswith("gz"):
+            lines = [line.decode("utf8") for line in lines]
+        assert lines == expected
+
+
+def test_zip_central_directory_cache(zip_path):
+    pointer = ZipFilePathPointer(zip_path, "corpus/stored.txt")
+    assert isinstance(pointer.zipfile, OpenOnDemandZipFile)
+    assert ZipFilePathPointer(zip_path, "corpus/").zipfile is pointer.zipfile
+    with zipfile.ZipFile(zip_path, "a") as zf:
+        zf.writestr("corpus/new.txt", b"new")
+    pointer = ZipFilePathPointer(zip_path, "corpus/new.txt")
+    assert pointer.open().read() == b"new"
+
+
+def test_zip_corpus_view(zip_path, tmp_path):
+    (tmp_path / "corpus.txt").write_bytes(TEXT)
+    expected = list(
+        StreamBackedCorpusView(str(tmp_path / "corpus.txt"), read_whitespace_block)
+    )
+    for entry in ["stored.txt", "deflated.txt"]:
+        pointer = ZipFilePathPointer(zip_path, f"corpus/{entry}")
+        view = StreamBackedCorpusView(pointer, read_whitespace_block)
+        assert list(view) == expected
+        assert view[12345] == expected[12345] and view[10] == expected[10]
+
+
+def test_zip_member_highly_compressible(tmp_path, monkeypatch):
+    # The last bytes of input may be consumed while the decompressor still
+    # holds output back, for sizes near multiples of the chunk size
+    for chunk_size in (1 << 16, 1000):
+        monkeypatch.setattr(nltk.data._DeflatedZipMember, "CHUNK_SIZE", chunk_size)
+        for size in range(chunk_size - 7, chunk_size + 1000, 7):
+            path = str(tmp_path / f"{chunk_size}-{size}.zip")
+            with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+                zf.writestr("x.txt", b"a" * size)
+            assert ZipFilePathPointer(path, "x.txt").open().read() == b"a" * size
+
+
+def test_zip_member_maps_released(zip_path):
+    def maps():
+        return [key for key in OpenOnDemandZipFile._mapped if key[0] == zip_path]
+
+    streams = [
+        ZipFilePathPointer(zip_path, f"corpus/{entry}.txt").open()
+        for entry in ["stored", "deflated", "stored"]
+    ]
+    assert len(maps()) == 1
+    for stream in streams:
+        stream.read(10)
+        stream.close()
+        stream.close()
+    assert not maps()
+    with ZipFilePathPointer(zip_path, "corpus/bzipped.txt").open() as stream:
+        assert stream.read() == TEXT
+    assert not maps()
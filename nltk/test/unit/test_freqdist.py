@@ -1,7 +1,158 @@
+import random
+
+import pytest
+
 import nltk
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 def test_iterating_returns_an_iterator_ordered_by_frequency():
     samples = ["one", "two", "two"]
     distribution = nltk.FreqDist(samples)
     assert list(distribution) == ["two", "one"]
+
+
+def _zipf_freqdist(types, seed=0):
+    rng = random.Random(seed)
+    return nltk.FreqDist(
+        {
+            f"w{i}": max(1, int(1000 / (i + 1) * rng.uniform(0.5, 1.5)))
+            for i in range(types)
+        }
+    )
+
+
+@pytest.mark.filterwarnings("ignore:SimpleGoodTuring")
+def test_simple_good_turing_table_matches_formula():
+    fd = _zipf_freqdist(300)
+    sgt = nltk.SimpleGoodTuringProbDist(fd, bins=400)
+    for sample in list(fd) + ["unseen"]:
+        count = fd[sample]
+        expected = sgt._prob_measure(count)
+        if count:
+            expected *= sgt._renormal
+        else:
+            expected /= 400 - fd.B()
+        assert sgt.prob(sample) == expected
+
+
+@pytest.mark.filterwarnings("ignore:SimpleGoodTuring")
+def test_simple_good_turing_update():
+    fd = _zipf_freqdist(200)
+    sgt = nltk.SimpleGoodTuringProbDist(fd)
+    more = _zipf_freqdist(300, seed=1)
+    sgt.update(more)
+    sgt.update(["w0", "w0", "new"])
+
+    expected_fd = _zipf_freqdist(200) + more + nltk.FreqDist(["w0", "w0", "new"])
+    expected = nltk.SimpleGoodTuringProbDist(expected_fd)
+    assert sgt.freqdist() == expected_fd
+    assert sgt._count_Nr == {
+        r: nr for r, nr in expected_fd.r_Nr().items() if r > 0 and nr > 0
+    }
+    for sample in ["w0", "w10", "w250", "new", "unseen"]:
+        assert sgt.prob(sample) == expected.prob(sample)
+
+
+@pytest.fixture
+def words():
+    rng = random.Random(0)
+    return [f"w{int(rng.paretovariate(1.2))}" for _ in range(5000)]
+
+
+def test_compact_freqdist_matches_freqdist(words):
+    pytest.importorskip("numpy")
+    fd = nltk.FreqDist(words)
+    cfd = nltk.CompactFreqDist(iter(words))
+    assert cfd == fd
+    assert (cfd.N(), cfd.B(), len(cfd)) == (fd.N(), fd.B(), len(fd))
+    assert cfd.keys() == list(fd.keys())
+    assert list(cfd) == list(fd)
+    for n in [None, 0, 1, 5, 17, fd.B(), fd.B() + 3]:
+        assert cfd.most_common(n) == fd.most_common(n)
+    assert cfd.r_Nr(10000) == fd.r_Nr(10000)
+    assert [cfd.Nr(r) for r in range(5)] == [fd.Nr(r) for r in range(5)]
+    assert cfd.hapaxes() == fd.hapaxes()
+    assert cfd.max() == fd.max()
+    assert cfd["w1"] == fd["w1"] and cfd["unseen"] == 0
+    assert cfd.freq("w2") == fd.freq("w2")
+
+
+def test_compact_freqdist_updates(words):
+    pytest.importorskip("numpy")
+    cfd = nltk.CompactFreqDist()
+    ids = cfd.index(words)
+    cfd.update_ids(ids[:1000])
+    cfd.update_ids(ids[1000:], np.ones(len(ids) - 1000, dtype=int))
+    cfd["w1"] += 1
+    cfd.update({"w2": 2, "new": 3})
+    del cfd["w3"]
+
+    fd = nltk.FreqDist(words)
+    fd["w1"] += 1
+    fd.update({"w2": 2, "new": 3})
+    del fd["w3"]
+    assert cfd == fd
+    assert cfd.N() == fd.N()
+    assert "w3" not in cfd
+    assert cfd.most_common(5) == fd.most_common(5)
+    assert cfd.sample(ids[0]) == words[0]
+    with pytest.raises(ValueError):
+        cfd.update_ids([len(words) + 1])
+    assert cfd.copy() == cfd and (cfd + cfd)["new"] == 6
+
+
+def test_compact_freqdist_operators(words):
+    pytest.importorskip("numpy")
+    half = len(words) // 2
+    fd1, fd2 = nltk.FreqDist(words[:half]), nltk.FreqDist(words[half:])
+    cfd1, cfd2 = nltk.CompactFreqDist(words[:half]), nltk.CompactFreqDist(words[half:])
+    for op in ["__add__", "__sub__", "__or__", "__and__"]:
+        expected = getattr(fd1, op)(fd2)
+        for other in (cfd2, fd2):
+            result = getattr(cfd1, op)(other)
+            assert isinstance(result, nltk.CompactFreqDist)
+            assert result == expected
+            assert result.most_common() == expected.most_common()
+    for op in ["__le__", "__ge__", "__lt__", "__gt__"]:
+        for a, b in [(fd1, fd2), (fd1, fd1), (fd1 & fd2, fd1), (fd1, fd1 | fd2)]:
+            expected = getattr(a, op)(b)
+            ca = nltk.CompactFreqDist(a)
+            assert getattr(ca, op)(nltk.CompactFreqDist(b)) == expected
+            assert getattr(ca, op)(b) == expected
+            assert getattr(a, op)(nltk.CompactFreqDist(b)) == expected
+    with pytest.raises(TypeError):
+        cfd1 <= {"w1": 1}
+
+    for sample in ["w1", "new"]:
+        cfd1.setdefault(sample, 2)
+        fd1.setdefault(sample, 2)
+    cfd1.update(None)
+    cfd1.update(["w1", "w2"], {"w3": 2}, w4=1)
+    fd1.update(["w1", "w2"])
+    fd1.update({"w3": 2}, w4=1)
+    assert cfd1 == fd1 and cfd1.N() == fd1.N()
+
+
+@pytest.mark.filterwarnings("ignore:SimpleGoodTuring")
+@pytest.mark.parametrize(
+    "estimator",
+    [
+        nltk.MLEProbDist,
+        nltk.LaplaceProbDist,
+        nltk.ELEProbDist,
+        lambda fd: nltk.WittenBellProbDist(fd, 1000),
+        lambda fd: nltk.SimpleGoodTuringProbDist(fd, 1000),
+    ],
+)
+def test_compact_freqdist_estimators(words, estimator):
+    pytest.importorskip("numpy")
+    expected = estimator(nltk.FreqDist(words))
+    pdist = estimator(nltk.CompactFreqDist(words))
+    for sample in ["w1", "w2", "w7", "unseen"]:
+        assert pdist.prob(sample) == pytest.approx(expected.prob(sample))
+    assert pdist.max() == expected.max()
@@ -0,0 +1,157 @@
+"""
+Tests for nltk.tag.perceptron
+"""
+
+import random
+
+import pytest
+
+from nltk.tag.perceptron import MappedWeights, PerceptronTagger
+
+np = pytest.importorskip("numpy")
+
+LEXICON = {
+    "DT": ["the", "a", "every", "this"],
+    "JJ": ["big", "red", "lazy", "quick", "old"],
+    "NN": ["dog", "cat", "idea", "house", "fox", "run"],
+    "VBZ": ["runs", "sees", "likes", "jumps"],
+    "IN": ["over", "under", "near", "with"],
+    "CD": ["1999", "42", "7-up"],
+}
+PATTERNS = [
+    ["DT", "JJ", "NN", "VBZ", "IN", "DT", "NN"],
+    ["DT", "NN", "VBZ", "DT", "JJ", "NN"],
+    ["NN", "VBZ", "IN", "CD", "NN"],
+    ["DT", "JJ", "JJ", "NN", "VBZ"],
+]
+
+
+def _make_sentences(n, seed=0):
+    rng = random.Random(seed)
+    sentences = []
+    for _ in range(n):
+        pattern = rng.choice(PATTERNS)
+        sentences.append([(rng.choice(LEXICON[tag]), tag) for tag in pattern])
+    return sentences
+
+
+@pytest.fixture(scope="module")
+def tagger():
+    random.seed(0)
+    tagger = PerceptronTagger(load=False)
+    tagger.train(_make_sentences(200), nr_iter=3)
+    return tagger
+
+
+@pytest.fixture(scope="module")
+def test_sents():
+    sents = [[word for word, _ in sent] for sent in _make_sentences(100, seed=1)]
+    # Unseen words, empty sentences and odd lengths exercise the padding
+    sents += [[], ["Zebra", "glorps", "quickly"], ["the"], ["1984", "x-ray"] * 5]
+    return sents
+
+
+def test_tag_sents_matches_tag(tagger, test_sents):
+    expected = [tagger.tag(sent) for sent in test_sents]
+    assert tagger.tag_sents(test_sents) == expected
+    assert tagger.tag_sents(iter(test_sents), batch_size=7) == expected
+    assert tagger.tag_sents(test_sents, use_tagdict=False) == [
+        tagger.tag(sent, use_tagdict=False) for sent in test_sents
+    ]
+
+
+def test_predict_batch_matches_predict(tagger, test_sents):
+    features_list = []
+    for sent in test_sents:
+        context = tagger.START + [tagger.normalize(w) for w in sent] + tagger.END
+        for i, word in enumerate(sent):
+            features_list.append(
+                tagger._get_features(i, word, context, "NN", "-START-")
+            )
+    expected = [tagger.model.predict(features)[0] for features in features_list]
+    assert tagger.model.predict_batch(features_list) == expected
+
+
+def test_compiled_weights_follow_updates(tagger):
+    model = tagger.model
+    features = {"bias": 1, "i word dog": 1}
+    model.predict_batch([features])
+    assert model._compiled is not None
+
+    weights = dict(model.weights)
+    try:
+        model.weights = dict(weights)
+        model.weights["i word dog"] = {"JJ": 1000.0}
+        model.update("JJ", "NN", features)
+        assert model._compiled is None
+        assert model.predict_batch([features]) == ["JJ"]
+    finally:
+        model.weights = weights
+        model._compiled = None
+
+
+def test_parallel_training(tmp_path):
+    train = _make_sentences(300)
+    random.seed(0)
+    tagger = PerceptronTagger(load=False)
+    save_loc = tmp_path / "model.pickle"
+    tagger.train(train, save_loc=str(save_loc), nr_iter=3, processes=2)
+    assert tagger.accuracy(_make_sentences(50, seed=2)) > 0.95
+
+    loaded = PerceptronTagger(load=False)
+    loaded.load("file:" + str(save_loc))
+    assert loaded.classes == set(LEXICON)
+    assert loaded.model.weights == tagger.model.weights
+
+
+def test_mmap_roundtrip(tagger, test_sents, tmp_path):
+    path = str(tmp_path / "model.bin")
+    tagger.save_mmap(path, dtype="float64")
+    loaded = PerceptronTagger(load=False)
+    loaded.load_mmap(path)
+
+    assert loaded.tagdict == tagger.tagdict
+    assert loaded.classes == tagger.classes
+    assert dict(loaded.model.weights) == tagger.model.weights
+    expected = [tagger.tag(sent) for sent in test_sents]
+    assert [loaded.tag(sent) for sent in test_sents] == expected
+    assert loaded.tag_sents(test_sents) == expected
+
+
+def test_mmap_float32(tagger, test_sents, tmp_path):
+    path = str(tmp_path / "model.bin")
+    tagger.model.save_mmap(path)
+    model = PerceptronTagger(load=False).model
+    assert model.load_mmap(path)["dtype"] == "<f4"
+    assert model._compiled[1].dtype == "float32"
+    assert set(model.weights) == set(tagger.model.weights)
+    assert model.weights["bias"] == pytest.approx(tagger.model.weights["bias"])
+
+    with open(path, "r+b") as fout:
+        fout.write(b"garbage!")
+    with pytest.raises(ValueError):
+        model.load_mmap(path)
+
+
+def test_mmap_tag(tagger, test_sents, tmp_path, monkeypatch):
+    path = str(tmp_path / "model.bin")
+    tagger.save_mmap(path, dtype="float64")
+    loaded = PerceptronTagger(load=False)
+    loaded.load_mmap(path)
+
+    # The weights stay in the file, and tag() scores them there rather
+    # than decoding them feature by feature through the dict-like view
+    assert isinstance(loaded.model.weights, MappedWeights)
+    assert isinstance(loaded.model._compiled[1], np.memmap)
+
+    def decode(weights, feat):
+        raise AssertionError(f"decoded the weights of {feat!r}")
+
+    monkeypatch.setattr(MappedWeights, "__getitem__", decode)
+    assert [loaded.tag(sent, use_tagdict=False) for sent in test_sents] == [
+        tagger.tag(sent, use_tagdict=False) for sent in test_sents
+    ]
+    assert [loaded.tag(sent, return_conf=True) for sent in test_sents] == [
+        [(word, tag, pytest.approx(conf)) for word, tag, conf in tagged]
+        for tagged in (tagger.tag(sent, return_conf=True) for sent in test_sents)
+    ]
@@ -3,9 +3,12 @@ Tests for nltk.pos_tag
 """
 
 
+import threading
 import unittest
+from unittest import mock
 
-from nltk import pos_tag, word_tokenize
+from nltk import pos_tag, pos_tag_sents, word_tokenize
+from nltk.tag import evict_tagger, warm_up_tagger
 
 
 class TestPosTag(unittest.TestCase):
@@ -81,3 +84,53 @@ class TestPosTag(unittest.TestCase):
         text = "모르겠 습니 다"
         expected_but_wrong = [("모르겠", "JJ"), ("습니", "NNP"), ("다", "NN")]
         assert pos_tag(word_tokenize(text)) == expected_but_wrong
+
+
+class TestTaggerRegistry(unittest.TestCase):
+    def setUp(self):
+        evict_tagger()
+        patcher = mock.patch("nltk.tag._load_tagger", side_effect=self._fake_load)
+        self.load = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(evict_tagger)
+
+    @staticmethod
+    def _fake_load(lang):
+        tagger = mock.Mock()
+        tagger.tag.side_effect = lambda tokens: [(t, lang) for t in tokens]
+        return tagger
+
+    def test_tagger_is_loaded_once(self):
+        assert pos_tag(["a", "b"]) == [("a", "eng"), ("b", "eng")]
+        assert pos_tag_sents([["c"], ["d"]]) == [[("c", "eng")], [("d", "eng")]]
+        assert pos_tag(["e"], lang="rus") == [("e", "rus")]
+        assert [call.args for call in self.load.call_args_list] == [
+            ("eng",),
+            ("rus",),
+        ]
+
+    def test_warm_up_and_evict(self):
+        tagger = warm_up_tagger()
+        assert warm_up_tagger("eng") is tagger
+        pos_tag(["a"])
+        assert self.load.call_count == 1
+
+        evict_tagger("rus")
+        assert warm_up_tagger() is tagger
+        evict_tagger("eng")
+        assert warm_up_tagger() is not tagger
+        assert self.load.call_count == 2
+
+    def test_concurrent_first_use(self):
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            pos_tag(["a"])
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert self.load.call_count == 1
@@ -0,0 +1,105 @@
+"""
+Tests for the document-term index of nltk.text.TextCollection
+"""
+
+import random
+from math import log
+
+import pytest
+
+from nltk.text import TextCollection
+
+
+def _texts(n=20, seed=0):
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(30)]
+    return [
+        [rng.choice(vocab[: rng.randint(5, 30)]) for _ in range(rng.randint(1, 50))]
+        for _ in range(n)
+    ]
+
+
+def _scan_tf_idf(texts, term, text):
+    matches = sum(term in other for other in texts)
+    idf = log(len(texts) / matches) if matches else 0.0
+    return text.count(term) / len(text) * idf
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_index_matches_scan(processes):
+    texts = _texts()
+    collection = TextCollection(texts, processes=processes)
+    terms = [f"w{i}" for i in range(32)]
+    for text in texts[:5]:
+        for term in terms:
+            assert collection.tf_idf(term, text) == pytest.approx(
+                _scan_tf_idf(texts, term, text)
+            )
+    # Texts which are not part of the collection are scanned
+    assert collection.tf("w1", ["w1", "x"]) == 0.5
+
+
+def test_tf_idf_matrix():
+    pytest.importorskip("numpy")
+    texts = _texts()
+    collection = TextCollection(texts)
+    terms = ["w3", "w0", "missing", "w3", "w29"]
+    matrix = collection.tf_idf_matrix(terms)
+    assert matrix.shape == (len(texts), len(terms))
+    for i, text in enumerate(texts):
+        for j, term in enumerate(terms):
+            assert matrix[i, j] == pytest.approx(_scan_tf_idf(texts, term, text))
+
+    subset = collection.tf_idf_matrix(terms, texts[3:1:-1])
+    assert subset.tolist() == matrix[[3, 2]].tolist()
+    with pytest.raises(ValueError):
+        collection.tf_idf_matrix(terms, [["w0"]])
+    with pytest.raises(ValueError):
+        TextCollection([]).tf_idf_matrix(terms)
+
+
+def test_add_texts():
+    texts = _texts()
+    collection = TextCollection(texts[:10])
+    collection.idf("w0")
+    collection.vocab()
+    collection.add_texts(texts[10:])
+    assert len(collection) == sum(map(len, texts))
+    assert collection.vocab().N() == len(collection)
+    expected = TextCollection(texts)
+    for term in ["w0", "w7", "w29", "missing"]:
+        assert collection.idf(term) == pytest.approx(expected.idf(term))
+        assert collection.tf_idf(term, texts[15]) == pytest.approx(
+            expected.tf_idf(term, texts[15])
+        )
+
+
+def test_equal_texts():
+    pytest.importorskip("numpy")
+    texts = _texts()
+    collection = TextCollection(texts)
+    copies = [list(text) for text in texts]
+    assert collection.tf("w0", copies[4]) == collection.tf("w0", texts[4])
+    assert collection._row(copies[4]) == texts.index(texts[4])
+    assert (
+        collection.tf_idf_matrix(["w0", "w1"], copies[2:6]).tolist()
+        == collection.tf_idf_matrix(["w0", "w1"])[2:6].tolist()
+    )
+
+
+def test_string_texts():
+    collection = TextCollection(["the cat", "a dog"])
+    assert collection.idf("cat") == pytest.approx(log(2))
+    assert collection.tf("cat", "the cat") == pytest.approx(1 / 7)
+    assert collection.idf("a") == 0.0
+
+    # Adding a string text to an indexed collection falls back to scanning
+    indexed = TextCollection([["the", "cat"], ["a", "dog"]])
+    assert indexed.idf("a") == pytest.approx(log(2))
+    indexed.add_texts(["a cat"])
+    assert indexed.idf("a") == pytest.approx(log(3 / 2))
+    assert indexed.idf("cat") == pytest.approx(log(3 / 2))
+
+    pytest.importorskip("numpy")
+    matrix = collection.tf_idf_matrix(["cat", "a"])
+    assert matrix.tolist() == [[pytest.approx(log(2) / 7), 0.0], [0.0, 0.0]]
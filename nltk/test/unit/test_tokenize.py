@@ -2,6 +2,8 @@
 Unit tests for nltk.tokenize.
 See also nltk/test/tokenize.doctest
 """
+import pickle
+import random
 from typing import List, Tuple
 
 import pytest
@@ -14,6 +16,7 @@ from nltk.tokenize import (
     TweetTokenizer,
     punkt,
     sent_tokenize,
+    tokenize_stream,
     word_tokenize,
 )
 from nltk.tokenize.simple import CharTokenizer
@@ -736,6 +739,22 @@ class TestTokenize:
         expected = ["'", "v", "'", "'re", "'"]
         assert word_tokenize(sentence) == expected
 
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_tokenize_stream(self, processes):
+        """
+        Test that tokenize_stream yields the output of word_tokenize in order
+        """
+        texts = [
+            "The 'v', I've been fooled but I'll seek revenge.",
+            "",
+            "'v' 're'",
+        ] * 7
+        expected = [word_tokenize(text, preserve_line=True) for text in texts]
+        result = tokenize_stream(
+            iter(texts), preserve_line=True, processes=processes, chunksize=3
+        )
+        assert list(result) == expected
+
     def test_punkt_pair_iter(self):
         test_cases = [
             ("12", [("1", "2"), ("2", None)]),
@@ -795,6 +814,50 @@ class TestTokenize:
 
         assert obj.tokenize(sentences) == expected
 
+    def test_punkt_span_tokenize_many(self):
+        train_text = (
+            "Dr. Watson met Mr. Holmes at 221b Baker St. in London. "
+            "They talked about the case, i.e. the murder. It was late. "
+            "J. S. Bach wrote many fugues. The U.S. economy grew 3.5 pct. "
+            "in 1990. "
+        ) * 20
+        tokenizer = punkt.PunktSentenceTokenizer(train_text)
+        texts = [
+            "Mr. Holmes smoked a pipe. Dr. Watson did not!",
+            '(He said "no.") Then he left... and came back?',
+            "",
+            "no break here",
+            "The U.S. economy grew 3.5 pct. in 1990. J. S. Bach died.",
+        ] * 3
+        for realign_boundaries in (True, False):
+            expected = [
+                list(tokenizer.span_tokenize(text, realign_boundaries))
+                for text in texts
+            ]
+            result = tokenizer.span_tokenize_many(
+                texts, realign_boundaries, cache_size=4
+            )
+            assert list(result) == expected
+
+    def test_punkt_span_tokenize_many_features(self, mocker):
+        train_text = (
+            "Dr. Watson met Mr. Holmes at 221b Baker St. in London. "
+            "J. S. Bach wrote many fugues. The U.S. economy grew 3.5 pct. "
+            "in 1990. "
+        ) * 20
+        tokenizer = punkt.PunktSentenceTokenizer(train_text)
+        words = "Mr. Dr. St. J. S. U.S. pct. 3.5 ... Holmes the he Bach ! ? ."
+        words = words.split()
+        rng = random.Random(0)
+        texts = [
+            " ".join(rng.choice(words) for _ in range(rng.randint(0, 30)))
+            for _ in range(200)
+        ]
+        expected = [list(tokenizer.span_tokenize(text)) for text in texts]
+        spy = mocker.spy(tokenizer, "_first_pass_annotation")
+        assert list(tokenizer.span_tokenize_many(texts)) == expected
+        assert spy.call_count == len(words)
+
     @pytest.mark.parametrize(
         "input_text,n_sents,n_splits,lang_vars",
         [
@@ -895,3 +958,71 @@ class TestPunktTrainer:
     def test_punkt_train_no_punc(self) -> None:
         trainer = punkt.PunktTrainer()
         trainer.train("This is a test")
+
+    def _assert_same_params(self, params1, params2) -> None:
+        assert params1.abbrev_types == params2.abbrev_types
+        assert params1.collocations == params2.collocations
+        assert params1.sent_starters == params2.sent_starters
+        assert dict(params1.ortho_context) == dict(params2.ortho_context)
+
+    def test_punkt_train_chunks(self) -> None:
+        chunks = [
+            "Dr. Watson met Mr. Holmes at 221b Baker St. in London.\n\n",
+            "The U.S. economy grew 3.5 pct. in 1990. J. S. Bach died.\n\n",
+            "Mrs. Hudson said no. Mr. Holmes said yes. It was late.\n\n",
+        ] * 10
+
+        # A single chunk is trained on as with train()
+        trainer = punkt.PunktTrainer("".join(chunks))
+        chunked = punkt.PunktTrainer()
+        chunked.train_chunks(["".join(chunks)])
+        self._assert_same_params(chunked.get_params(), trainer.get_params())
+
+        sequential = punkt.PunktTrainer()
+        sequential.train_chunks(chunks)
+        assert {"dr", "mr", "st"} <= sequential.get_params().abbrev_types
+        with pytest.raises(TypeError):
+            sequential.train_chunks(iter(chunks))
+
+    @pytest.mark.parametrize("processes,chunksize", [(2, 1), (3, 4)])
+    def test_punkt_train_chunks_parallel(self, processes, chunksize) -> None:
+        chunks = [
+            "Dr. Watson met Mr. Holmes at 221b Baker St. in London.\n\n",
+            "The U.S. economy grew 3.5 pct. in 1990. J. S. Bach died.\n\n",
+            "Mrs. Hudson said no. Mr. Holmes said yes. It was late.\n\n",
+        ] * 10
+        # Rare abbreviations, which may depend on the orthographic contexts
+        # of other chunks
+        chunks.insert(5, "We met Zorb. , then zorb left. Arrived late, he slept.\n\n")
+        chunks.insert(9, "Then Vex. arrived and vex vex.\n\n")
+
+        sequential = punkt.PunktTrainer()
+        sequential.INCLUDE_ALL_COLLOCS = True
+        sequential.train_chunks(chunks)
+        parallel = punkt.PunktTrainer()
+        parallel.INCLUDE_ALL_COLLOCS = True
+        parallel.train_chunks(chunks, processes=processes, chunksize=chunksize)
+
+        self._assert_same_params(parallel.get_params(), sequential.get_params())
+        assert parallel._type_fdist == sequential._type_fdist
+        assert parallel._collocation_fdist == sequential._collocation_fdist
+        assert parallel._sent_starter_fdist == sequential._sent_starter_fdist
+        assert parallel._sentbreak_count == sequential._sentbreak_count
+        assert {"zorb", "vex"} <= parallel.get_params().abbrev_types
+
+    def test_punkt_trainer_merge(self) -> None:
+        text1 = "Dr. Watson met Mr. Holmes at 221b Baker St. in London. " * 10
+        text2 = "Mrs. Hudson said no. Mr. Holmes said yes. It was late. " * 10
+
+        # Merging a single trainer into an empty one reproduces it
+        trainer = punkt.PunktTrainer(text1)
+        merged = punkt.PunktTrainer()
+        merged.merge(pickle.loads(pickle.dumps(trainer)))
+        self._assert_same_params(merged.get_params(), trainer.get_params())
+
+        # Merging is commutative
+        trainer1, trainer2 = punkt.PunktTrainer(text1), punkt.PunktTrainer(text2)
+        trainer1.merge(punkt.PunktTrainer(text2))
+        trainer2.merge(punkt.PunktTrainer(text1))
+        self._assert_same_params(trainer1.get_params(), trainer2.get_params())
+        assert trainer1._type_fdist == trainer2._type_fdist
@@ -1,6 +1,8 @@
+from itertools import count, islice
+
 import pytest
 
-from nltk.util import everygrams
+from nltk.util import everygrams, parallel_imap
 
 
 @pytest.fixture
@@ -80,3 +82,16 @@ def test_everygrams_pad_left(everygram_input):
     ]
     output = list(everygrams(everygram_input, max_len=3, pad_left=True))
     assert output == expected_output
+
+
+@pytest.mark.parametrize("processes", [1, 3])
+def test_parallel_imap_keeps_order(processes):
+    output = parallel_imap(abs, range(0, -100, -1), processes, chunksize=7)
+    assert list(output) == list(range(100))
+
+
+def test_parallel_imap_is_lazy():
+    # An endless input must not be consumed beyond a bounded read-ahead
+    output = parallel_imap(abs, count(), processes=2, chunksize=5)
+    assert list(islice(output, 12)) == list(range(12))
+    output.close()
@@ -14,10 +14,15 @@ regular expression search over tokenized strings, and
 distributional similarity.
 """
 
+import json
+import os
 import re
 import sys
+import tempfile
 import unicodedata
+from array import array
 from collections import Counter, defaultdict, namedtuple
+from collections.abc import Sequence
 from functools import reduce
 from math import log
 
@@ -28,7 +33,12 @@ from nltk.metrics import BigramAssocMeasures, f_measure
 from nltk.probability import ConditionalFreqDist as CFD
 from nltk.probability import FreqDist
 from nltk.tokenize import sent_tokenize
-from nltk.util import LazyConcatenation, cut_string, tokenwrap
+from nltk.util import LazyConcatenation, cut_string, parallel_imap, tokenwrap
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 ConcordanceLine = namedtuple(
     "ConcordanceLine",
@@ -201,10 +211,7 @@ class ConcordanceIndex:
 
         # Find the instances of the word to create the ConcordanceLine
         concordance_list = []
-        offsets = self.offsets(phrase[0])
-        for i, word in enumerate(phrase[1:]):
-            word_offsets = {offset - i - 1 for offset in self.offsets(word)}
-            offsets = sorted(word_offsets.intersection(offsets))
+        offsets = self._phrase_offsets(phrase)
         if offsets:
             for i in offsets:
                 query_word = " ".join(self._tokens[i : i + len(phrase)])
@@ -231,6 +238,14 @@ class ConcordanceIndex:
                 concordance_list.append(concordance_line)
         return concordance_list
 
+    def _phrase_offsets(self, phrase):
+        """The sorted offsets at which the words of ``phrase`` occur in a row."""
+        offsets = self.offsets(phrase[0])
+        for i, word in enumerate(phrase[1:]):
+            word_offsets = {offset - i - 1 for offset in self.offsets(word)}
+            offsets = sorted(word_offsets.intersection(offsets))
+        return offsets
+
     def print_concordance(self, word, width=80, lines=25):
         """
         Print concordance lines given the query word.
@@ -254,6 +269,251 @@ class ConcordanceIndex:
                 print(concordance_line.line)
 
 
+CONCORDANCE_INDEX_MAGIC = b"NLTKCI\x00\x01"
+
+
+def _align(offset, alignment=64):
+    return -(-offset // alignment) * alignment
+
+
+def _string_table(strings):
+    """Return the byte offsets and the concatenation of the UTF-8 encodings
+    of ``strings``."""
+    encoded = [string.encode("utf8") for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    offsets[1:] = np.cumsum([len(string) for string in encoded])
+    return offsets, np.frombuffer(b"".join(encoded), dtype="u1")
+
+
+class MappedConcordanceIndex(ConcordanceIndex):
+    """
+    A concordance index stored in a file, which is memory-mapped rather
+    than loaded, so that indexes of billions of tokens open instantly and
+    only the parts needed to answer a query are read. The file holds the
+    tokens, as ids of their types, and for each key the sorted offsets at
+    which it occurs. It is written by ``build`` in a single pass over the
+    tokens, which need not fit in memory.
+
+        >>> import os, tempfile
+        >>> from nltk.text import MappedConcordanceIndex
+        >>> tokens = "The cat sat on the mat and the cat slept".split()
+        >>> path = os.path.join(tempfile.mkdtemp(), "index.bin")
+        >>> index = MappedConcordanceIndex.build(tokens, path, key=str.lower)
+        >>> index
+        <MappedConcordanceIndex for 10 tokens (7 types)>
+        >>> index.offsets("the").tolist()
+        [0, 4, 7]
+        >>> [line.offset for line in index.find_concordance(["the", "cat"])]
+        [0, 7]
+        >>> index.find_concordance("slept")[0].left
+        ['The', 'cat', 'sat', 'on', 'the', 'mat', 'and', 'the', 'cat']
+
+    The key function is not saved, and must be given again, with the
+    same behavior, when the index is opened:
+
+        >>> MappedConcordanceIndex(path, key=str.lower).offsets("CAT").tolist()
+        [1, 8]
+
+    :param path: The path of the index file
+    :type path: str
+    :param key: The function that was used to build the index
+    """
+
+    def __init__(self, path, key=lambda x: x):
+        if np is None:
+            raise ImportError("MappedConcordanceIndex requires numpy to be installed.")
+        with open(path, "rb") as fin:
+            if fin.read(len(CONCORDANCE_INDEX_MAGIC)) != CONCORDANCE_INDEX_MAGIC:
+                raise ValueError(f"{path} is not a concordance index")
+            header = json.loads(fin.read(int.from_bytes(fin.read(8), "little")))
+            start = _align(fin.tell())
+        raw = np.memmap(path, dtype="u1", mode="r")
+        for name, (offset, dtype, length) in header["sections"].items():
+            dtype = np.dtype(dtype)
+            begin = start + offset
+            section = raw[begin : begin + length * dtype.itemsize].view(dtype)
+            setattr(self, "_" + name, section)
+        self._key = key
+        self._tokens = _MappedTokens(self)
+
+    @classmethod
+    def build(cls, tokens, path, key=lambda x: x, buffer_size=1000000):
+        """
+        Index ``tokens`` into the file ``path``, and return the index. The
+        tokens are read once, and only ``buffer_size`` of them, the
+        distinct tokens and the keys are kept in memory at a time.
+
+        :param tokens: The document (an iterable of strings) to index
+        :param path: The path of the index file
+        :type path: str
+        :param key: A function that maps each token to a normalized
+            version (a string) that will be used as a key in the index.
+        :param buffer_size: The number of tokens processed at a time
+        :type buffer_size: int
+        :rtype: MappedConcordanceIndex
+        """
+        if np is None:
+            raise ImportError("MappedConcordanceIndex requires numpy to be installed.")
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.TemporaryFile(dir=directory) as token_file:
+            # Write the type id of each token to a temporary file
+            type_ids = {}
+            n_tokens = 0
+            buffer = array("I")
+            for token in tokens:
+                type_id = type_ids.get(token)
+                if type_id is None:
+                    type_id = type_ids[token] = len(type_ids)
+                buffer.append(type_id)
+                if len(buffer) == buffer_size:
+                    token_file.write(np.asarray(buffer, dtype="<u4").tobytes())
+                    n_tokens += len(buffer)
+                    buffer = array("I")
+            token_file.write(np.asarray(buffer, dtype="<u4").tobytes())
+            n_tokens += len(buffer)
+
+            def chunks():
+                token_file.seek(0)
+                while True:
+                    chunk = token_file.read(4 * buffer_size)
+                    if not chunk:
+                        return
+                    yield np.frombuffer(chunk, dtype="<u4")
+
+            types = list(type_ids)
+            type_keys = [key(token) for token in types]
+            keys = sorted(set(type_keys))
+            key_ids = {word: i for i, word in enumerate(keys)}
+            type_key = np.array([key_ids[word] for word in type_keys], dtype=np.int64)
+
+            counts = np.zeros(len(keys), dtype=np.int64)
+            for chunk in chunks():
+                counts += np.bincount(type_key[chunk], minlength=len(keys))
+            indptr = np.zeros(len(keys) + 1, dtype="<u8")
+            indptr[1:] = np.cumsum(counts)
+
+            types_offsets, types_blob = _string_table(types)
+            keys_offsets, keys_blob = _string_table(keys)
+            sections = [
+                ("types_offsets", types_offsets),
+                ("types_blob", types_blob),
+                ("keys_offsets", keys_offsets),
+                ("keys_blob", keys_blob),
+                ("indptr", indptr),
+            ]
+            layout, offset = {}, 0
+            for name, array_ in sections:
+                layout[name] = [offset, array_.dtype.str, len(array_)]
+                offset = _align(offset + array_.nbytes)
+            layout["postings"] = [offset, "<u8", n_tokens]
+            offset = _align(offset + 8 * n_tokens)
+            layout["token_ids"] = [offset, "<u4", n_tokens]
+            header = json.dumps({"sections": layout}).encode("utf8")
+
+            with open(path, "wb") as fout:
+                fout.write(CONCORDANCE_INDEX_MAGIC)
+                fout.write(len(header).to_bytes(8, "little"))
+                fout.write(header)
+                start = _align(fout.tell())
+                for name, array_ in sections:
+                    fout.write(b"\0" * (start + layout[name][0] - fout.tell()))
+                    fout.write(array_.tobytes())
+                fout.truncate(start + offset + 4 * n_tokens)
+
+            if n_tokens:
+                # Fill the postings key by key, chunk by chunk: the tokens
+                # of a chunk with a given key go after those of the
+                # previous chunks, in the order of their offsets
+                raw = np.memmap(path, dtype="u1", mode="r+")
+                begin = start + layout["postings"][0]
+                postings = raw[begin : begin + 8 * n_tokens].view("<u8")
+                begin = start + layout["token_ids"][0]
+                token_ids = raw[begin : begin + 4 * n_tokens].view("<u4")
+                fill = indptr[:-1].astype(np.int64)
+                position = 0
+                for chunk in chunks():
+                    chunk_keys = type_key[chunk]
+                    order = np.argsort(chunk_keys, kind="stable")
+                    sorted_keys = chunk_keys[order]
+                    rank = np.arange(len(chunk)) - np.searchsorted(
+                        sorted_keys, sorted_keys
+                    )
+                    postings[fill[sorted_keys] + rank] = position + order
+                    fill += np.bincount(chunk_keys, minlength=len(keys))
+                    token_ids[position : position + len(chunk)] = chunk
+                    position += len(chunk)
+                raw.flush()
+                del raw, postings, token_ids
+        return cls(path, key)
+
+    def _string(self, offsets, blob, index):
+        return (
+            blob[int(offsets[index]) : int(offsets[index + 1])].tobytes().decode("utf8")
+        )
+
+    def _key_index(self, word):
+        """The index of ``word`` among the sorted keys, or None."""
+        target = word.encode("utf8")
+        offsets, blob = self._keys_offsets, self._keys_blob
+        lo, hi = 0, len(offsets) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if blob[int(offsets[mid]) : int(offsets[mid + 1])].tobytes() < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(offsets) - 1 and self._string(offsets, blob, lo) == word:
+            return lo
+        return None
+
+    def offsets(self, word):
+        """
+        :rtype: numpy.ndarray
+        :return: The sorted offset positions at which the given word
+            occurs, as a read-only array.  If a key function was specified
+            for the index, then given word's key will be looked up.
+        """
+        index = self._key_index(self._key(word))
+        if index is None:
+            return self._postings[:0]
+        return self._postings[int(self._indptr[index]) : int(self._indptr[index + 1])]
+
+    def _phrase_offsets(self, phrase):
+        offsets = self.offsets(phrase[0]).astype(np.int64)
+        for i, word in enumerate(phrase[1:]):
+            word_offsets = self.offsets(word).astype(np.int64) - (i + 1)
+            offsets = np.intersect1d(offsets, word_offsets, assume_unique=True)
+        return offsets.tolist()
+
+    def __repr__(self):
+        return "<%s for %d tokens (%d types)>" % (
+            self.__class__.__name__,
+            len(self._token_ids),
+            len(self._keys_offsets) - 1,
+        )
+
+
+class _MappedTokens(Sequence):
+    """The tokens of a ``MappedConcordanceIndex``, decoded as they are read."""
+
+    def __init__(self, index):
+        self._index = index
+
+    def _type(self, type_id):
+        index = self._index
+        return index._string(index._types_offsets, index._types_blob, type_id)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [
+                self._type(type_id) for type_id in self._index._token_ids[i].tolist()
+            ]
+        return self._type(int(self._index._token_ids[i]))
+
+    def __len__(self):
+        return len(self._index._token_ids)
+
+
 class TokenSearcher:
     """
     A class that makes it easier to use regular expressions to search
@@ -695,6 +955,79 @@ class Text:
         return "<Text: %s>" % self.name
 
 
+def _count_terms(text):
+    """Count the tokens of one text, in a worker of ``TextCollection``."""
+    counts = Counter(text)
+    return list(counts), list(counts.values())
+
+
+class _DocumentTermIndex:
+    """
+    The counts of the terms of each text of a ``TextCollection``, as a
+    sparse document-term matrix: for each text, the sorted ids of its
+    terms and their counts, and for each term the number of texts it
+    occurs in.
+    """
+
+    def __init__(self):
+        self.term_ids = {}
+        self.rows = []
+        self.lengths = []
+        self.df = np.zeros(1024, dtype=np.int64)
+        self._csr = None
+
+    def add(self, terms, counts):
+        term_ids = self.term_ids
+        ids = np.fromiter(
+            (term_ids.setdefault(term, len(term_ids)) for term in terms),
+            dtype=np.int64,
+            count=len(terms),
+        )
+        counts = np.asarray(counts, dtype=np.int64)
+        order = np.argsort(ids)
+        ids, counts = ids[order], counts[order]
+        if len(term_ids) > len(self.df):
+            df = np.zeros(max(len(term_ids), 2 * len(self.df)), dtype=np.int64)
+            df[: len(self.df)] = self.df
+            self.df = df
+        self.df[ids] += 1
+        self.rows.append((ids, counts))
+        self.lengths.append(int(counts.sum()))
+        self._csr = None
+
+    def count(self, row, term):
+        term_id = self.term_ids.get(term)
+        if term_id is None:
+            return 0
+        ids, counts = self.rows[row]
+        i = np.searchsorted(ids, term_id)
+        return int(counts[i]) if i < len(ids) and ids[i] == term_id else 0
+
+    def doc_freq(self, term):
+        term_id = self.term_ids.get(term)
+        return 0 if term_id is None else int(self.df[term_id])
+
+    def csr(self, rows=None):
+        """Return the index pointers, term ids and counts of the given
+        rows, or of all the rows by default."""
+        if rows is not None:
+            return self._stack([self.rows[row] for row in rows])
+        if self._csr is None:
+            self._csr = self._stack(self.rows)
+        return self._csr
+
+    @staticmethod
+    def _stack(rows):
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(ids) for ids, _ in rows])
+        if rows:
+            ids = np.concatenate([ids for ids, _ in rows])
+            counts = np.concatenate([counts for _, counts in rows])
+        else:
+            ids = counts = np.zeros(0, dtype=np.int64)
+        return indptr, ids, counts
+
+
 # Prototype only; this approach will be slow to load
 class TextCollection(Text):
     """A collection of texts, which can be loaded with list of texts, or
@@ -710,30 +1043,119 @@ class TextCollection(Text):
 
     Iterating over a TextCollection produces all the tokens of all the
     texts in order.
+
+    If ``numpy`` is installed, the tokens of each text are counted once,
+    into a sparse document-term index, when ``tf`` or ``idf`` is first
+    called. The texts are counted in ``processes`` worker processes, to
+    which they are sent, so they must then be picklable, e.g. lists of
+    tokens. The index is extended as texts are added with ``add_texts``.
+    Texts given as strings are not indexed, since their terms are matched
+    as substrings: the texts are then scanned as they used to be.
     """
 
-    def __init__(self, source):
+    def __init__(self, source, processes=1):
         if hasattr(source, "words"):  # bridge to the text corpus reader
             source = [source.words(f) for f in source.fileids()]
 
         self._texts = source
         Text.__init__(self, LazyConcatenation(source))
+        self._processes = processes
+        self._index = None
+        self._scanned = False
+        self._rows = defaultdict(list)
+        self._idf_cache = {}
+
+    def _document_index(self):
+        """The document-term index of the texts, built on first use, or
+        None if numpy is not installed or some texts are strings."""
+        if np is None or self._scanned:
+            return None
+        if self._index is None:
+            if any(isinstance(text, str) for text in self._texts):
+                self._scanned = True
+                return None
+            self._index = _DocumentTermIndex()
+            self._index_texts(self._texts)
+        return self._index
+
+    def _index_texts(self, texts):
+        counted = parallel_imap(_count_terms, texts, self._processes, chunksize=1)
+        for text, (terms, counts) in zip(texts, counted):
+            # The rows of the index are the positions of the texts
+            self._rows[len(text)].append(len(self._index.rows))
+            self._index.add(terms, counts)
+
+    def _row(self, text):
+        """The row of ``text`` in the document-term index, i.e. its position
+        in the collection, or None if it is not one of the texts."""
+        if self._document_index() is None:
+            return None
+        rows = self._rows.get(len(text), ())
+        for row in rows:
+            if self._texts[row] is text:
+                return row
+        for row in rows:
+            if self._texts[row] == text:
+                return row
+        return None
+
+    def add_texts(self, texts):
+        """Add texts to the collection, and to its document-term index if
+        it has been built.
+
+        >>> from nltk.text import TextCollection
+        >>> collection = TextCollection([["a", "b"], ["b", "c"]])
+        >>> collection.idf("a") == collection.idf("c")
+        True
+        >>> collection.add_texts([["a"]])
+        >>> collection.idf("a") < collection.idf("c"), len(collection)
+        (True, 5)
+        """
+        texts = list(texts)
+        self._texts = list(self._texts) + texts
+        if isinstance(self.tokens, list):
+            self.tokens.extend(LazyConcatenation(texts))
+        else:
+            self.tokens = LazyConcatenation(self._texts)
+        # Forget what was computed from the previous tokens
+        for name in [
+            "_concordance_index",
+            "_word_context_index",
+            "_vocab",
+            "_token_searcher",
+            "_collocations",
+            "_trigram_model",
+        ]:
+            self.__dict__.pop(name, None)
         self._idf_cache = {}
+        if self._index is not None:
+            if any(isinstance(text, str) for text in texts):
+                self._index = None
+                self._scanned = True
+            else:
+                self._index_texts(texts)
 
     def tf(self, term, text):
         """The frequency of the term in text."""
-        return text.count(term) / len(text)
+        row = self._row(text)
+        if row is None:
+            return text.count(term) / len(text)
+        return self._index.count(row, term) / self._index.lengths[row]
 
     def idf(self, term):
         """The number of texts in the corpus divided by the
         number of texts that the term appears in.
         If a term does not appear in the corpus, 0.0 is returned."""
+        if len(self._texts) == 0:
+            raise ValueError("IDF undefined for empty document collection")
+        index = self._document_index()
+        if index is not None:
+            matches = index.doc_freq(term)
+            return log(len(self._texts) / matches) if matches else 0.0
         # idf values are cached for performance.
         idf = self._idf_cache.get(term)
         if idf is None:
             matches = len([True for text in self._texts if term in text])
-            if len(self._texts) == 0:
-                raise ValueError("IDF undefined for empty document collection")
             idf = log(len(self._texts) / matches) if matches else 0.0
             self._idf_cache[term] = idf
         return idf
@@ -741,6 +1163,70 @@ class TextCollection(Text):
     def tf_idf(self, term, text):
         return self.tf(term, text) * self.idf(term)
 
+    def tf_idf_matrix(self, terms, texts=None):
+        """Return the tf-idf of each of the terms in each of the texts at
+        once, as a matrix with a row per text and a column per term. The
+        texts default to all those of the collection. Requires numpy.
+
+        >>> from nltk.text import TextCollection
+        >>> collection = TextCollection([["a", "b", "b"], ["b", "c"]])
+        >>> collection.tf_idf_matrix(["a", "c", "z"]).round(3).tolist()
+        [[0.231, 0.0, 0.0], [0.0, 0.347, 0.0]]
+
+        :param terms: The terms
+        :type terms: list
+        :param texts: The texts, which must be texts of the collection
+        :type texts: list or None
+        :rtype: numpy.ndarray
+        """
+        if np is None:
+            raise ImportError("tf_idf_matrix requires numpy to be installed.")
+        if len(self._texts) == 0:
+            raise ValueError("IDF undefined for empty document collection")
+        index = self._document_index()
+        if index is None:
+            return np.array(
+                [
+                    [self.tf_idf(term, text) for term in terms]
+                    for text in (self._texts if texts is None else texts)
+                ],
+                dtype=float,
+            ).reshape(-1, len(terms))
+        if texts is None:
+            rows = None
+            lengths = np.array(index.lengths)
+        else:
+            rows = [self._row(text) for text in texts]
+            if None in rows:
+                raise ValueError("tf_idf_matrix only scores texts of the collection")
+            lengths = np.array(index.lengths)[rows]
+
+        # Map the term ids of the index to the columns of the matrix
+        known = [
+            (j, index.term_ids[term])
+            for j, term in enumerate(terms)
+            if term in index.term_ids
+        ]
+        columns = np.array([j for j, _ in known], dtype=int)
+        term_ids = np.array([term_id for _, term_id in known], dtype=int)
+        unique_ids = np.unique(term_ids)
+        column_of = np.full(len(index.term_ids), -1)
+        column_of[unique_ids] = np.arange(len(unique_ids))
+
+        # Gather the counts of the terms in the texts from the index
+        indptr, ids, counts = index.csr(rows)
+        tf = np.zeros((len(lengths), len(unique_ids)))
+        text_of = np.repeat(np.arange(len(lengths)), np.diff(indptr))
+        found = column_of[ids] >= 0
+        tf[text_of[found], column_of[ids[found]]] = counts[found]
+        tf /= np.maximum(lengths, 1)[:, None]
+
+        idf = np.log(len(self._texts) / index.df[unique_ids])
+
+        matrix = np.zeros((len(lengths), len(terms)))
+        matrix[:, columns] = (tf * idf)[:, np.searchsorted(unique_ids, term_ids)]
+        return matrix
+
 
 def demo():
     from nltk.corpus import brown
@@ -778,6 +1264,7 @@ if __name__ == "__main__":
 __all__ = [
     "ContextIndex",
     "ConcordanceIndex",
+    "MappedConcordanceIndex",
     "TokenSearcher",
     "Text",
     "TextCollection",
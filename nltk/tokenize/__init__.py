@@ -60,6 +60,7 @@ For further information, please see Chapter 3 of the NLTK book.
 """
 
 import re
+from functools import lru_cache, partial
 
 from nltk.data import load
 from nltk.tokenize.casual import TweetTokenizer, casual_tokenize
@@ -90,6 +91,16 @@ from nltk.tokenize.texttiling import TextTilingTokenizer
 from nltk.tokenize.toktok import ToktokTokenizer
 from nltk.tokenize.treebank import TreebankWordDetokenizer, TreebankWordTokenizer
 from nltk.tokenize.util import regexp_span_tokenize, string_span_tokenize
+from nltk.util import parallel_imap
+
+
+@lru_cache(maxsize=None)
+def _get_punkt_tokenizer(language="english"):
+    """
+    Return the Punkt sentence tokenizer for *language*, loading it only
+    once per process.
+    """
+    return load(f"tokenizers/punkt/{language}.pickle")
 
 
 # Standard sentence tokenizer.
@@ -103,7 +114,7 @@ def sent_tokenize(text, language="english"):
     :param text: text to split into sentences
     :param language: the model name in the Punkt corpus
     """
-    tokenizer = load(f"tokenizers/punkt/{language}.pickle")
+    tokenizer = _get_punkt_tokenizer(language)
     return tokenizer.tokenize(text)
 
 
@@ -130,3 +141,39 @@ def word_tokenize(text, language="english", preserve_line=False):
     return [
         token for sent in sentences for token in _treebank_word_tokenizer.tokenize(sent)
     ]
+
+
+def tokenize_stream(
+    texts, language="english", preserve_line=False, processes=1, chunksize=1000
+):
+    """
+    Lazily word-tokenize each text of *texts*, yielding the same lists of
+    tokens as ``word_tokenize`` in the same order as the input.
+
+    The texts can be spread over several worker processes, each of which
+    loads the Punkt model only once. Only a bounded number of chunks of
+    texts are read ahead, so *texts* can be e.g. the lines of a file which
+    does not fit in memory.
+
+        >>> from nltk.tokenize import tokenize_stream
+        >>> texts = ["Good muffins cost $3.88 in New York.", "Thanks."]
+        >>> for tokens in tokenize_stream(texts, preserve_line=True, processes=2):
+        ...     print(tokens)
+        ['Good', 'muffins', 'cost', '$', '3.88', 'in', 'New', 'York', '.']
+        ['Thanks', '.']
+
+    :param texts: the texts to split into words
+    :type texts: iter(str)
+    :param language: the model name in the Punkt corpus
+    :type language: str
+    :param preserve_line: A flag to decide whether to sentence tokenize the texts or not.
+    :type preserve_line: bool
+    :param processes: the number of worker processes
+    :type processes: int
+    :param chunksize: the number of texts sent to a worker at once
+    :type chunksize: int
+    :rtype: iter(list(str))
+    """
+    tokenize = partial(word_tokenize, language=language, preserve_line=preserve_line)
+    initializer = None if preserve_line else partial(_get_punkt_tokenizer, language)
+    return parallel_imap(tokenize, texts, processes, chunksize, initializer)
@@ -105,14 +105,28 @@ The algorithm for this tokenizer is described in::
 # TODO: Frequent sentence starters optionally exclude always-capitalised words
 # FIXME: Problem with ending string with e.g. '!!!' -> '!! !'
 
+import copy
 import math
 import re
 import string
 from collections import defaultdict
-from typing import Any, Dict, Iterator, List, Match, Optional, Tuple, Union
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from nltk.probability import FreqDist
 from nltk.tokenize.api import TokenizerI
+from nltk.util import parallel_imap
 
 ######################################################################
 # { Orthographic Context Constants
@@ -526,6 +540,49 @@ class PunktToken:
         return res
 
 
+class _BatchToken:
+    """
+    A token annotated by the first pass, whose type-based features are
+    computed once for all the occurrences of the same token in a batch
+    (see ``PunktSentenceTokenizer.span_tokenize_many``). Only the
+    features used by the second pass are kept.
+    """
+
+    __slots__ = [
+        "tok",
+        "period_final",
+        "type_no_period",
+        "type_no_sentperiod",
+        "first_upper",
+        "first_lower",
+        "is_initial",
+        "ortho_context",
+        "sentbreak",
+        "abbr",
+        "ellipsis",
+    ]
+
+    def __init__(self, aug_tok, ortho_context):
+        self.tok = aug_tok.tok
+        self.period_final = aug_tok.period_final
+        self.type_no_period = aug_tok.type_no_period
+        self.type_no_sentperiod = aug_tok.type_no_sentperiod
+        self.first_upper = aug_tok.first_upper
+        self.first_lower = aug_tok.first_lower
+        self.is_initial = bool(aug_tok.is_initial)
+        self.ortho_context = ortho_context.get(self.type_no_sentperiod, 0)
+        self.sentbreak = aug_tok.sentbreak
+        self.abbr = aug_tok.abbr
+        self.ellipsis = aug_tok.ellipsis
+
+    def copy(self):
+        """Returns a copy of the token, whose annotations can be updated."""
+        new = _BatchToken.__new__(_BatchToken)
+        for slot in self.__slots__:
+            setattr(new, slot, getattr(self, slot))
+        return new
+
+
 ######################################################################
 # { Punkt base class
 ######################################################################
@@ -672,6 +729,10 @@ class PunktTrainer(PunktBaseClass):
         collocations and sentence starters, or whether finalize_training()
         still needs to be called."""
 
+        self._merged = False
+        """A flag as to whether the statistics of other trainers have been
+        merged since the abbreviations were last reclassified."""
+
         if train_text:
             self.train(train_text, verbose, finalize=True)
 
@@ -751,6 +812,7 @@ class PunktTrainer(PunktBaseClass):
 
     def _train_tokens(self, tokens, verbose):
         self._finalized = False
+        self._reclassify_merged(verbose)
 
         # Ensure tokens are a list
         tokens = list(tokens)
@@ -764,19 +826,18 @@ class PunktTrainer(PunktBaseClass):
                 self._num_period_toks += 1
 
         # Look for new abbreviations, and for types that no longer are
-        unique_types = self._unique_types(tokens)
-        for abbr, score, is_add in self._reclassify_abbrev_types(unique_types):
-            if score >= self.ABBREV:
-                if is_add:
-                    self._params.abbrev_types.add(abbr)
-                    if verbose:
-                        print(f"  Abbreviation: [{score:6.4f}] {abbr}")
-            else:
-                if not is_add:
-                    self._params.abbrev_types.remove(abbr)
-                    if verbose:
-                        print(f"  Removed abbreviation: [{score:6.4f}] {abbr}")
+        self._update_abbrev_types(self._unique_types(tokens), verbose)
 
+        rare_abbrevs = self._train_annotations(tokens)
+        self._add_rare_abbrev_types(rare_abbrevs, verbose)
+
+    def _train_annotations(self, tokens):
+        """
+        Annotates the given tokens with the abbreviations known so far, and
+        collects their orthographic contexts, sentence breaks, sentence
+        starters and collocations. Returns the candidate rare abbreviations,
+        see ``_add_rare_abbrev_types``.
+        """
         # Make a preliminary pass through the document, marking likely
         # sentence breaks, abbreviations, and ellipsis tokens.
         tokens = list(self._annotate_first_pass(tokens))
@@ -790,15 +851,16 @@ class PunktTrainer(PunktBaseClass):
 
         # The remaining heuristics relate to pairs of tokens where the first
         # ends in a period.
+        rare_abbrevs = {}
         for aug_tok1, aug_tok2 in _pair_iter(tokens):
             if not aug_tok1.period_final or not aug_tok2:
                 continue
 
-            # Is the first token a rare abbreviation?
-            if self._is_rare_abbrev_type(aug_tok1, aug_tok2):
-                self._params.abbrev_types.add(aug_tok1.type_no_period)
-                if verbose:
-                    print("  Rare Abbrev: %s" % aug_tok1.type)
+            # Could the first token be a rare abbreviation? This depends on
+            # the orthographic contexts of the whole text.
+            candidate = self._rare_abbrev_candidate(aug_tok1, aug_tok2)
+            if candidate:
+                rare_abbrevs.setdefault(candidate, aug_tok1.type)
 
             # Does second token have a high likelihood of starting a sentence?
             if self._is_potential_sent_starter(aug_tok2, aug_tok1):
@@ -810,14 +872,134 @@ class PunktTrainer(PunktBaseClass):
                     (aug_tok1.type_no_period, aug_tok2.type_no_sentperiod)
                 ] += 1
 
+        return rare_abbrevs
+
+    def _update_abbrev_types(self, types, verbose=False):
+        """
+        Add the given types which are now likely abbreviations to
+        ``abbrev_types``, and remove those which no longer are.
+        """
+        for abbr, score, is_add in self._reclassify_abbrev_types(types):
+            if score >= self.ABBREV:
+                if is_add:
+                    self._params.abbrev_types.add(abbr)
+                    if verbose:
+                        print(f"  Abbreviation: [{score:6.4f}] {abbr}")
+            else:
+                if not is_add:
+                    self._params.abbrev_types.remove(abbr)
+                    if verbose:
+                        print(f"  Removed abbreviation: [{score:6.4f}] {abbr}")
+
     def _unique_types(self, tokens):
         return {aug_tok.type for aug_tok in tokens}
 
+    def train_chunks(
+        self, chunks, verbose=False, finalize=True, processes=1, chunksize=1
+    ):
+        """
+        Collects training data from an iterable of texts, e.g. a large
+        corpus read a few paragraphs at a time, such that only one chunk has
+        to be held in memory. Chunks should end at paragraph boundaries.
+
+        The chunks are read twice, so they must be a re-iterable collection,
+        e.g. a list or a corpus view, rather than an iterator. The first pass
+        counts the types of all the chunks, from which the abbreviations are
+        classified as in ``train``. The second pass annotates each chunk with
+        these abbreviations, and counts its orthographic contexts, sentence
+        starters and collocations. With a single chunk, this is the same as
+        ``train``.
+
+        In both passes the chunks are handled independently, so with
+        ``processes > 1`` they are sent to a pool of worker processes, and
+        the counts they return are summed. The result is the same whatever
+        the number of processes.
+
+        A trainer can be pickled between calls, to checkpoint its statistics.
+        """
+        if iter(chunks) is chunks:
+            raise TypeError("train_chunks() reads the chunks twice, not an iterator")
+
+        self._finalized = False
+        self._reclassify_merged(verbose)
+
+        template = self.__class__(lang_vars=self._lang_vars, token_cls=self._Token)
+        # Carry over customization variables set on this instance
+        template.__dict__.update(
+            (name, value) for name, value in vars(self).items() if name.isupper()
+        )
+
+        types = FreqDist()
+        count_types = partial(_count_chunk_types, template)
+        for type_fdist, num_period_toks in parallel_imap(
+            count_types, chunks, processes, chunksize
+        ):
+            types.update(type_fdist)
+            self._num_period_toks += num_period_toks
+        self._type_fdist.update(types)
+
+        # Look for new abbreviations, and for types that no longer are
+        self._update_abbrev_types(types, verbose)
+
+        template._params.abbrev_types = self._params.abbrev_types
+        rare_abbrevs = {}
+        annotate = partial(_annotate_chunk, template)
+        for (
+            ortho_context,
+            sentbreak_count,
+            sent_starter_fdist,
+            collocation_fdist,
+            chunk_rare_abbrevs,
+        ) in parallel_imap(annotate, chunks, processes, chunksize):
+            for typ, flag in ortho_context.items():
+                self._params.add_ortho_context(typ, flag)
+            self._sentbreak_count += sentbreak_count
+            self._sent_starter_fdist.update(sent_starter_fdist)
+            self._collocation_fdist.update(collocation_fdist)
+            for candidate, typ in chunk_rare_abbrevs.items():
+                rare_abbrevs.setdefault(candidate, typ)
+        self._add_rare_abbrev_types(rare_abbrevs, verbose)
+
+        if finalize:
+            self.finalize_training(verbose)
+
+    def merge(self, other, verbose=False):
+        """
+        Adds the statistics gathered by another trainer, e.g. one trained
+        on another part of the corpus in a separate process, to those of this
+        trainer. Call ``finalize_training()`` or ``get_params()`` after
+        merging all the trainers to compute the collocations and sentence
+        starters from the combined statistics.
+        """
+        self._finalized = False
+        self._type_fdist.update(other._type_fdist)
+        self._num_period_toks += other._num_period_toks
+        self._collocation_fdist.update(other._collocation_fdist)
+        self._sent_starter_fdist.update(other._sent_starter_fdist)
+        self._sentbreak_count += other._sentbreak_count
+        for typ, flag in other._params.ortho_context.items():
+            self._params.add_ortho_context(typ, flag)
+        self._params.abbrev_types.update(other._params.abbrev_types)
+        # The abbreviations are reclassified according to the combined
+        # counts once all the trainers are merged, see _reclassify_merged
+        self._merged = True
+
+    def _reclassify_merged(self, verbose=False):
+        """
+        After ``merge``, reclassifies all the types seen so far, such that
+        the abbreviations do not depend on the order of the merges.
+        """
+        if self._merged:
+            types = [typ for typ in self._type_fdist if typ is not None]
+            self._update_abbrev_types(types, verbose)
+            self._merged = False
+
     def finalize_training(self, verbose=False):
         """
         Uses data that has been gathered in training to determine likely
         collocations and sentence starters.
         """
+        self._reclassify_merged(verbose)
         self._params.clear_sent_starters()
         for typ, log_likelihood in self._find_sent_starters():
             self._params.sent_starters.add(typ)
@@ -1023,24 +1205,29 @@ class PunktTrainer(PunktBaseClass):
             sometimes appears with upper case, but never occurs with
             lower case at the beginning of sentences.
         """
+        candidate = self._rare_abbrev_candidate(cur_tok, next_tok)
+        return bool(candidate) and self._is_rare_abbrev_pair(*candidate)
+
+    def _rare_abbrev_candidate(self, cur_tok, next_tok):
+        """
+        Returns the pair of the type of ``cur_tok`` and the type of
+        ``next_tok`` if the orthographic contexts of the latter could make
+        ``cur_tok`` a rare abbreviation, or None for the type of
+        ``next_tok`` if it is a sentence-internal punctuation mark. Returns
+        None if ``cur_tok`` cannot be a rare abbreviation.
+        """
         if cur_tok.abbr or not cur_tok.sentbreak:
-            return False
+            return None
 
         # Find the case-normalized type of the token.  If it's
         # a sentence-final token, strip off the period.
         typ = cur_tok.type_no_sentperiod
 
-        # Proceed only if the type hasn't been categorized as an
-        # abbreviation already, and is sufficiently rare...
-        count = self._type_fdist[typ] + self._type_fdist[typ[:-1]]
-        if typ in self._params.abbrev_types or count >= self.ABBREV_BACKOFF:
-            return False
-
         # Record this token as an abbreviation if the next
         # token is a sentence-internal punctuation mark.
         # [XX] :1 or check the whole thing??
         if next_tok.tok[:1] in self._lang_vars.internal_punctuation:
-            return True
+            return typ, None
 
         # Record this type as an abbreviation if the next
         # token...  (i) starts with a lower case letter,
@@ -1049,12 +1236,41 @@ class PunktTrainer(PunktBaseClass):
         # sentence-internally.
         # [xx] should the check for (ii) be modified??
         if next_tok.first_lower:
-            typ2 = next_tok.type_no_sentperiod
-            typ2ortho_context = self._params.ortho_context[typ2]
-            if (typ2ortho_context & _ORTHO_BEG_UC) and not (
-                typ2ortho_context & _ORTHO_MID_UC
-            ):
-                return True
+            return typ, next_tok.type_no_sentperiod
+
+        return None
+
+    def _is_rare_abbrev_pair(self, typ, typ2):
+        """
+        Checks a candidate rare abbreviation returned by
+        ``_rare_abbrev_candidate`` against the type frequencies and the
+        orthographic contexts gathered so far.
+        """
+        # Proceed only if the type hasn't been categorized as an
+        # abbreviation already, and is sufficiently rare...
+        count = self._type_fdist[typ] + self._type_fdist[typ[:-1]]
+        if typ in self._params.abbrev_types or count >= self.ABBREV_BACKOFF:
+            return False
+
+        if typ2 is None:
+            return True
+
+        typ2ortho_context = self._params.ortho_context[typ2]
+        return bool(typ2ortho_context & _ORTHO_BEG_UC) and not (
+            typ2ortho_context & _ORTHO_MID_UC
+        )
+
+    def _add_rare_abbrev_types(self, candidates, verbose=False):
+        """
+        Adds the rare abbreviations among the given candidates, a mapping
+        from the pairs returned by ``_rare_abbrev_candidate`` to the type of
+        the token with its period.
+        """
+        for (typ, typ2), typ_with_period in candidates.items():
+            if self._is_rare_abbrev_pair(typ, typ2):
+                self._params.abbrev_types.add(typ)
+                if verbose:
+                    print("  Rare Abbrev: %s" % typ_with_period)
 
     # ////////////////////////////////////////////////////////////
     # { Log Likelihoods
@@ -1231,6 +1447,39 @@ class PunktTrainer(PunktBaseClass):
         return sum(1 for aug_tok in tokens if aug_tok.sentbreak)
 
 
+def _count_chunk_types(template, text):
+    """
+    Returns the frequency distribution of the types of ``text``, and its
+    number of tokens ending in a period, using the tokenizer of the trainer
+    ``template``. Used by ``PunktTrainer.train_chunks`` in worker processes.
+    """
+    type_fdist = FreqDist()
+    num_period_toks = 0
+    for aug_tok in template._tokenize_words(text):
+        type_fdist[aug_tok.type] += 1
+        if aug_tok.period_final:
+            num_period_toks += 1
+    return type_fdist, num_period_toks
+
+
+def _annotate_chunk(template, text):
+    """
+    Annotates ``text`` with the abbreviations of the trainer ``template``,
+    and returns its orthographic contexts, number of sentence breaks,
+    sentence starters, collocations and candidate rare abbreviations. Used
+    by ``PunktTrainer.train_chunks`` in worker processes.
+    """
+    trainer = copy.deepcopy(template)
+    rare_abbrevs = trainer._train_annotations(trainer._tokenize_words(text))
+    return (
+        dict(trainer._params.ortho_context),
+        trainer._sentbreak_count,
+        trainer._sent_starter_fdist,
+        trainer._collocation_fdist,
+        rare_abbrevs,
+    )
+
+
 ######################################################################
 # { Punkt Sentence Tokenizer
 ######################################################################
@@ -1328,6 +1577,85 @@ class PunktSentenceTokenizer(PunktBaseClass, TokenizerI):
         for sentence in slices:
             yield (sentence.start, sentence.stop)
 
+    def span_tokenize_many(
+        self,
+        texts: Iterable[str],
+        realign_boundaries: bool = True,
+        cache_size: int = 100000,
+    ) -> Iterator[List[Tuple[int, int]]]:
+        """
+        Given an iterable of texts, generates the list of (start, end) spans
+        of the sentences in each text, exactly as ``span_tokenize`` does.
+
+        Deciding whether a potential sentence break is an actual one only
+        depends on the few tokens around it, and these contexts (e.g.
+        ``"Mr. Smith"``) recur over and over in a collection of texts. The
+        decisions are therefore cached across the texts of a single call,
+        such that the tokens of a recurring context are only built and
+        annotated once. Likewise, the features of each distinct token
+        (its type, case, first pass annotation and orthographic context)
+        are computed once, and shared by all its occurrences in new
+        contexts.
+
+        :param texts: The texts to split into sentences.
+        :param realign_boundaries: Whether to realign the boundaries, as in
+            ``span_tokenize``.
+        :param cache_size: The maximum number of cached decisions. The cache
+            is emptied whenever it grows larger.
+        """
+        cache = {}
+        features = {}
+
+        def contains_sentbreak(context):
+            try:
+                return cache[context]
+            except KeyError:
+                if len(cache) >= cache_size:
+                    cache.clear()
+                    features.clear()
+                found = cache[context] = self._batch_contains_sentbreak(
+                    context, features
+                )
+                return found
+
+        for text in texts:
+            slices = self._slices_from_text(text, contains_sentbreak)
+            if realign_boundaries:
+                slices = self._realign_boundaries(text, slices)
+            yield [(sentence.start, sentence.stop) for sentence in slices]
+
+    def _batch_contains_sentbreak(
+        self, text: str, features: Dict[str, _BatchToken]
+    ) -> bool:
+        """
+        Returns True if the given text includes a sentence break, as
+        ``text_contains_sentbreak`` does, using and filling ``features``,
+        a mapping from each token to its ``_BatchToken``.
+        """
+        tokens = []
+        for line in text.split("\n"):
+            if line.strip():
+                for tok in self._lang_vars.word_tokenize(line):
+                    try:
+                        aug_tok = features[tok]
+                    except KeyError:
+                        aug_tok = self._Token(tok)
+                        self._first_pass_annotation(aug_tok)
+                        aug_tok = features[tok] = _BatchToken(
+                            aug_tok, self._params.ortho_context
+                        )
+                    # The second pass only ever updates tokens ending in
+                    # a period, so the others can be shared.
+                    tokens.append(aug_tok.copy() if aug_tok.period_final else aug_tok)
+
+        found = False  # used to ignore last token
+        for tok in self._annotate_second_pass(tokens):
+            if found:
+                return True
+            if tok.sentbreak:
+                found = True
+        return False
+
     def sentences_from_text(
         self, text: str, realign_boundaries: bool = True
     ) -> List[str]:
@@ -1424,10 +1752,16 @@ class PunktSentenceTokenizer(PunktBaseClass, TokenizerI):
                 + previous_match.group("after_tok"),
             )
 
-    def _slices_from_text(self, text: str) -> Iterator[slice]:
+    def _slices_from_text(
+        self,
+        text: str,
+        contains_sentbreak: Optional[Callable[[str], bool]] = None,
+    ) -> Iterator[slice]:
+        if contains_sentbreak is None:
+            contains_sentbreak = self.text_contains_sentbreak
         last_break = 0
         for match, context in self._match_potential_end_contexts(text):
-            if self.text_contains_sentbreak(context):
+            if contains_sentbreak(context):
                 yield slice(last_break, match.end())
                 if match.group("next_tok"):
                     # next sentence starts after whitespace
@@ -1709,7 +2043,10 @@ class PunktSentenceTokenizer(PunktBaseClass, TokenizerI):
         if aug_tok.tok in self.PUNCTUATION:
             return False
 
-        ortho_context = self._params.ortho_context[aug_tok.type_no_sentperiod]
+        if isinstance(aug_tok, _BatchToken):
+            ortho_context = aug_tok.ortho_context
+        else:
+            ortho_context = self._params.ortho_context[aug_tok.type_no_sentperiod]
 
         # If the word is capitalized, occurs at least once with a
         # lower case first letter, and never occurs with an upper case
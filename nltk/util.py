@@ -1252,3 +1252,55 @@ def parallelize_preprocess(func, iterator, processes, progress_bar=False):
     if processes <= 1:
         return map(func, iterator)
     return Parallel(n_jobs=processes)(delayed(func)(line) for line in iterator)
+
+
+def _apply_to_chunk(func, chunk):
+    return [func(item) for item in chunk]
+
+
+def parallel_imap(func, iterable, processes=1, chunksize=1000, initializer=None):
+    """
+    Lazily apply ``func`` to every item of ``iterable``, and yield the
+    results in the same order as the input.
+
+    With ``processes > 1``, the items are sent to a pool of worker processes
+    in chunks of ``chunksize``. At most ``2 * processes`` chunks are in
+    flight at any time, so only a bounded part of the input and output is
+    held in memory, however long ``iterable`` is. ``func`` and
+    ``initializer`` must be picklable, e.g. module-level functions or
+    ``functools.partial`` objects wrapping them.
+
+        >>> from nltk.util import parallel_imap
+        >>> list(parallel_imap(len, ["a", "bb", "ccc"], processes=2, chunksize=2))
+        [1, 2, 3]
+
+    :param func: The function to apply to each item
+    :param iterable: The items, which are only consumed as results are needed
+    :param processes: The number of worker processes
+    :type processes: int
+    :param chunksize: The number of items sent to a worker at once
+    :type chunksize: int
+    :param initializer: If not None, called without arguments when each
+        worker starts, e.g. to load a model once per worker
+    :rtype: iter
+    """
+    if processes <= 1:
+        if initializer is not None:
+            initializer()
+        yield from map(func, iterable)
+        return
+
+    import multiprocessing
+
+    iterator = iter(iterable)
+    pending = deque()
+    with multiprocessing.Pool(processes, initializer) as pool:
+        while True:
+            while len(pending) < 2 * processes:
+                chunk = list(islice(iterator, chunksize))
+                if not chunk:
+                    break
+                pending.append(pool.apply_async(_apply_to_chunk, (func, chunk)))
+            if not pending:
+                break
+            yield from pending.popleft().get()